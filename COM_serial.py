@@ -2,7 +2,6 @@ import serial
 import sys
 import logging
 from rich.console import Console
-from rich.logging import RichHandler
 from rich.prompt import Prompt
 from rich.panel import Panel
 from rich.live import Live
@@ -12,23 +11,38 @@ import csv
 from pathlib import Path
 import time
 import threading
+import weakref
 import serial.tools.list_ports
-from Performance import PerformanceMonitor
+from Performance import PerformanceMonitor, setup_logging
 from calibration_data import handle_calibration  # Add this import
+from robd2_core.scheduler import FixedRateScheduler
 
 # Set up rich console
 console = Console()
 
-# Configure logging with rich handler
-logging.basicConfig(
-    level=logging.DEBUG,
-    format="%(message)s",
-    datefmt="[%X]",
-    handlers=[RichHandler(rich_tracebacks=True)]
-)
-
 log = logging.getLogger("com_serial")
 
+# One lock per open port, shared by the menu commands and the flight data logger
+_port_locks = weakref.WeakKeyDictionary()
+_port_locks_guard = threading.Lock()
+
+def port_lock(ser):
+    """Lock that serializes command/reply exchanges on ``ser``"""
+    with _port_locks_guard:
+        lock = _port_locks.get(ser)
+        if lock is None:
+            lock = _port_locks[ser] = threading.RLock()
+        return lock
+
+def read_reply_line(ser, timeout):
+    """Blocking readline bounded by ``timeout``; restores the port's own timeout afterwards"""
+    previous_timeout = ser.timeout
+    try:
+        ser.timeout = timeout
+        return ser.readline().decode('utf-8').rstrip()
+    finally:
+        ser.timeout = previous_timeout
+
 def create_communication_table():
     """Create a simple log display instead of a table"""
     return []  # We'll use a list to store communications
@@ -139,12 +153,28 @@ def parse_run_all_data(data):
         return None
 
 class DataLogger:
-    def __init__(self, ser, communications):
+    """
+    Fixed-rate GET RUN ALL logger.
+
+    Polls run on monotonic deadlines (``FixedRateScheduler``), so the period
+    does not stretch with processing time. Each poll holds the port lock
+    (shared with ``send_command``) while it waits for its own reply within
+    ``reply_timeout``; late replies to other commands that turn up meanwhile
+    are passed on to the communications feed rather than dropped. Achieved
+    rate, jitter and missed replies are reported when logging stops.
+    """
+
+    def __init__(self, ser, communications, interval=1.0, reply_timeout=None):
         self.ser = ser
         self.communications = communications
         self.logging = False
         self.log_file = None
         self.log_thread = None
+        self.scheduler = FixedRateScheduler(interval)
+        # Leave part of each period free so a slow reply never eats the next deadline
+        self.reply_timeout = reply_timeout if reply_timeout is not None else min(1.0, interval * 0.8)
+        self.samples = 0
+        self.missed_replies = 0
     
     def create_log_file(self, id_number):
         """Create a new log file with ID number and timestamp"""
@@ -180,6 +210,10 @@ class DataLogger:
             return
             
         self.log_file = self.create_log_file(id_number)
+        self.scheduler.reset()
+        self.scheduler.stop_event.clear()
+        self.samples = 0
+        self.missed_replies = 0
         self.logging = True
         self.log_thread = threading.Thread(target=self._logging_loop)
         self.log_thread.daemon = True
@@ -193,46 +227,85 @@ class DataLogger:
             return
             
         self.logging = False
+        self.scheduler.stop()
         if self.log_thread:
             self.log_thread.join()
         console.print("[green]Logging stopped[/green]")
+        report = self.rate_report()
+        console.print(f"[cyan]{report}[/cyan]")
+        self.communications.append(f"{datetime.now().strftime('%H:%M:%S')} - {report}")
+    
+    def stats(self):
+        """Scheduler timing plus reply counts for the current/last logging run"""
+        stats = self.scheduler.stats()
+        stats['samples'] = self.samples
+        stats['missed_replies'] = self.missed_replies
+        return stats
+    
+    def rate_report(self):
+        stats = self.stats()
+        return (
+            f"Logged {stats['samples']} samples at {stats['achieved_hz']:.3f} Hz "
+            f"(target {stats['target_hz']:g} Hz), jitter mean {stats['jitter_mean_ms']:.1f} ms / "
+            f"max {stats['jitter_max_ms']:.1f} ms, {stats['missed']} missed slots, "
+            f"{stats['missed_replies']} missing replies"
+        )
+    
+    def _query_run_all(self):
+        """Send GET RUN ALL and return its parsed reply, or None if none arrives in time"""
+        deadline = time.monotonic() + self.reply_timeout
+        lock = port_lock(self.ser)
+        # A menu command waiting on its reply has the port; skip this slot rather than interleave
+        if not lock.acquire(timeout=self.reply_timeout):
+            return None
+        try:
+            self.ser.write("GET RUN ALL\r\n".encode('utf-8'))
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                # Blocking read: sleeps in the driver until a line arrives or the time is up
+                data = read_reply_line(self.ser, remaining)
+                if not data:
+                    return None
+                parsed_data = parse_run_all_data(data)
+                if parsed_data:
+                    return parsed_data
+                # A late reply to a menu command: show it instead of swallowing it
+                timestamp = datetime.now().strftime("%H:%M:%S")
+                self.communications.append(f"{timestamp} ← {data}")
+                log.debug(f"Forwarded non-RUN ALL line: {data}")
+        finally:
+            lock.release()
     
     def _logging_loop(self):
-        """Main logging loop"""
-        while self.logging:
+        """Main logging loop: one RUN ALL poll per scheduler tick"""
+        while self.logging and self.scheduler.wait():
             try:
-                # Send GET RUN ALL command
-                command = "GET RUN ALL\r\n"
-                self.ser.write(command.encode('utf-8'))
-                
-                # Wait for response
-                if self.ser.in_waiting:
-                    data = self.ser.readline().decode('utf-8').rstrip()
-                    parsed_data = parse_run_all_data(data)
+                parsed_data = self._query_run_all()
+                if parsed_data is None:
+                    self.missed_replies += 1
+                else:
+                    self.samples += 1
+                    # Log to CSV
+                    with open(self.log_file, 'a', newline='') as f:
+                        writer = csv.writer(f)
+                        writer.writerow([
+                            parsed_data["timestamp"],
+                            parsed_data["program"],
+                            parsed_data["current_alt"],
+                            parsed_data["final_alt"],
+                            parsed_data["o2_conc"],
+                            parsed_data["bl_pressure"],
+                            parsed_data["elapsed_time"],
+                            parsed_data["remaining_time"],
+                            parsed_data["spo2"],
+                            parsed_data["pulse"]
+                        ])
                     
-                    if parsed_data:
-                        # Log to CSV
-                        with open(self.log_file, 'a', newline='') as f:
-                            writer = csv.writer(f)
-                            writer.writerow([
-                                parsed_data["timestamp"],
-                                parsed_data["program"],
-                                parsed_data["current_alt"],
-                                parsed_data["final_alt"],
-                                parsed_data["o2_conc"],
-                                parsed_data["bl_pressure"],
-                                parsed_data["elapsed_time"],
-                                parsed_data["remaining_time"],
-                                parsed_data["spo2"],
-                                parsed_data["pulse"]
-                            ])
-                        
-                        # Update the display table
-                        timestamp = datetime.now().strftime("%H:%M:%S")
-                        self.communications.append(f"{timestamp} ← LOGGED SpO2: {parsed_data['spo2']}% | Pulse: {parsed_data['pulse']} | Alt: {parsed_data['current_alt']}ft")
-                
-                # Wait 1 second before next reading
-                time.sleep(1)
+                    # Update the display table
+                    timestamp = datetime.now().strftime("%H:%M:%S")
+                    self.communications.append(f"{timestamp} ← LOGGED SpO2: {parsed_data['spo2']}% | Pulse: {parsed_data['pulse']} | Alt: {parsed_data['current_alt']}ft")
                 
             except Exception as e:
                 log.error(f"Error in logging loop: {e}")
@@ -566,7 +639,7 @@ def handle_system_config(ser, communications):
         if command:
             send_command(ser, command, communications)
 
-def handle_performance_monitoring(ser, communications):
+def handle_performance_monitoring(ser, communications, interpolate_specs=False):
     """Handle performance monitoring menu options"""
     monitor = None
     
@@ -581,7 +654,8 @@ def handle_performance_monitoring(ser, communications):
             
         if choice == '1':
             if not monitor:
-                monitor = PerformanceMonitor(ser)
+                # Share the port lock so a running flight data logger cannot interleave with the monitor
+                monitor = PerformanceMonitor(ser, interpolate_specs=interpolate_specs, lock=port_lock(ser))
             monitor.start_monitoring()
         elif choice == '2':
             if monitor and monitor.monitoring:
@@ -589,28 +663,41 @@ def handle_performance_monitoring(ser, communications):
             else:
                 console.print("[yellow]Monitoring is not running[/yellow]")
 
-def send_command(ser, command, communications):
+def send_command(ser, command, communications, reply_timeout=1.5):
     """Send command and log response without table"""
+    timestamp = datetime.now().strftime("%H:%M:%S")
     try:
-        ser.write(command.encode('utf-8'))
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_message = f"{timestamp} → {command.strip()}"
-        console.print(log_message)
-        log.debug(f"Sent command: {command}")
-        
-        while True:
-            if ser.in_waiting:
-                try:
-                    data = ser.readline().decode('utf-8').rstrip()
-                    timestamp = datetime.now().strftime("%H:%M:%S")
-                    response_message = f"{timestamp} ← {data}"
-                    console.print(response_message)
-                    log.debug(f"Received data: {data}")
+        # Hold the port until the reply is in so a running flight data logger cannot take it
+        with port_lock(ser):
+            ser.write(command.encode('utf-8'))
+            log_message = f"{timestamp} → {command.strip()}"
+            console.print(log_message)
+            log.debug(f"Sent command: {command}")
+            
+            deadline = time.monotonic() + reply_timeout
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    console.print(f"{datetime.now().strftime('%H:%M:%S')} ← [yellow]No response[/yellow]")
+                    log.warning(f"No response to {command.strip()} within {reply_timeout}s")
                     break
+                try:
+                    data = read_reply_line(ser, remaining)
                 except UnicodeDecodeError:
                     log.error("Error decoding received data")
                     console.print(f"{timestamp} ← [red]Decode Error[/red]")
                     break
+                if not data:
+                    continue
+                if "RUN ALL" not in command and parse_run_all_data(data):
+                    # Late reply to a logger poll that already gave up on it
+                    log.debug(f"Skipping late RUN ALL reply: {data}")
+                    continue
+                timestamp = datetime.now().strftime("%H:%M:%S")
+                response_message = f"{timestamp} ← {data}"
+                console.print(response_message)
+                log.debug(f"Received data: {data}")
+                break
     except Exception as e:
         log.error(f"Error sending command: {e}")
         console.print(f"{timestamp} ← [red]Error: {str(e)}[/red]")
@@ -839,7 +926,7 @@ def handle_system_config(ser, communications):
         if command:
             send_command(ser, command, communications)
 
-def handle_performance_monitoring(ser, communications):
+def handle_performance_monitoring(ser, communications, interpolate_specs=False):
     """Handle performance monitoring menu options"""
     monitor = None
     
@@ -854,7 +941,8 @@ def handle_performance_monitoring(ser, communications):
             
         if choice == '1':
             if not monitor:
-                monitor = PerformanceMonitor(ser)
+                # Share the port lock so a running flight data logger cannot interleave with the monitor
+                monitor = PerformanceMonitor(ser, interpolate_specs=interpolate_specs, lock=port_lock(ser))
             monitor.start_monitoring()
         elif choice == '2':
             if monitor and monitor.monitoring:
@@ -900,7 +988,7 @@ def handle_flight_data_logging(ser, communications):
         elif choice == '2':
             data_logger.stop_logging()
 
-def read_from_com(port=None, baudrate=9600, timeout=1):
+def read_from_com(port=None, baudrate=9600, timeout=1, interpolate_specs=False):
     if port is None:
         port = select_com_port()
         
@@ -933,7 +1021,7 @@ def read_from_com(port=None, baudrate=9600, timeout=1):
                 # Handle menu choices
                 menu_handlers = {
                     '1': lambda: handle_calibration(ser),  # O2 Sensor Calibration
-                    '2': lambda: handle_performance_monitoring(ser, communications),  # Performance Monitoring
+                    '2': lambda: handle_performance_monitoring(ser, communications, interpolate_specs),  # Performance Monitoring
                     '3': lambda: handle_flight_data_logging(ser, communications),  # Flight Data Log
                     '4': lambda: handle_operating_commands(ser, communications),
                     '5': lambda: handle_programming_commands(ser, communications),
@@ -987,10 +1075,14 @@ if __name__ == "__main__":
     parser.add_argument('--baudrate', type=int, default=9600, help='Baudrate')
     parser.add_argument('--timeout', type=float, default=1, help='Timeout in seconds')
     parser.add_argument('--debug', action='store_true', help='Enable debug logging')
+    parser.add_argument('--interpolate-specs', action='store_true',
+                        help='Judge O2 against specs interpolated every 50 ft (checks CHG ramps too)')
     
     args = parser.parse_args()
     
+    # Logging is configured by the entry point only, so importing this module leaves it alone
+    setup_logging()
     if not args.debug:
         logging.getLogger("com_serial").setLevel(logging.INFO)
     
-    read_from_com(args.port, args.baudrate, args.timeout)
\ No newline at end of file
+    read_from_com(args.port, args.baudrate, args.timeout, args.interpolate_specs)
\ No newline at end of file
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+log = logging.getLogger("robd2_gui.acquisition")
+
+
+@dataclass
+class WorkerEvent:
+    kind: str
+    payload: Any = None
+    error: Optional[str] = None
+
+
+class AcquisitionWorker:
+    """
+    Background thread that owns request/response device I/O for the GUI.
+
+    Jobs are callables taking the worker; they run one at a time on the
+    worker thread, may block on the serial port (``query``) and report back
+    through ``post``. Everything a job posts, plus its return value, lands
+    in ``events`` -- a thread-safe queue the Tk thread drains on its own
+    UI tick, so widgets are only ever touched from the main loop.
+    Periodic jobs (the dashboard poll) are rescheduled on a fixed cadence
+    between one-off jobs.
+    """
+
+    def __init__(self, serial_comm, events: Optional[queue.Queue] = None, response_poll: float = 0.02):
+        self.serial_comm = serial_comm
+        self.events: queue.Queue = events if events is not None else queue.Queue()
+        self.response_poll = response_poll
+        self._jobs: queue.Queue = queue.Queue()
+        self._periodic: Dict[str, Tuple[float, Callable, float]] = {}
+        self._periodic_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._busy = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ---------- lifecycle ----------
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="acquisition-worker", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        self._stop.set()
+        self._jobs.put(None)
+        if self._thread:
+            self._thread.join(timeout=timeout)
+
+    @property
+    def busy(self) -> bool:
+        """True while a job is talking to the device (other readers should stay off the port)."""
+        return self._busy.is_set()
+
+    # ---------- scheduling (any thread) ----------
+    def submit(self, kind: str, job: Callable[["AcquisitionWorker"], Any]) -> None:
+        """Run ``job`` once; its return value is posted as a ``kind`` event."""
+        self._jobs.put((kind, job))
+
+    def schedule(self, kind: str, interval: float, job: Callable[["AcquisitionWorker"], Any]) -> None:
+        """Run ``job`` now and then every ``interval`` seconds until ``cancel(kind)``."""
+        with self._periodic_lock:
+            self._periodic[kind] = (interval, job, time.monotonic())
+        self._jobs.put(("", None))  # wake the loop
+
+    def cancel(self, kind: str) -> None:
+        with self._periodic_lock:
+            self._periodic.pop(kind, None)
+
+    # ---------- used by jobs (worker thread) ----------
+    def post(self, kind: str, payload: Any = None, error: Optional[str] = None) -> None:
+        self.events.put(WorkerEvent(kind, payload, error))
+
+    def query(self, command: str, timeout: float = 1.0) -> Optional[str]:
+        """Send ``command`` and wait up to ``timeout`` seconds for one response line."""
+        success, message = self.serial_comm.send_command(command)
+        if not success:
+            raise IOError(message)
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and not self._stop.is_set():
+            response = self.serial_comm.get_response()
+            if response:
+                return response
+            time.sleep(self.response_poll)
+        return None
+
+    def query_pipelined(
+        self,
+        commands: Sequence[str],
+        timeout: float = 1.0,
+        window: int = 4,
+        on_reply: Optional[Callable[[int, str], None]] = None,
+    ) -> List[Optional[str]]:
+        """
+        Send ``commands`` with up to ``window`` of them awaiting a reply; match replies in order.
+
+        The device answers in the order it receives commands, so the n-th
+        line read belongs to the n-th command; ``window`` keeps the device's
+        input buffer from overrunning. ``on_reply(index, reply)`` runs as
+        each reply arrives. If no line comes for ``timeout`` seconds the
+        rest are abandoned (left as None) and any late answers discarded.
+        """
+        if window < 1:
+            raise ValueError("window must be >= 1")
+        replies: List[Optional[str]] = [None] * len(commands)
+        sent = received = 0
+        deadline = time.monotonic() + timeout
+        while received < len(commands) and not self._stop.is_set():
+            while sent < len(commands) and sent - received < window:
+                success, message = self.serial_comm.send_command(commands[sent])
+                if not success:
+                    raise IOError(message)
+                sent += 1
+            response = self.serial_comm.get_response()
+            if response:
+                replies[received] = response
+                if on_reply:
+                    on_reply(received, response)
+                received += 1
+                deadline = time.monotonic() + timeout
+            elif time.monotonic() >= deadline:
+                log.warning(
+                    f"No reply to {commands[received]!r} within {timeout:g}s; "
+                    f"abandoning {len(commands) - received} queries"
+                )
+                while self.serial_comm.get_response():
+                    pass
+                break
+            else:
+                time.sleep(self.response_poll)
+        return replies
+
+    def sleep(self, seconds: float) -> bool:
+        """Interruptible sleep for jobs; returns False if the worker is stopping."""
+        return not self._stop.wait(seconds)
+
+    # ---------- draining (Tk thread) ----------
+    def drain(self, max_events: int = 100) -> List[WorkerEvent]:
+        events = []
+        while len(events) < max_events:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                break
+        return events
+
+    # ---------- internal ----------
+    def _next_periodic(self) -> Tuple[Optional[str], float]:
+        """Most overdue periodic job and the seconds until it is due."""
+        with self._periodic_lock:
+            if not self._periodic:
+                return None, 0.5
+            kind, (_, _, due) = min(self._periodic.items(), key=lambda item: item[1][2])
+        return kind, max(0.0, due - time.monotonic())
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            kind, wait = self._next_periodic()
+            try:
+                item = self._jobs.get(timeout=wait) if wait > 0 else self._jobs.get_nowait()
+            except queue.Empty:
+                item = None
+                if kind is not None:
+                    with self._periodic_lock:
+                        entry = self._periodic.get(kind)
+                        if entry:
+                            interval, job, due = entry
+                            # Next run on the fixed cadence, skipping missed slots
+                            now = time.monotonic()
+                            next_due = due + interval
+                            if next_due <= now:
+                                next_due = now + interval
+                            self._periodic[kind] = (interval, job, next_due)
+                    if entry:
+                        self._execute(kind, job)
+                continue
+            if item is None:
+                continue
+            job_kind, job = item
+            if job is not None:
+                self._execute(job_kind, job)
+        # Jobs never run still get their event, so views waiting on one do not hang
+        while True:
+            try:
+                item = self._jobs.get_nowait()
+            except queue.Empty:
+                break
+            if item and item[1] is not None:
+                self.post(item[0], None, "acquisition worker stopped")
+
+    def _execute(self, kind: str, job: Callable[["AcquisitionWorker"], Any]) -> None:
+        self._busy.set()
+        try:
+            result = job(self)
+            self.post(kind, result)
+        except Exception as e:
+            log.error(f"Acquisition job '{kind}' failed: {e}")
+            self.post(kind, None, str(e))
+        finally:
+            self._busy.clear()
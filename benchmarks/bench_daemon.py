@@ -0,0 +1,93 @@
+"""
+Acquisition daemon benchmark: checks the CPU and memory budget in ``robd2_core.daemon``.
+
+Runs ``AcquisitionDaemon`` against ``DemoPort`` twice:
+
+- paced at the default 1 Hz, measuring average process CPU (catches busy loops);
+- unpaced (1 ms interval) for ``SAMPLES`` polls, measuring CPU per sample
+  and traced heap growth between the first and last quarter of the run.
+
+Exits non-zero if any figure is over budget. Run from the repository root:
+
+    python benchmarks/bench_daemon.py [--seconds 10]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from robd2_core.daemon import (  # noqa: E402
+    CPU_BUDGET_MS_PER_SAMPLE,
+    CPU_BUDGET_PERCENT,
+    MEMORY_BUDGET_MB,
+    AcquisitionDaemon,
+    DemoPort,
+)
+
+SAMPLES = 20000
+
+
+def _check(label: str, value: float, budget: float, unit: str) -> bool:
+    ok = value <= budget
+    print(f"{label:<28} {value:10.3f} {unit:<10} budget {budget:g} {unit:<10} {'OK' if ok else 'OVER BUDGET'}")
+    return ok
+
+
+def paced(tmp: Path, seconds: float) -> bool:
+    daemon = AcquisitionDaemon(DemoPort(seed=1), tmp / "paced", interval=1.0, health_interval=2.0)
+    wall, cpu = time.perf_counter(), time.process_time()
+    daemon.run(duration=seconds)
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    stats = daemon.scheduler.stats()
+    print(
+        f"paced 1 Hz: {daemon.samples} samples in {wall:.1f}s, achieved {stats['achieved_hz']:.3f} Hz, "
+        f"jitter mean {stats['jitter_mean_ms']:.2f} ms max {stats['jitter_max_ms']:.2f} ms"
+    )
+    return _check("average CPU", cpu / wall * 100, CPU_BUDGET_PERCENT, "%")
+
+
+def unpaced(tmp: Path) -> bool:
+    daemon = AcquisitionDaemon(DemoPort(seed=2), tmp / "unpaced", interval=0.001, health_interval=60.0)
+    quarter = SAMPLES // 4
+    marks = {}
+    original = daemon.poll_once
+
+    def poll_once():
+        result = original()
+        if daemon.samples == quarter:
+            marks['start'] = tracemalloc.get_traced_memory()[0]
+        elif daemon.samples >= SAMPLES:
+            marks['end'] = tracemalloc.get_traced_memory()[0]
+            daemon.stop()
+        return result
+
+    daemon.poll_once = poll_once
+    tracemalloc.start()
+    cpu = time.process_time()
+    daemon.run()
+    cpu = time.process_time() - cpu
+    tracemalloc.stop()
+    print(f"unpaced: {daemon.samples} samples, {daemon.scheduler.missed} missed slots")
+    ok = _check("CPU per sample", cpu / daemon.samples * 1000, CPU_BUDGET_MS_PER_SAMPLE, "ms")
+    growth_mb = (marks['end'] - marks['start']) / 1e6
+    return _check("heap growth", growth_mb, MEMORY_BUDGET_MB, "MB") and ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--seconds', type=float, default=10.0, help='Length of the paced 1 Hz run')
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        ok = paced(Path(tmp), args.seconds)
+        ok = unpaced(Path(tmp)) and ok
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Performance engine benchmark: a full simulated altitude sweep, then a replay.
+
+Records one run of ``SimulatedSource`` through ``PerformanceEngine`` into a
+batched ``CsvSink``, replays the resulting log through ``ReplaySource``, and
+compares the batched CSV writer with the original open/append-per-row logging.
+Run from the repository root:
+
+    python benchmarks/bench_performance_core.py
+"""
+from __future__ import annotations
+
+import csv
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from robd2_core.o2_specs import O2_SPECS  # noqa: E402
+from robd2_core.performance_core import (  # noqa: E402
+    LOG_HEADERS,
+    CsvSink,
+    MetricsSink,
+    PerformanceEngine,
+    ReplaySource,
+    SimulatedSource,
+    Sink,
+)
+
+DWELL = 60.0
+ROWS = 2000
+
+
+class _AppendPerRowSink(Sink):
+    """Original monitor logging: reopen the CSV for every sample."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        with open(path, 'w', newline='') as f:
+            csv.writer(f).writerow(LOG_HEADERS)
+
+    def on_sample(self, sample):
+        with open(self.path, 'a', newline='') as f:
+            csv.writer(f).writerow(sample['log_row'])
+
+
+def _report(label: str, summary: dict) -> None:
+    print(
+        f"{label:<10} {summary['samples']:6d} samples  {summary['samples_per_second']:10.0f} samples/s  "
+        f"mean {summary['mean_process_ms']:.3f} ms  max {summary['max_process_ms']:.3f} ms  "
+        f"verdicts {summary['verdicts']}  drift events {summary['drift_events']}  "
+        f"settling saved {summary['settling_time_saved']:.0f}s"
+    )
+
+
+def main() -> None:
+    altitudes = [spec.altitude for spec in O2_SPECS] + [0]
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = Path(tmp) / "ROBD2_SIM_20260101_000000.csv"
+
+        metrics = MetricsSink()
+        PerformanceEngine(
+            SimulatedSource(altitudes=altitudes, dwell=DWELL, seed=42),
+            sinks=[metrics, CsvSink(log_path)],
+        ).run()
+        _report("simulated", metrics.summary())
+
+        metrics = MetricsSink()
+        PerformanceEngine(ReplaySource(log_path), sinks=[metrics]).run()
+        _report("replay", metrics.summary())
+
+        row = list(range(len(LOG_HEADERS)))
+        sample = {'log_row': row}
+
+        def write(sink_factory, name):
+            sink = sink_factory(Path(tmp) / name)
+            for _ in range(ROWS):
+                sink.on_sample(sample)
+            sink.on_stop(None)
+
+        per_row = timeit.timeit(lambda: write(_AppendPerRowSink, "per_row.csv"), number=3) / 3
+        batched = timeit.timeit(lambda: write(CsvSink, "batched.csv"), number=3) / 3
+        print(f"\n{ROWS} log rows")
+        print(f"{'open/append per row':<24} {per_row / ROWS * 1e6:8.1f} us / row")
+        print(f"{'batched CsvSink':<24} {batched / ROWS * 1e6:8.1f} us / row")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Dashboard refresh benchmark: 2000 points x 5 series, smoothing window 20.
+
+Compares the original per-point Python window loop with the cumulative-sum
+moving average in ``signal_filters``. Run from the repository root:
+
+    python benchmarks/bench_signal_filters.py
+"""
+from __future__ import annotations
+
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from robd2_core.signal_filters import ema, median_filter, moving_average, resample  # noqa: E402
+
+POINTS = 2000
+SERIES = 5
+WINDOW = 20
+
+
+def _smooth_loop(arr, smoothing):
+    """Original Streamlit dashboard implementation (O(n*w))."""
+    if smoothing <= 1 or len(arr) == 0:
+        return arr
+    out = []
+    for i in range(len(arr)):
+        window = arr[max(0, i - smoothing + 1) : i + 1]
+        out.append(sum(window) / len(window))
+    return out
+
+
+def _report(label: str, seconds: float) -> None:
+    print(f"{label:<34} {seconds * 1e6:10.1f} us / refresh")
+
+
+def main() -> None:
+    rng = np.random.default_rng(42)
+    series_lists = [list(rng.normal(20.0, 1.0, POINTS)) for _ in range(SERIES)]
+    series_arrays = [np.asarray(s) for s in series_lists]
+    times = np.cumsum(rng.uniform(1.5, 2.5, POINTS))
+
+    for ref, new in zip(series_lists, series_arrays):
+        assert np.allclose(_smooth_loop(ref, WINDOW), moving_average(new, WINDOW))
+
+    def run(fn, data, number):
+        return timeit.timeit(lambda: [fn(s) for s in data], number=number) / number
+
+    print(f"{POINTS} points x {SERIES} series, window {WINDOW}")
+    _report("python loop moving average", run(lambda s: _smooth_loop(s, WINDOW), series_lists, 5))
+    _report("cumsum moving average (lists in)", run(lambda s: moving_average(s, WINDOW), series_lists, 200))
+    _report("cumsum moving average (arrays in)", run(lambda s: moving_average(s, WINDOW), series_arrays, 2000))
+    _report("ema (span 20)", run(lambda s: ema(s, span=WINDOW), series_arrays, 500))
+    _report("median filter", run(lambda s: median_filter(s, WINDOW), series_arrays, 50))
+    _report("resample to 2 s grid", run(lambda s: resample(times, s, 2.0), series_arrays, 500))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+Queue-based application logging.
+
+``configure_logging`` installs a single ``QueueHandler`` on the root logger
+and hands records to a background ``QueueListener`` that owns the real
+(file, console, Rich) handlers. A thread that logs only enqueues the
+record, whether it is a serial thread, the acquisition worker or a Tk
+callback. Formatting, repeat filtering and disk and console I/O happen on
+the listener thread, so arguments passed to a log call must not be mutated
+afterwards (the repo's f-string messages are already plain strings).
+
+Two controls keep noisy paths cheap:
+
+- ``RepeatFilter`` lets the first ``burst`` identical records from one call
+  site through per ``window`` seconds. It drops the rest and notes how many
+  were dropped on the next record that gets through.
+- Per-subsystem levels: ``DEFAULT_LEVELS``, overridden by the ``levels``
+  argument and then by ``ROBD2_LOG_LEVELS``, e.g.
+  ``ROBD2_LOG_LEVELS="robd2_core=DEBUG,performance_monitor=WARNING"``.
+  Records below a logger's level are rejected before anything is formatted.
+"""
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Mapping, Optional, Sequence, Union
+
+LevelMap = Mapping[str, Union[int, str]]
+
+DEFAULT_LEVELS: Dict[str, Union[int, str]] = {
+    'robd2_gui': logging.DEBUG,
+    'robd2_core': logging.INFO,
+    'performance_monitor': logging.INFO,
+    'com_serial': logging.INFO,
+    'matplotlib': logging.WARNING,
+    'PIL': logging.WARNING,
+}
+
+LEVELS_ENV = "ROBD2_LOG_LEVELS"
+
+_pipeline: Optional["LoggingPipeline"] = None
+_pipeline_lock = threading.Lock()
+
+
+class RepeatFilter(logging.Filter):
+    """Rate-limit identical messages from the same call site (see module docstring)."""
+
+    def __init__(self, burst: int = 3, window: float = 10.0, max_keys: int = 1000):
+        super().__init__()
+        if burst < 1:
+            raise ValueError("burst must be >= 1")
+        self.burst = burst
+        self.window = window
+        self.max_keys = max_keys
+        self.suppressed = 0
+        self._lock = threading.Lock()
+        # key -> [window start, records seen in window, records dropped in window]
+        self._seen: Dict[tuple, List] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # Keyed on the unformatted message and its arguments, so nothing is formatted here
+        key = (record.name, record.levelno, record.pathname, record.lineno, record.msg, record.args)
+        try:
+            hash(key)
+        except TypeError:
+            return True  # unhashable arguments: let the record through undeduplicated
+        now = time.monotonic()
+        with self._lock:
+            entry = self._seen.get(key)
+            if entry is None or now - entry[0] > self.window:
+                dropped = entry[2] if entry else 0
+                if entry is None and len(self._seen) >= self.max_keys:
+                    self._prune(now)
+                self._seen[key] = [now, 1, 0]
+                if dropped:
+                    record.msg = f"{record.getMessage()} (repeated {dropped} more times)"
+                    record.args = None
+                return True
+            entry[1] += 1
+            if entry[1] <= self.burst:
+                return True
+            entry[2] += 1
+            self.suppressed += 1
+            return False
+
+    def _prune(self, now: float) -> None:
+        expired = [key for key, entry in self._seen.items() if now - entry[0] > self.window]
+        for key in expired:
+            del self._seen[key]
+        if len(self._seen) >= self.max_keys:
+            self._seen.clear()
+
+
+def parse_levels(spec: str) -> Dict[str, str]:
+    """Parse ``"name=LEVEL,name=LEVEL"`` (as in ``ROBD2_LOG_LEVELS``) into a mapping."""
+    levels = {}
+    for item in spec.split(','):
+        name, sep, level = item.partition('=')
+        if sep and name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def apply_levels(levels: Optional[LevelMap] = None) -> Dict[str, Union[int, str]]:
+    """Set per-subsystem logger levels: defaults, then ``levels``, then the environment."""
+    merged: Dict[str, Union[int, str]] = dict(DEFAULT_LEVELS)
+    merged.update(levels or {})
+    merged.update(parse_levels(os.environ.get(LEVELS_ENV, "")))
+    for name, level in merged.items():
+        try:
+            logging.getLogger(name).setLevel(level)
+        except (TypeError, ValueError):
+            logging.getLogger(__name__).warning(f"Ignoring invalid log level {level!r} for {name}")
+    return merged
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """``QueueHandler`` that enqueues the record untouched instead of formatting it first."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _FilteringListener(QueueListener):
+    """``QueueListener`` that runs a ``RepeatFilter`` once per record before its handlers."""
+
+    def __init__(self, queue, *handlers, repeat_filter: RepeatFilter, respect_handler_level: bool = False):
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        self.repeat_filter = repeat_filter
+
+    def handle(self, record: logging.LogRecord) -> None:
+        if self.repeat_filter.filter(record):
+            super().handle(record)
+
+
+class LoggingPipeline:
+    """Root ``QueueHandler`` plus the listener thread that runs the repeat filter and the real handlers."""
+
+    def __init__(
+        self,
+        handlers: Sequence[logging.Handler],
+        root_level: int = logging.DEBUG,
+        repeat_filter: Optional[RepeatFilter] = None,
+    ):
+        self.handlers = list(handlers)
+        self.root_level = root_level
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.queue_handler = _DeferredQueueHandler(self.queue)
+        self.repeat_filter = repeat_filter if repeat_filter is not None else RepeatFilter()
+        self.listener = _FilteringListener(
+            self.queue, *self.handlers, repeat_filter=self.repeat_filter, respect_handler_level=True
+        )
+        self._running = False
+
+    def start(self) -> "LoggingPipeline":
+        root = logging.getLogger()
+        root.setLevel(self.root_level)
+        root.addHandler(self.queue_handler)
+        self.listener.start()
+        self._running = True
+        return self
+
+    def stop(self) -> None:
+        """Flush everything queued so far, then close the real handlers."""
+        if not self._running:
+            return
+        self._running = False
+        logging.getLogger().removeHandler(self.queue_handler)
+        self.listener.stop()
+        for handler in self.handlers:
+            handler.close()
+
+
+def configure_logging(
+    handlers: Sequence[logging.Handler],
+    levels: Optional[LevelMap] = None,
+    root_level: int = logging.DEBUG,
+    fmt: Optional[str] = None,
+    datefmt: Optional[str] = None,
+) -> LoggingPipeline:
+    """
+    Route all logging through a background listener (a drop-in for ``basicConfig``).
+
+    Like ``basicConfig`` this only takes effect once per process: later calls
+    return the running pipeline and leave ``handlers`` unused. ``fmt`` and
+    ``datefmt`` apply to handlers that have no formatter of their own.
+    """
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is not None:
+            return _pipeline
+        if fmt is not None:
+            formatter = logging.Formatter(fmt, datefmt)
+            for handler in handlers:
+                if handler.formatter is None:
+                    handler.setFormatter(formatter)
+        _pipeline = LoggingPipeline(handlers, root_level=root_level).start()
+        apply_levels(levels)
+        atexit.register(_pipeline.stop)
+        return _pipeline
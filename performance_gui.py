@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
+import time
 from datetime import datetime
 from pathlib import Path
 import matplotlib.pyplot as plt
@@ -9,9 +10,18 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import logging
 from performance_monitor import PerformanceMonitor
 from modern_widgets import ModernFrame, ModernButton, ModernLabelFrame
+from plot_renderer import BlitRenderer, RingSeries, coarse_limits
+from ui_bus import RingTextView, UIUpdateBus
 
 log = logging.getLogger(__name__)
 
+# Rolling plot history (samples) and redraw cap
+PLOT_HISTORY = 600
+MAX_PLOT_FPS = 4
+PLOT_X_STEP = 30.0  # seconds; the time axis only moves in these steps
+UI_FPS = 15  # monitor callbacks are applied to the widgets in one batch per frame
+STATUS_LINES = 50
+
 class PerformanceTab(ModernFrame):
     def __init__(self, parent, serial_comm):
         super().__init__(parent)
@@ -20,8 +30,23 @@ class PerformanceTab(ModernFrame):
         self.monitor_thread = None
         self.monitoring_active = False
         
+        # Rolling (time, avg O2, error) history behind the live plots
+        self.plot_history = RingSeries(PLOT_HISTORY, columns=2)
+        self._plot_t0 = None
+        self._plot_altitude = None
+        self._band = None
+        self._pending_spec = None
+        self._redraw_pending = False
+        self._last_redraw = 0.0
+        
         self.create_widgets()
         
+        # Monitor-thread callbacks only queue work; the Tk thread applies it per frame
+        self.ui_bus = UIUpdateBus(self, fps=UI_FPS)
+        self.ui_bus.subscribe('status_lines', self.status_view.extend)
+        self.ui_bus.subscribe('samples', self._apply_samples)
+        self.ui_bus.start()
+        
     def create_widgets(self):
         """Create all widgets for the performance tab"""
         # Device selection
@@ -33,6 +58,14 @@ class PerformanceTab(ModernFrame):
         device_menu = ttk.OptionMenu(device_frame, self.device_var, "9515", "9515", "9516", "9471")
         device_menu.pack(side=tk.LEFT, padx=5)
         
+        # Judge O2 against specs interpolated every 50 ft, so CHG ramps are checked too
+        self.interpolate_specs_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(
+            device_frame,
+            text="Interpolate specs during ramps",
+            variable=self.interpolate_specs_var
+        ).pack(side=tk.LEFT, padx=15)
+        
         # Status indicator
         status_frame = ModernLabelFrame(self, text="Monitoring Status", padding=10)
         status_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -99,9 +132,27 @@ class PerformanceTab(ModernFrame):
         # Create matplotlib figure
         self.fig = Figure(figsize=(8, 6))
         self.ax1 = self.fig.add_subplot(211)  # O2 concentration
-        self.ax2 = self.fig.add_subplot(212)  # Error
+        self.ax2 = self.fig.add_subplot(212, sharex=self.ax1)  # Error
+        
+        # Artists are created once and updated in place
+        self.o2_line, = self.ax1.plot([], [], 'b-', linewidth=2, label='Avg O2 Concentration')
+        self.target_line = self.ax1.axhline(y=0, color='k', linestyle='--', alpha=0.5, label='Target')
+        self.target_line.set_visible(False)
+        self.ax1.set_ylabel('O2 Concentration (%)')
+        self.ax1.set_title('O2 Concentration (%)')
+        self.ax1.grid(True)
+        self.ax1.legend(loc='upper right')
+        
+        self.error_line, = self.ax2.plot([], [], 'r-', linewidth=2, label='Error')
+        self.ax2.axhline(y=0, color='k', linestyle='--', alpha=0.5)
+        self.ax2.set_xlabel('Time (s)')
+        self.ax2.set_ylabel('Error (%)')
+        self.ax2.set_title('Error (%)')
+        self.ax2.grid(True)
+        self.ax2.legend(loc='upper right')
         
         self.canvas = FigureCanvasTkAgg(self.fig, master=results_frame)
+        self.plot_renderer = BlitRenderer(self.canvas, [self.o2_line, self.error_line])
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
@@ -122,6 +173,7 @@ class PerformanceTab(ModernFrame):
         self.status_text = tk.Text(status_text_frame, height=6, wrap=tk.WORD, yscrollcommand=status_scroll.set)
         self.status_text.pack(fill=tk.X, side=tk.LEFT, expand=True)
         status_scroll.config(command=self.status_text.yview)
+        self.status_view = RingTextView(self.status_text, max_lines=STATUS_LINES)
         
         # Instructions
         instructions = """
@@ -132,7 +184,7 @@ Instructions:
    - Monitor O2 concentration, altitude, and sensor voltages (5Hz rate)
    - Calculate comprehensive performance metrics and statistics
    - Save ALL data to timestamped CSV files in /performance_logs/
-   - Handle 25-second stabilization periods after altitude changes
+   - Detect O2 settling after altitude changes (25-second safety cap)
    - Provide IC95 confidence analysis and pass/review status
 4. Real-time displays show:
    - Current O2 levels, errors, and stabilization status
@@ -159,8 +211,7 @@ Instructions:
         if progress is not None:
             self.progress_bar['value'] = progress
         
-        self.status_text.insert(tk.END, f"[{datetime.now().strftime('%H:%M:%S')}] {message}\n")
-        self.status_text.see(tk.END)
+        self.status_view.append(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
         self.update_idletasks()
         
     def update_ui_state(self, monitoring=False):
@@ -198,8 +249,12 @@ Instructions:
             if not device_id:
                 raise ValueError("Please select a device ID")
             
-            # Create monitor instance
-            self.monitor = PerformanceMonitor(self.serial_comm.serial_port)
+            # Create monitor instance and start the plots from an empty history
+            self._reset_plots()
+            self.monitor = PerformanceMonitor(
+                self.serial_comm.serial_port,
+                interpolate_specs=self.interpolate_specs_var.get()
+            )
             self.monitor.set_device_id(device_id)
             
             # Get the log file path for user feedback
@@ -224,7 +279,7 @@ Instructions:
                 f"• Monitor O2 concentrations and sensor voltages\n"
                 f"• Calculate statistical analysis in real-time\n"
                 f"• Track pass/review status for each measurement\n"
-                f"• Handle altitude stabilization periods\n\n"
+                f"• Detect O2 settling after altitude changes\n\n"
                 f"Click 'Stop Monitoring' when complete."
             )
             
@@ -373,16 +428,10 @@ Instructions:
                 self.monitor = None
                 
                 # Clear plots
-                self.ax1.clear()
-                self.ax2.clear()
-                self.ax1.set_title("O2 Concentration (%)")
-                self.ax2.set_title("Error (%)")
-                self.ax1.grid(True)
-                self.ax2.grid(True)
-                self.canvas.draw()
+                self._reset_plots()
                 
                 # Clear status
-                self.status_text.delete(1.0, tk.END)
+                self.status_view.clear()
                 self.update_status("Data cleared", "blue", 0)
                 
                 # Update button states
@@ -395,7 +444,7 @@ Instructions:
                 messagebox.showerror("Error", f"Error clearing data: {str(e)}")
         
     def update_display(self, data):
-        """Update the display with new data"""
+        """Queue a monitor sample for the display (safe to call from the monitor thread)"""
         try:
             # Update status text with enhanced information
             timestamp = datetime.now().strftime("%H:%M:%S")
@@ -413,6 +462,10 @@ Instructions:
                 
                 if data.get('in_stabilization', False):
                     status += " | STABILIZING"
+                elif data.get('verdict'):
+                    status += f" | {data['verdict']} DECIDED - ADVANCE"
+                for event in data.get('drift_events', []):
+                    status += f" | SENSOR {event.kind.upper()}: {event.channel} {event.direction}"
                 
                 status += " | ✓ DATA SAVED\n"
             else:
@@ -424,65 +477,109 @@ Instructions:
                     f"Program: {data['program']} | ✓ DATA SAVED\n"
                 )
             
-            self.status_text.insert(tk.END, status)
-            self.status_text.see(tk.END)
-            
-            # Keep only last 50 lines to prevent memory issues
-            lines = self.status_text.get("1.0", tk.END).split('\n')
-            if len(lines) > 50:
-                self.status_text.delete("1.0", f"{len(lines)-50}.0")
-            
-            # Update progress bar to show monitoring activity
-            import random
-            self.progress_bar['value'] = random.randint(60, 95)
-            
-            # Update plots
-            self.update_plots(data)
-            
-            # Update window title to show active monitoring
-            if hasattr(self, 'winfo_toplevel'):
-                try:
-                    top = self.winfo_toplevel()
-                    if top and hasattr(top, 'title'):
-                        device_id = self.device_var.get()
-                        top.title(f"ROBD2 Diagnostic Interface - Monitoring ROBD2-{device_id}")
-                except:
-                    pass
+            self.ui_bus.append('status_lines', status)
+            self.ui_bus.append('samples', data)
             
         except Exception as e:
             log.error(f"Error updating display: {e}", exc_info=True)
+    
+    def _apply_samples(self, samples):
+        """Tk thread: apply every sample received since the last frame in one pass"""
+        for data in samples:
+            self.update_plots(data)
+        
+        # Update window title to show active monitoring
+        if hasattr(self, 'winfo_toplevel'):
+            try:
+                top = self.winfo_toplevel()
+                if top and hasattr(top, 'title'):
+                    device_id = self.device_var.get()
+                    top.title(f"ROBD2 Diagnostic Interface - Monitoring ROBD2-{device_id}")
+            except:
+                pass
             
     def update_plots(self, data):
-        """Update the matplotlib plots"""
+        """Append the sample to the rolling history and schedule a capped-rate redraw"""
         try:
-            # Clear axes
-            self.ax1.clear()
-            self.ax2.clear()
+            spec = data.get('spec') or self.monitor._get_o2_spec(data['altitude'])
+            if not spec:
+                return
+            # Plot against the acquisition time; the Tk thread may apply a batch of samples at once
+            sampled_at = data['t']
+            if self._plot_t0 is None:
+                self._plot_t0 = sampled_at
+            avg_o2 = data.get('avg_o2', data['o2_conc'])
+            self.plot_history.append(sampled_at - self._plot_t0, avg_o2, avg_o2 - spec.desired_o2)
             
-            # Plot O2 concentration
-            self.ax1.plot(data['o2_conc'], 'b-', linewidth=2, label='O2 Concentration')
-            self.ax1.set_ylabel('O2 Concentration (%)')
-            self.ax1.set_title('O2 Concentration (%)')
-            self.ax1.grid(True)
-            self.ax1.legend()
+            # Spec band, target and title only change with the altitude
+            if data['altitude'] != self._plot_altitude:
+                self._plot_altitude = data['altitude']
+                self._pending_spec = (data['altitude'], spec)
             
-            # Plot error
-            spec = self.monitor._get_o2_spec(data['altitude'])
-            if spec:
-                error = data['o2_conc'] - spec.desired_o2
-                self.ax2.plot(error, 'r-', linewidth=2, label='Error')
-                self.ax2.axhline(y=0, color='k', linestyle='--', alpha=0.5)
-                self.ax2.set_ylabel('Error (%)')
-                self.ax2.set_title(f'Error at {data["altitude"]}ft (Target: {spec.desired_o2:.2f}%)')
-                self.ax2.grid(True)
-                self.ax2.legend()
-                
-                # Add range indicators
-                self.ax2.axhspan(spec.range_min - spec.desired_o2, spec.range_max - spec.desired_o2, 
-                                alpha=0.2, color='green', label='Acceptable Range')
+            self._schedule_redraw()
             
-            # Redraw canvas
-            self.canvas.draw()
+        except Exception as e:
+            log.error(f"Error updating plots: {e}", exc_info=True)
+    
+    def _update_spec_artists(self, altitude, spec):
+        """Move the target line and error band to the new altitude's spec"""
+        if self._band is not None:
+            self._band.remove()
+        self._band = self.ax2.axhspan(
+            spec.range_min - spec.desired_o2, spec.range_max - spec.desired_o2,
+            alpha=0.2, color='green', label='Acceptable Range'
+        )
+        self.target_line.set_ydata([spec.desired_o2, spec.desired_o2])
+        self.target_line.set_visible(True)
+        self.ax2.set_title(f'Error at {altitude}ft (Target: {spec.desired_o2:.2f}%)')
+        self.plot_renderer.invalidate()
+    
+    def _schedule_redraw(self):
+        """Coalesce samples into at most MAX_PLOT_FPS canvas refreshes per second"""
+        if self._redraw_pending:
+            return
+        self._redraw_pending = True
+        delay = max(0.0, self._last_redraw + 1.0 / MAX_PLOT_FPS - time.monotonic())
+        self.after(int(delay * 1000), self._redraw_plots)
+    
+    def _redraw_plots(self):
+        self._redraw_pending = False
+        self._last_redraw = time.monotonic()
+        try:
+            if not len(self.plot_history):
+                return
+            if self._pending_spec:
+                self._update_spec_artists(*self._pending_spec)
+                self._pending_spec = None
+            t, avg_o2, error = self.plot_history.arrays()
+            self.o2_line.set_data(t, avg_o2)
+            self.error_line.set_data(t, error)
+            
+            # Coarse limits keep most frames to a blit of the two lines
+            x_low, x_high = coarse_limits(t[0], t[-1], PLOT_X_STEP)
+            self.plot_renderer.set_limits(self.ax1, xlim=(x_low, max(x_high, x_low + 2 * PLOT_X_STEP)))
+            o2_low = min(avg_o2.min(), self.target_line.get_ydata()[0])
+            o2_high = max(avg_o2.max(), self.target_line.get_ydata()[0])
+            self.plot_renderer.set_limits(self.ax1, ylim=coarse_limits(o2_low - 0.5, o2_high + 0.5, 1.0))
+            error_extent = max(0.5, abs(error).max())
+            self.plot_renderer.set_limits(self.ax2, ylim=coarse_limits(-error_extent, error_extent, 0.5))
+            self.plot_renderer.render()
             
         except Exception as e:
-            log.error(f"Error updating plots: {e}", exc_info=True) 
\ No newline at end of file
+            log.error(f"Error redrawing plots: {e}", exc_info=True)
+    
+    def _reset_plots(self):
+        """Empty the rolling history and plot artists"""
+        self.plot_history.clear()
+        self._plot_t0 = None
+        self._plot_altitude = None
+        self._pending_spec = None
+        if self._band is not None:
+            self._band.remove()
+            self._band = None
+        self.o2_line.set_data([], [])
+        self.error_line.set_data([], [])
+        self.target_line.set_visible(False)
+        self.ax2.set_title('Error (%)')
+        self.plot_renderer.invalidate()
+        self.plot_renderer.render()
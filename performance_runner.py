@@ -0,0 +1,253 @@
+"""
+Unattended ROBD2 performance test.
+
+Drives the altitude sweep over every ``O2_SPECS`` altitude while
+``PerformanceMonitor`` collects data, advancing as soon as the sequential
+test reaches a verdict for the current altitude, then writes a summary
+report next to the performance log.
+
+Two drive modes are supported:
+
+- ``flsim``: enter flight-simulator mode and command each altitude with
+  ``SET FSALT``.
+- ``program``: upload program 20 (reserved for performance testing) with one
+  hold step per altitude, run it and skip ahead with ``RUN NEXT``.
+
+Both modes enter Pilot Test mode with ``RUN READY`` first and leave it with
+``RUN ABORT`` then ``RUN EXIT``. Every PROG/RUN/SET command must be
+acknowledged with ``OK``; a rejected step command ends the sweep with a
+REJECTED step instead of waiting out the step timeout.
+
+Example:
+
+    python performance_runner.py --port COM8 --device 9515 --mode flsim
+"""
+import argparse
+import csv
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import serial
+
+from robd2_core.o2_specs import O2_SPECS
+from performance_monitor import PerformanceMonitor
+from robd2_core.sequential_test import Verdict
+from log_pipeline import configure_logging
+
+log = logging.getLogger("performance_runner")
+
+PERFORMANCE_PROGRAM = 20
+
+# PROG n MODE argument for HRT (hypoxia recognition training) programs
+HRT_MODE = 0
+
+# How often the run loop checks the step timeout when no samples arrive
+TIMEOUT_CHECK_INTERVAL = 1.0
+
+
+class PerformanceRunner:
+    def __init__(
+        self,
+        monitor: PerformanceMonitor,
+        mode: str = "flsim",
+        program_number: int = PERFORMANCE_PROGRAM,
+        step_timeout: float = 180.0,
+    ):
+        if mode not in ("flsim", "program"):
+            raise ValueError("mode must be 'flsim' or 'program'")
+        self.monitor = monitor
+        self.mode = mode
+        self.program_number = program_number
+        self.step_timeout = step_timeout
+        self.altitudes = sorted(spec.altitude for spec in O2_SPECS)
+        self.step_index = 0
+        self.step_started: Optional[float] = None
+        self.step_log: List[Dict] = []
+        self.done = threading.Event()
+        # Serializes step changes between the monitoring thread (callbacks) and the run loop
+        self._step_lock = threading.RLock()
+        self._previous_data_callback = None
+        self._previous_verdict_callback = None
+
+    # ---------- device commands ----------
+    def _send(self, command: str) -> Optional[str]:
+        """Send a command and return the device's reply line (None on timeout)."""
+        return self.monitor.source.send(command)
+
+    def _expect_ok(self, command: str) -> bool:
+        """Send a command that only acknowledges; False (and logged) unless the reply is OK."""
+        response = self._send(command)
+        if response is not None and response.strip().upper() == "OK":
+            return True
+        log.error(f"'{command}' was not acknowledged: {response!r}")
+        return False
+
+    def build_program(self, hold_minutes: float = None) -> List[str]:
+        """Commands that upload a hold step for every O2_SPECS altitude (HRT mode, minutes)."""
+        if hold_minutes is None:
+            hold_minutes = self.step_timeout / 60
+        prog = self.program_number
+        commands = [f"PROG {prog} NAME PERFTEST", f"PROG {prog} MODE {HRT_MODE}"]
+        for step, altitude in enumerate(self.altitudes, start=1):
+            commands.append(f"PROG {prog} {step} HLD {altitude} {hold_minutes:g}")
+        commands.append(f"PROG {prog} {len(self.altitudes) + 1} END")
+        return commands
+
+    def upload_program(self) -> bool:
+        for command in self.build_program():
+            if not self._expect_ok(command):
+                log.error(f"Program upload failed at '{command}'")
+                return False
+        log.info(f"Uploaded performance program {self.program_number} ({len(self.altitudes)} altitudes)")
+        return True
+
+    def _command_step(self):
+        altitude = self.altitudes[self.step_index]
+        self.step_started = time.time()
+        if self.mode == "flsim":
+            command = f"SET FSALT {altitude}"
+        else:
+            # RUN n already started the program on its first step
+            command = "RUN NEXT" if self.step_index > 0 else None
+        if command is not None and not self._expect_ok(command):
+            self._record_step("REJECTED")
+            self.done.set()
+            return
+        log.info(f"Step {self.step_index + 1}/{len(self.altitudes)}: {altitude} ft")
+
+    # ---------- sweep control (monitoring thread and run loop) ----------
+    def _record_step(self, status: str, verdict: Optional[Verdict] = None):
+        self.step_log.append({
+            'altitude': self.altitudes[self.step_index],
+            'status': status,
+            'readings': verdict.readings if verdict else None,
+            'passes': verdict.passes if verdict else None,
+            'duration': time.time() - self.step_started,
+        })
+
+    def _advance(self, status: str, verdict: Optional[Verdict] = None):
+        self._record_step(status, verdict)
+        self.step_index += 1
+        if self.step_index >= len(self.altitudes):
+            self.done.set()
+        else:
+            self._command_step()
+
+    def _on_verdict(self, verdict: Verdict):
+        if self._previous_verdict_callback:
+            self._previous_verdict_callback(verdict)
+        with self._step_lock:
+            if self.done.is_set() or verdict.altitude != self.altitudes[self.step_index]:
+                return
+            self._advance(verdict.status, verdict)
+
+    def _on_data(self, data: Dict):
+        if self._previous_data_callback:
+            self._previous_data_callback(data)
+        self._check_step_timeout()
+
+    def _check_step_timeout(self):
+        """Advance past a step with no verdict in time (also runs when no samples arrive)."""
+        with self._step_lock:
+            if self.done.is_set() or self.step_started is None:
+                return
+            if time.time() - self.step_started >= self.step_timeout:
+                log.warning(f"No verdict at {self.altitudes[self.step_index]} ft within {self.step_timeout:.0f}s")
+                self._advance("TIMEOUT")
+
+    # ---------- run ----------
+    def run(self) -> Path:
+        """Run the full sweep and return the path of the summary report."""
+        if self.mode == "program" and not self.upload_program():
+            raise RuntimeError("Could not upload the performance program")
+
+        self._previous_data_callback = self.monitor.data_callback
+        self._previous_verdict_callback = self.monitor.verdict_callback
+        self.monitor.data_callback = self._on_data
+        self.monitor.verdict_callback = self._on_verdict
+
+        started = time.time()
+        worker = None
+        try:
+            if not self._expect_ok("RUN READY"):
+                raise RuntimeError("The device did not enter Pilot Test mode (RUN READY)")
+            if not self._expect_ok("RUN FLSIM" if self.mode == "flsim" else f"RUN {self.program_number}"):
+                raise RuntimeError("The device did not start the performance sweep")
+            self.step_index = 0
+            self._command_step()
+
+            worker = threading.Thread(target=self.monitor.start_monitoring, daemon=True)
+            worker.start()
+            deadline = started + self.step_timeout * (len(self.altitudes) + 1)
+            while not self.done.wait(timeout=TIMEOUT_CHECK_INTERVAL) and time.time() < deadline:
+                self._check_step_timeout()
+        finally:
+            if worker is not None:
+                self.monitor.stop_monitoring()
+                worker.join(timeout=5)
+            self.monitor.data_callback = self._previous_data_callback
+            self.monitor.verdict_callback = self._previous_verdict_callback
+            # RUN ABORT leaves the program or flight-sim mode, RUN EXIT leaves Pilot Test mode
+            self._expect_ok("RUN ABORT")
+            self._expect_ok("RUN EXIT")
+
+        report = self.write_report(time.time() - started)
+        log.info(f"Performance run finished in {time.time() - started:.0f}s, report: {report}")
+        return report
+
+    def write_report(self, total_seconds: float) -> Path:
+        """Write the per-altitude summary next to the monitor's log file."""
+        log_file = Path(self.monitor.get_log_file_path())
+        report = log_file.with_name(f"{log_file.stem}_report.csv")
+        results = self.monitor.get_altitude_results()
+        overall = "PASS"
+        with open(report, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow([
+                "Altitude (feet)", "Verdict", "Sequential Readings", "Total Readings",
+                "Passes", "Step Duration (s)"
+            ])
+            for step in self.step_log:
+                result = results.get(step['altitude'], {})
+                if step['status'] != "PASS":
+                    overall = "REVIEW"
+                writer.writerow([
+                    step['altitude'],
+                    step['status'],
+                    step['readings'] if step['readings'] is not None else "",
+                    result.get('total_readings', 0),
+                    result.get('passes', 0),
+                    f"{step['duration']:.1f}",
+                ])
+            if len(self.step_log) < len(self.altitudes):
+                overall = "REVIEW"
+            writer.writerow([])
+            writer.writerow(["Overall", overall, "", "", "", f"{total_seconds:.1f}"])
+        return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Unattended ROBD2 performance test')
+    parser.add_argument('--port', default='COM8', help='COM port of the ROBD2')
+    parser.add_argument('--baudrate', type=int, default=9600, help='Baudrate')
+    parser.add_argument('--device', required=True, help='ROBD2 device ID (e.g. 9515)')
+    parser.add_argument('--mode', choices=['flsim', 'program'], default='flsim', help='How to drive the altitude sweep')
+    parser.add_argument('--step-timeout', type=float, default=180.0, help='Maximum seconds per altitude')
+    parser.add_argument('--kalman', action='store_true', help='Use the Kalman-filtered O2 estimate for IC95 verdicts')
+    parser.add_argument('--interpolate-specs', action='store_true',
+                        help='Judge O2 against specs interpolated every 50 ft instead of the table step below')
+    args = parser.parse_args()
+
+    configure_logging(
+        [logging.StreamHandler()],
+        fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    with serial.Serial(args.port, args.baudrate, timeout=1) as ser:
+        monitor = PerformanceMonitor(ser, interpolate_specs=args.interpolate_specs, kalman=args.kalman)
+        monitor.set_device_id(args.device)
+        runner = PerformanceRunner(monitor, mode=args.mode, step_timeout=args.step_timeout)
+        print(f"Report written to {runner.run()}")
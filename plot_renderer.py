@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import math
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+Limits = Tuple[float, float]
+
+
+def coarse_limits(low: float, high: float, step: float) -> Limits:
+    """Widen ``(low, high)`` outward to multiples of ``step`` so small changes keep the same limits."""
+    if step <= 0:
+        return low, high
+    return math.floor(low / step) * step, math.ceil(high / step) * step
+
+
+class RingSeries:
+    """
+    Fixed-size history of ``(time, value, ...)`` rows in preallocated arrays.
+
+    Appends are O(1) and never allocate; ``arrays()`` returns each column
+    oldest-first, ready for ``Line2D.set_data``.
+    """
+
+    def __init__(self, capacity: int, columns: int = 1) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+        self.capacity = capacity
+        self._data = np.full((columns + 1, capacity), np.nan)
+        self._next = 0
+        self._size = 0
+
+    def append(self, t: float, *values: float) -> None:
+        self._data[:, self._next] = (t, *values)
+        self._next = (self._next + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def arrays(self) -> Tuple[np.ndarray, ...]:
+        if self._size < self.capacity:
+            return tuple(self._data[:, :self._size].copy())
+        return tuple(np.roll(self._data, -self._next, axis=1))
+
+    def clear(self) -> None:
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class BlitRenderer:
+    """
+    Blitting renderer for a Matplotlib canvas with a few fast-changing lines.
+
+    The lines are marked animated so a full ``canvas.draw()`` renders only
+    the static parts (axes, grids, ticks, legends); that background is
+    cached on every draw event and each frame then restores it and redraws
+    just the lines. A full redraw happens only when ``set_limits`` is given
+    limits that differ from the current ones, so callers should pass coarse,
+    stepped limits (see ``coarse_limits``). Resizes and toolbar zoom/pan
+    trigger ordinary draws, which refresh the cached background.
+    """
+
+    def __init__(self, canvas, artists: Iterable, smoothing: float = 0.2) -> None:
+        self.canvas = canvas
+        self.figure = canvas.figure
+        self.artists = list(artists)
+        for artist in self.artists:
+            artist.set_animated(True)
+        self._background = None
+        self._dirty = True
+        self._smoothing = smoothing
+        self.frame_ms: Optional[float] = None
+        self.avg_frame_ms: Optional[float] = None
+        self.full_redraws = 0
+        self.blits = 0
+        self._cid = canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _on_draw(self, event) -> None:
+        # Full draws skip animated artists: cache the bare background, then paint the lines on top
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self) -> None:
+        for artist in self.artists:
+            self.figure.draw_artist(artist)
+
+    def set_limits(self, ax, xlim: Optional[Limits] = None, ylim: Optional[Limits] = None) -> bool:
+        """Apply axis limits; returns True (and schedules a full redraw) only when they change."""
+        changed = False
+        if xlim is not None and tuple(ax.get_xlim()) != tuple(xlim):
+            ax.set_xlim(*xlim)
+            changed = True
+        if ylim is not None and tuple(ax.get_ylim()) != tuple(ylim):
+            ax.set_ylim(*ylim)
+            changed = True
+        self._dirty |= changed
+        return changed
+
+    def invalidate(self) -> None:
+        """Force the next frame to be a full redraw (e.g. after changing labels or styles)."""
+        self._dirty = True
+
+    def render(self) -> str:
+        """Draw one frame; returns ``"full"`` or ``"blit"``."""
+        started = time.perf_counter()
+        if self._dirty or self._background is None:
+            self.canvas.draw()
+            self._dirty = False
+            self.full_redraws += 1
+            mode = "full"
+        else:
+            self.canvas.restore_region(self._background)
+            self._draw_artists()
+            self.canvas.blit(self.figure.bbox)
+            self.blits += 1
+            mode = "blit"
+        self._record(time.perf_counter() - started)
+        return mode
+
+    def _record(self, seconds: float) -> None:
+        self.frame_ms = seconds * 1000
+        if self.avg_frame_ms is None:
+            self.avg_frame_ms = self.frame_ms
+        else:
+            self.avg_frame_ms += self._smoothing * (self.frame_ms - self.avg_frame_ms)
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            'frame_ms': self.frame_ms or 0.0,
+            'avg_frame_ms': self.avg_frame_ms or 0.0,
+            'full_redraws': self.full_redraws,
+            'blits': self.blits,
+        }
+
+    def disconnect(self) -> None:
+        self.canvas.mpl_disconnect(self._cid)
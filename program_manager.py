@@ -1,11 +1,26 @@
+import logging
 import tkinter as tk
 from tkinter import ttk, messagebox
 from modern_widgets import ModernFrame, ModernButton, ModernLabelFrame
+from robd2_core.device_state import DeviceStateCache
+
+log = logging.getLogger("robd2_gui.programs")
+
+PROGRAM_SLOTS = range(1, 21)
+
+# PROG i NAME ? queries in flight at once, and how long to wait for each reply
+NAME_QUERY_WINDOW = 4
+NAME_QUERY_TIMEOUT = 1.0
 
 class ProgramManager(ModernFrame):
-    def __init__(self, parent, serial_comm):
+    def __init__(self, parent, serial_comm, acquisition, device_state=None):
         super().__init__(parent)
         self.serial_comm = serial_comm
+        self.acquisition = acquisition
+        self.device_state = device_state if device_state is not None else DeviceStateCache()
+        self._pending_slots = set()
+        # Bumped per fetch so events from an abandoned fetch are ignored
+        self._fetch_id = 0
         self.create_widgets()
 
     def create_widgets(self):
@@ -48,8 +63,8 @@ class ProgramManager(ModernFrame):
         program_list_buttons = ttk.Frame(left_frame)
         program_list_buttons.pack(fill=tk.X, padx=5, pady=5)
         
-        refresh_btn = ModernButton(program_list_buttons, text="Refresh List", command=self.refresh_program_list)
-        refresh_btn.pack(side=tk.LEFT, padx=2)
+        self.refresh_btn = ModernButton(program_list_buttons, text="Refresh List", command=self.refresh_program_list)
+        self.refresh_btn.pack(side=tk.LEFT, padx=2)
         
         create_btn = ModernButton(program_list_buttons, text="New Program", command=self.create_new_program)
         create_btn.pack(side=tk.LEFT, padx=2)
@@ -218,22 +233,85 @@ class ProgramManager(ModernFrame):
 
     def refresh_program_list(self):
         """Refresh the list of programs from the device"""
+        if self._pending_slots:
+            return  # a fetch is already filling the list
+            
         # Clear existing items
         for item in self.program_list.get_children():
             self.program_list.delete(item)
             
         if self.serial_comm.is_connected:
-            # Query each program slot (1-20) for its name
-            for i in range(1, 21):
-                command = f"PROG {i} NAME ?"
-                success, response = self.serial_comm.send_command(command)
-                if success:
-                    self.program_list.insert("", "end", values=(i, response.strip()))
+            # Show last-known names right away; the worker replaces them as replies arrive
+            for i in PROGRAM_SLOTS:
+                name = self.device_state.program_name(i)
+                self.program_list.insert("", "end", iid=str(i), values=(i, name if name is not None else "Loading..."))
+            self._pending_slots = set(PROGRAM_SLOTS)
+            self.refresh_btn.configure(state=tk.DISABLED)
+            self._fetch_id += 1
+            fetch_id = self._fetch_id
+            self.acquisition.submit('program_list', lambda worker: self._fetch_program_names(worker, fetch_id))
         else:
             # Add empty program slots in demo mode
-            for i in range(1, 21):
+            for i in PROGRAM_SLOTS:
                 self.program_list.insert("", "end", values=(i, f"Program {i}"))
 
+    def _fetch_program_names(self, worker, fetch_id):
+        """Worker thread: pipelined PROG i NAME ? for every slot, posting each name as it arrives"""
+        slots = list(PROGRAM_SLOTS)
+
+        def on_reply(index, reply):
+            name = reply.strip()
+            self.device_state.set_program_name(slots[index], name)
+            worker.post('program_name', (fetch_id, slots[index], name))
+
+        try:
+            replies = worker.query_pipelined(
+                [f"PROG {i} NAME ?" for i in slots],
+                timeout=NAME_QUERY_TIMEOUT,
+                window=NAME_QUERY_WINDOW,
+                on_reply=on_reply,
+            )
+        except Exception as e:
+            return fetch_id, None, str(e)
+        return fetch_id, sum(reply is not None for reply in replies), None
+
+    def on_program_name(self, payload, error):
+        """Fill in one program row as its reply arrives (Tk thread)"""
+        if error or not payload:
+            return
+        fetch_id, slot, name = payload
+        if fetch_id != self._fetch_id:
+            return
+        self._pending_slots.discard(slot)
+        if self.program_list.exists(str(slot)):
+            self.program_list.item(str(slot), values=(slot, name))
+
+    def on_program_list_done(self, payload, error):
+        """Program name fetch finished (Tk thread)"""
+        if payload:
+            fetch_id, _, error = payload
+            if fetch_id != self._fetch_id:
+                return  # an abandoned fetch; cancel_program_fetch already reset the list
+        if error:
+            log.warning(f"Program list refresh failed: {error}")
+        elif self._pending_slots:
+            log.warning(f"No name reply for programs {sorted(self._pending_slots)}")
+        self._finish_fetch()
+
+    def cancel_program_fetch(self):
+        """Abandon a running name fetch, e.g. when the connection drops (Tk thread)"""
+        if not self._pending_slots:
+            return
+        self._fetch_id += 1
+        self._finish_fetch()
+
+    def _finish_fetch(self):
+        for slot in self._pending_slots:
+            if self.program_list.exists(str(slot)) and self.device_state.program_name(slot) is None:
+                self.program_list.item(str(slot), values=(slot, "(no reply)"))
+        self._pending_slots = set()
+        self.refresh_btn.configure(state=tk.NORMAL)
+
     def create_new_program(self):
         """Create a new program"""
         # Find first available program number
@@ -303,6 +381,7 @@ class ProgramManager(ModernFrame):
         if self.serial_comm.is_connected:
             success, message = self.serial_comm.send_command(command)
             if success:
+                self.device_state.set_program_name(int(program_number), program_name)
                 messagebox.showinfo("Success", f"Program {program_number} name saved")
                 
                 # Update the treeview
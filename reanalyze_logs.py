@@ -0,0 +1,154 @@
+"""
+Offline re-analysis of historical performance logs.
+
+Loads every ``performance_logs/ROBD2_<device>_<timestamp>.csv`` file,
+recomputes the per-altitude statistics and IC95 verdicts against the current
+``O2_SPECS`` table, and writes a per-run detail table plus a per-device
+summary over time. Each file is processed with vectorized pandas/NumPy and
+files are spread across a process pool.
+
+    python reanalyze_logs.py [--logs performance_logs] [--workers 4]
+"""
+import argparse
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from robd2_core.o2_specs import SPEC_TABLE
+
+LOG_NAME = re.compile(r"ROBD2_(?P<device>[^_]+)_(?P<stamp>\d{8}_\d{6})\.csv$")
+
+SPEC_ALTITUDES = np.array(SPEC_TABLE.altitudes)
+SPEC_DESIRED = np.array([spec.desired_o2 for spec in SPEC_TABLE.specs])
+SPEC_MIN = np.array([spec.range_min for spec in SPEC_TABLE.specs])
+SPEC_MAX = np.array([spec.range_max for spec in SPEC_TABLE.specs])
+
+MIN_PASSES = 3
+
+
+def _ic95_pass(o2: np.ndarray, n: np.ndarray, desired: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """Vectorized ``PerformanceMonitor.calculate_ic95`` (True where the status is PASS)."""
+    error = o2 - desired
+    margin = 1.96 * np.abs(error) / np.sqrt(n)
+    upper = desired + error + margin
+    lower = desired + error - margin
+    in_band = (lo <= upper) & (upper <= hi) & (lo <= lower) & (lower <= hi)
+    return in_band | (np.abs(error) < 1.5)
+
+
+def _drift(values: np.ndarray) -> float:
+    """Mean of the last third minus mean of the first third (same slicing as the monitor)."""
+    n = values.size
+    if n < 3:
+        return 0.0
+    return float(values[-(-n // 3):].mean() - values[: n // 3].mean())
+
+
+def analyze_file(path: Path) -> Optional[pd.DataFrame]:
+    """Per-altitude statistics and verdicts for one performance log (None if unusable)."""
+    match = LOG_NAME.search(path.name)
+    if not match:
+        return None
+    try:
+        df = pd.read_csv(
+            path,
+            usecols=["Altitude (feet)", "Actual O2 %", "IC95% Status"],
+            dtype={"Altitude (feet)": float, "Actual O2 %": float, "IC95% Status": str},
+        )
+    except (ValueError, pd.errors.ParserError, pd.errors.EmptyDataError):
+        return None
+    df = df.dropna(subset=["Altitude (feet)", "Actual O2 %"])
+    if df.empty:
+        return None
+
+    altitude = df["Altitude (feet)"].to_numpy(dtype=int)
+    o2 = df["Actual O2 %"].to_numpy(dtype=float)
+
+    # Readings since the last altitude change, as len(o2_readings) in the live monitor
+    segment = np.cumsum(np.r_[True, altitude[1:] != altitude[:-1]])
+    n = pd.Series(segment).groupby(segment).cumcount().to_numpy() + 1
+
+    # Only exact spec altitudes past stabilization contribute, as in altitude_results
+    spec_idx = np.searchsorted(SPEC_ALTITUDES, altitude)
+    spec_idx = np.minimum(spec_idx, SPEC_ALTITUDES.size - 1)
+    keep = (SPEC_ALTITUDES[spec_idx] == altitude) & (df["IC95% Status"].to_numpy() != "STABILIZING")
+    if not keep.any():
+        return None
+    altitude, o2, n, spec_idx = altitude[keep], o2[keep], n[keep], spec_idx[keep]
+    lo, hi = SPEC_MIN[spec_idx], SPEC_MAX[spec_idx]
+
+    frame = pd.DataFrame({
+        "altitude": altitude,
+        "o2": o2,
+        "passed": _ic95_pass(o2, n, SPEC_DESIRED[spec_idx], lo, hi),
+        "in_band": (lo <= o2) & (o2 <= hi),
+    })
+    grouped = frame.groupby("altitude", sort=True)
+    summary = grouped["o2"].agg(readings="size", mean="mean", median="median", std_dev="std")
+    summary["std_dev"] = summary["std_dev"].fillna(0.0)
+    summary["passes"] = grouped["passed"].sum()
+    summary["stability"] = grouped["in_band"].mean() * 100
+    summary["drift"] = grouped["o2"].apply(lambda s: _drift(s.to_numpy()))
+    summary["cv"] = np.where(summary["mean"] != 0, summary["std_dev"] / summary["mean"] * 100, 0.0)
+    summary["sem"] = np.where(summary["readings"] > 1, summary["std_dev"] / np.sqrt(summary["readings"]), 0.0)
+    spec_rows = np.searchsorted(SPEC_ALTITUDES, summary.index.to_numpy())
+    summary["error"] = summary["mean"] - SPEC_DESIRED[spec_rows]
+    summary["verdict"] = np.where(summary["passes"] >= MIN_PASSES, "PASS", "REVIEW")
+
+    summary = summary.reset_index()
+    summary.insert(0, "run", datetime.strptime(match["stamp"], "%Y%m%d_%H%M%S"))
+    summary.insert(0, "device", match["device"])
+    summary.insert(2, "file", path.name)
+    return summary
+
+
+def reanalyze(log_dir: Path, workers: Optional[int] = None) -> pd.DataFrame:
+    """Re-analyze every log in ``log_dir`` in parallel and return the combined detail table."""
+    files: List[Path] = sorted(p for p in log_dir.glob("ROBD2_*.csv") if LOG_NAME.search(p.name))
+    if not files:
+        return pd.DataFrame()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = [r for r in pool.map(analyze_file, files, chunksize=8) if r is not None]
+    if not results:
+        return pd.DataFrame()
+    return pd.concat(results, ignore_index=True).sort_values(["device", "run", "altitude"])
+
+
+def device_summary(detail: pd.DataFrame) -> pd.DataFrame:
+    """One row per device and run: overall verdict plus the verdict at every altitude."""
+    verdicts = detail.pivot_table(
+        index=["device", "run"], columns="altitude", values="verdict", aggfunc="first"
+    )
+    overall = detail.groupby(["device", "run"])["verdict"].agg(
+        lambda v: "PASS" if (v == "PASS").all() else "REVIEW"
+    )
+    verdicts.insert(0, "overall", overall)
+    verdicts.columns = [str(c) for c in verdicts.columns]
+    return verdicts.reset_index()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Re-analyze ROBD2 performance logs')
+    parser.add_argument('--logs', default='performance_logs', help='Directory with performance CSV logs')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--out', default=None, help='Output directory (default: the logs directory)')
+    args = parser.parse_args()
+
+    log_dir = Path(args.logs)
+    out_dir = Path(args.out) if args.out else log_dir
+    detail = reanalyze(log_dir, args.workers)
+    if detail.empty:
+        print(f"No usable performance logs found in {log_dir}")
+    else:
+        summary = device_summary(detail)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        detail.to_csv(out_dir / "reanalysis_detail.csv", index=False, float_format="%.4f")
+        summary.to_csv(out_dir / "reanalysis_summary.csv", index=False)
+        with pd.option_context("display.width", 200, "display.max_columns", None):
+            print(summary.to_string(index=False))
+        print(f"\n{detail['file'].nunique()} logs re-analyzed -> {out_dir / 'reanalysis_summary.csv'}")
@@ -0,0 +1,74 @@
+"""
+Headless ROBD2 core: transport, parsers, stores, analysis and calculators.
+
+Nothing in this package imports tkinter, rich or matplotlib, and nothing
+configures logging; modules log under ``robd2_core.*`` and the package
+logger only carries a ``NullHandler``, so the application (GUI, CLI or
+service) decides where messages go.
+
+Submodules are imported on first use, so ``import robd2_core`` is cheap and
+a cron job that only needs the spec table never loads pyserial or numpy::
+
+    from robd2_core import O2_SPECS, DataStore
+    from robd2_core.performance_core import PerformanceEngine, SimulatedSource
+
+Modules:
+    - ``serial_comm``: ``SerialCommunicator`` (pyserial transport)
+    - ``parsers``: GET RUN ALL and single-value response parsing
+    - ``acquisition``: multi-rate acquisition plan and ADC cache
+    - ``device_state``: thread-safe cache of last-known device settings
+    - ``data_store``, ``rolling_stats``: bounded sample stores and running statistics
+    - ``o2_specs``, ``settling``, ``sequential_test``, ``o2_estimator``,
+      ``drift_detector``, ``performance_core``: performance-test analysis
+    - ``scheduler``: drift-free fixed-rate loop timing with jitter statistics
+    - ``daemon``: headless acquisition daemon (``robd2_daemon.py``)
+    - ``gas_calculators``: physiological gas calculations
+    - ``signal_filters``: numpy smoothing and resampling helpers
+"""
+from __future__ import annotations
+
+import importlib
+import logging
+
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+# Public name -> submodule that defines it (resolved lazily by __getattr__)
+_EXPORTS = {
+    'SerialCommunicator': 'serial_comm',
+    'parse_run_all': 'parsers',
+    'safe_float': 'parsers',
+    'is_single_float_response': 'parsers',
+    'AcquisitionPlan': 'acquisition',
+    'AdcCache': 'acquisition',
+    'DeviceStateCache': 'device_state',
+    'DataStore': 'data_store',
+    'RollingStats': 'rolling_stats',
+    'StatsAccumulator': 'rolling_stats',
+    'O2_SPECS': 'o2_specs',
+    'SPEC_TABLE': 'o2_specs',
+    'AltitudeSpec': 'o2_specs',
+    'SettlingDetector': 'settling',
+    'SequentialTest': 'sequential_test',
+    'Verdict': 'sequential_test',
+    'O2Estimator': 'o2_estimator',
+    'SensorDriftMonitor': 'drift_detector',
+    'DriftEvent': 'drift_detector',
+    'PerformanceEngine': 'performance_core',
+    'FixedRateScheduler': 'scheduler',
+    'AcquisitionDaemon': 'daemon',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Tuple
+
+
+@dataclass
+class AcquisitionPlan:
+    """
+    Multi-rate polling plan for performance monitoring.
+
+    ``GET RUN ALL`` is polled every ``run_all_interval`` seconds. The slowly
+    varying sensor voltages (``GET ADC <channel>``) are only read every
+    ``adc_interval`` seconds, or immediately after an altitude change when
+    ``adc_on_altitude_change`` is set; in between the last value is carried
+    forward. The plan is rejected if its steady-state command rate would
+    exceed ``max_commands_per_second``.
+    """
+
+    run_all_interval: float = 0.3
+    adc_interval: float = 5.0
+    adc_channels: Tuple[str, ...] = ("1", "12")
+    adc_on_altitude_change: bool = True
+    max_commands_per_second: float = 4.0
+
+    def __post_init__(self):
+        if self.run_all_interval <= 0 or self.adc_interval <= 0:
+            raise ValueError("intervals must be > 0")
+        if self.commands_per_second > self.max_commands_per_second:
+            raise ValueError(
+                f"plan needs {self.commands_per_second:.2f} commands/s, "
+                f"budget is {self.max_commands_per_second:.2f}"
+            )
+
+    @property
+    def commands_per_second(self) -> float:
+        return 1.0 / self.run_all_interval + len(self.adc_channels) / self.adc_interval
+
+
+@dataclass
+class AdcCache:
+    """Latest ADC voltages with the time and altitude they were read at."""
+
+    plan: AcquisitionPlan
+    values: Dict[str, float] = field(default_factory=dict)
+    read_at: Optional[float] = None
+    altitude: Optional[int] = None
+
+    def due(self, altitude: int, now: Optional[float] = None) -> bool:
+        now = time.time() if now is None else now
+        if self.read_at is None or len(self.values) < len(self.plan.adc_channels):
+            return True
+        if self.plan.adc_on_altitude_change and altitude != self.altitude:
+            return True
+        return now - self.read_at >= self.plan.adc_interval
+
+    def refresh(self, altitude: int, read: Callable[[str], Optional[float]], now: Optional[float] = None) -> bool:
+        """Read every channel with ``read``; keeps the old values if any read fails."""
+        values = {}
+        for channel in self.plan.adc_channels:
+            value = read(channel)
+            if value is None:
+                return False
+            values[channel] = value
+        self.values = values
+        self.read_at = time.time() if now is None else now
+        self.altitude = altitude
+        return True
+
+    def age(self, now: Optional[float] = None) -> Optional[float]:
+        if self.read_at is None:
+            return None
+        now = time.time() if now is None else now
+        return now - self.read_at
+
+    def clear(self) -> None:
+        self.values = {}
+        self.read_at = None
+        self.altitude = None
@@ -0,0 +1,307 @@
+"""
+Headless acquisition daemon: poll, log, alarm and report health without a GUI.
+
+``AcquisitionDaemon`` polls GET RUN ALL on a ``FixedRateScheduler`` and
+writes every sample through a batched ``CsvSink``. It checks each sample
+against ``AlarmRule`` thresholds (logged and appended to ``alarms.csv``).
+A watchdog thread rewrites ``health.json`` every ``health_interval``
+seconds and flags a stalled loop. After ``reconnect_after`` consecutive
+failed polls, the loop reopens the port.
+
+Every wait is a blocking sleep: the scheduler waits on an ``Event`` and
+the port reads block in the driver with a timeout. An idle daemon
+therefore costs next to nothing. Budget, verified by
+``benchmarks/bench_daemon.py``:
+
+    - ``CPU_BUDGET_PERCENT``: average process CPU at the default 1 Hz poll
+    - ``CPU_BUDGET_MS_PER_SAMPLE``: CPU per poll, parse, CSV batch and alarm check
+    - ``MEMORY_BUDGET_MB``: Python heap growth over a run. It is constant:
+      no sample history is kept, only the pending CSV batch and rolling
+      scheduler statistics.
+"""
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import math
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from .parsers import RUN_ALL_FIELDS, parse_run_all, safe_float
+from .performance_core import CsvSink
+from .scheduler import FixedRateScheduler
+
+log = logging.getLogger(__name__)
+
+CPU_BUDGET_PERCENT = 1.0
+CPU_BUDGET_MS_PER_SAMPLE = 2.0
+MEMORY_BUDGET_MB = 2.0
+
+# One column per RUN ALL field, in RUN_ALL_FIELDS order
+DAEMON_HEADERS = [
+    "Timestamp", "Program", "Altitude (feet)", "Final Altitude", "O2 %",
+    "BLP (inH2O)", "Elapsed Time", "Remaining Time", "SpO2 %", "Pulse (bpm)",
+]
+
+# RUN ALL fields checked by alarm rules, keyed by the names rules use
+NUMERIC_FIELDS = {
+    'altitude': 'current_alt',
+    'o2_conc': 'o2_conc',
+    'blp': 'bl_pressure',
+    'spo2': 'spo2',
+    'pulse': 'pulse',
+}
+
+
+@dataclass(frozen=True)
+class AlarmRule:
+    name: str
+    field: str
+    low: Optional[float] = None
+    high: Optional[float] = None
+
+    def check(self, value: float) -> Optional[str]:
+        if self.low is not None and value < self.low:
+            return f"{self.name}: {self.field} {value:g} < {self.low:g}"
+        if self.high is not None and value > self.high:
+            return f"{self.name}: {self.field} {value:g} > {self.high:g}"
+        return None
+
+
+DEFAULT_ALARMS = (
+    AlarmRule("Low SpO2", 'spo2', low=80.0),
+    AlarmRule("Pulse out of range", 'pulse', low=40.0, high=180.0),
+    AlarmRule("O2 out of range", 'o2_conc', low=4.0, high=100.0),
+)
+
+
+# ---------- ports ----------
+class SerialPort:
+    """RUN ALL request/response over pyserial with blocking, timeout-bounded reads."""
+
+    def __init__(self, port: str, baudrate: int = 9600, timeout: float = 1.5):
+        self.port = port
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.ser = None
+
+    def open(self) -> None:
+        import serial  # deferred: the package never needs pyserial until a port is opened
+
+        self.close()
+        self.ser = serial.Serial(self.port, self.baudrate, timeout=self.timeout)
+
+    def close(self) -> None:
+        if self.ser is not None:
+            try:
+                self.ser.close()
+            except Exception as e:
+                log.warning(f"Error closing {self.port}: {e}")
+            self.ser = None
+
+    def query(self, command: str) -> Optional[str]:
+        if self.ser is None:
+            self.open()
+        self.ser.reset_input_buffer()
+        self.ser.write(f"{command}\r\n".encode('utf-8'))
+        line = self.ser.readline().decode('utf-8', errors='replace').strip()
+        return line or None
+
+
+class DemoPort:
+    """Synthetic RUN ALL replies (slow altitude profile plus noise) for dry runs and benchmarks."""
+
+    def __init__(self, seed: Optional[int] = None):
+        self._rng = random.Random(seed)
+        self._started = time.monotonic()
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def query(self, command: str) -> Optional[str]:
+        elapsed = time.monotonic() - self._started
+        altitude = 12500 + 12500 * math.sin(elapsed / 300.0)
+        gauss = self._rng.gauss
+        o2 = max(4.0, 20.9 * math.exp(-altitude / 26000.0) + gauss(0, 0.1))
+        spo2 = min(100.0, 98.0 - altitude / 2500.0 + gauss(0, 0.5))
+        pulse = 72.0 + altitude / 2000.0 + gauss(0, 2.0)
+        stamp = datetime.now().strftime("%m-%d-%y %H-%M-%S")
+        return (
+            f"{stamp},20,{altitude:.0f},25000,{o2:.2f},{5 + gauss(0, 0.3):.2f},"
+            f"{elapsed:.0f},0,{spo2:.0f},{pulse:.0f}"
+        )
+
+
+# ---------- daemon ----------
+class AcquisitionDaemon:
+    """Fixed-rate RUN ALL logger with alarms, a health file and a port watchdog (see module docstring)."""
+
+    def __init__(
+        self,
+        port,
+        output_dir: Path,
+        interval: float = 1.0,
+        alarms: Sequence[AlarmRule] = DEFAULT_ALARMS,
+        health_interval: float = 10.0,
+        stale_after: Optional[float] = None,
+        reconnect_after: int = 5,
+    ):
+        self.port = port
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.alarms = list(alarms)
+        self.health_interval = health_interval
+        self.stale_after = stale_after if stale_after is not None else max(5.0, interval * 5)
+        self.reconnect_after = reconnect_after
+        self.scheduler = FixedRateScheduler(interval)
+        self.stop_event = self.scheduler.stop_event
+
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.log_path = self.output_dir / f"ROBD2_daemon_{stamp}.csv"
+        self.alarm_path = self.output_dir / "alarms.csv"
+        self.health_path = self.output_dir / "health.json"
+        self.csv = CsvSink(self.log_path, batch_size=30, flush_interval=10.0, headers=DAEMON_HEADERS)
+
+        self.samples = 0
+        self.failed_polls = 0
+        self.consecutive_failures = 0
+        self.reconnects = 0
+        self.alarm_count = 0
+        self.last_sample: Optional[Dict[str, str]] = None
+        self.last_sample_at: Optional[float] = None
+        self.last_loop_at: Optional[float] = None
+        self.started_at = time.monotonic()
+        self._active_alarms: Dict[str, str] = {}
+        self._watchdog: Optional[threading.Thread] = None
+
+    # ---------- lifecycle ----------
+    def run(self, duration: Optional[float] = None) -> None:
+        """Poll until ``stop()`` (or for ``duration`` seconds); blocks the calling thread."""
+        deadline = None if duration is None else time.monotonic() + duration
+        self._watchdog = threading.Thread(target=self._watchdog_loop, name="daemon-watchdog", daemon=True)
+        self._watchdog.start()
+        log.info(f"Acquisition daemon logging to {self.log_path} every {self.scheduler.interval:g}s")
+        try:
+            while self.scheduler.wait():
+                self.last_loop_at = time.monotonic()
+                self.poll_once()
+                if deadline is not None and self.last_loop_at >= deadline:
+                    break
+        finally:
+            self.stop_event.set()
+            # The watchdog flushes the CSV; it must be gone before the file is closed
+            if self._watchdog:
+                self._watchdog.join(timeout=2.0)
+            self.csv.on_stop(None)
+            self.port.close()
+            self.write_health()
+            log.info(f"Acquisition daemon stopped after {self.samples} samples")
+
+    def stop(self) -> None:
+        self.stop_event.set()
+
+    # ---------- acquisition ----------
+    def poll_once(self) -> bool:
+        try:
+            line = self.port.query("GET RUN ALL")
+        except Exception as e:
+            log.error(f"RUN ALL poll failed: {e}")
+            line = None
+        parsed = parse_run_all(line) if line else None
+        if not parsed:
+            self._poll_failed()
+            return False
+
+        self.consecutive_failures = 0
+        self.samples += 1
+        self.last_sample = parsed
+        self.last_sample_at = time.monotonic()
+        self.csv.on_sample({'log_row': [parsed[field].strip() for field in RUN_ALL_FIELDS]})
+        self._check_alarms(parsed)
+        return True
+
+    def _poll_failed(self) -> None:
+        self.failed_polls += 1
+        self.consecutive_failures += 1
+        if self.consecutive_failures % self.reconnect_after == 0:
+            log.warning(f"{self.consecutive_failures} failed polls in a row; reopening port")
+            try:
+                self.port.open()
+                self.reconnects += 1
+            except Exception as e:
+                log.error(f"Reopening port failed: {e}")
+
+    def _check_alarms(self, parsed: Dict[str, str]) -> None:
+        raised: List[str] = []
+        for rule in self.alarms:
+            value = safe_float(parsed.get(NUMERIC_FIELDS.get(rule.field, rule.field)), rule.field)
+            message = None if value is None else rule.check(value)
+            # Log transitions only; a condition that persists is one alarm, not one per sample
+            if message and rule.name not in self._active_alarms:
+                raised.append(message)
+                self._active_alarms[rule.name] = message
+            elif not message and rule.name in self._active_alarms:
+                log.info(f"Alarm cleared: {rule.name}")
+                del self._active_alarms[rule.name]
+        if raised:
+            self.alarm_count += len(raised)
+            new_file = not self.alarm_path.exists()
+            with open(self.alarm_path, 'a', newline='') as f:
+                writer = csv.writer(f)
+                if new_file:
+                    writer.writerow(["Timestamp", "Alarm"])
+                for message in raised:
+                    log.warning(f"ALARM {message}")
+                    writer.writerow([datetime.now().isoformat(timespec='seconds'), message])
+
+    # ---------- health / watchdog ----------
+    def health(self) -> Dict:
+        now = time.monotonic()
+        return {
+            'updated': datetime.now().isoformat(timespec='seconds'),
+            'uptime_sec': round(now - self.started_at, 1),
+            'running': not self.stop_event.is_set(),
+            'stalled': self.stalled,
+            'samples': self.samples,
+            'failed_polls': self.failed_polls,
+            'consecutive_failures': self.consecutive_failures,
+            'reconnects': self.reconnects,
+            'alarms_raised': self.alarm_count,
+            'active_alarms': sorted(self._active_alarms.values()),
+            'sample_age_sec': None if self.last_sample_at is None else round(now - self.last_sample_at, 2),
+            'last_sample': self.last_sample,
+            'scheduler': self.scheduler.stats(),
+            'log_file': str(self.log_path),
+        }
+
+    @property
+    def stalled(self) -> bool:
+        """True when the poll loop itself has not run for ``stale_after`` seconds."""
+        if self.last_loop_at is None:
+            return False
+        return time.monotonic() - self.last_loop_at > self.stale_after
+
+    def write_health(self) -> None:
+        tmp = self.health_path.with_suffix(".tmp")
+        try:
+            tmp.write_text(json.dumps(self.health(), indent=2, default=str))
+            os.replace(tmp, self.health_path)
+        except Exception as e:
+            log.error(f"Error writing health file: {e}")
+
+    def _watchdog_loop(self) -> None:
+        while not self.stop_event.wait(self.health_interval):
+            if self.stalled:
+                log.error(f"Poll loop stalled for {time.monotonic() - self.last_loop_at:.1f}s")
+            self.write_health()
+            self.csv.flush()
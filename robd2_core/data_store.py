@@ -0,0 +1,296 @@
+from collections import deque
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+import csv
+import logging
+import math
+import sys
+import threading
+
+from .rolling_stats import RollingStats
+
+log = logging.getLogger(__name__)
+
+# Approximate CPython cost of one retained sample: a datetime plus one float per
+# series, each referenced from a deque slot, plus the per-series running summary
+# (a shared reference to the value and one prefix-sum float).
+_POINTER_BYTES = 8
+_FLOAT_BYTES = sys.getsizeof(0.0)
+_TIMESTAMP_BYTES = sys.getsizeof(datetime(2000, 1, 1))
+_SERIES_BYTES = (_FLOAT_BYTES + _POINTER_BYTES) + _POINTER_BYTES + (_FLOAT_BYTES + _POINTER_BYTES)
+
+# Distinct metric sets whose figure frames are memoized at once
+_FIGURE_CACHE_ENTRIES = 8
+
+
+class DataStore:
+    """Store and manage real-time data for plotting
+
+    Retention can be bounded by point count (``max_points``), by age
+    (``retention_seconds``, relative to the newest sample) and/or by memory
+    (``max_bytes``). Eviction pops from the left of each deque, so it is
+    amortized O(1) per sample regardless of the poll rate.
+
+    Every series holds exactly one value per timestamp: metrics missing from
+    a sample are stored as NaN (a gap in plots) and left out of ``stats``.
+    """
+    SERIES = ('altitude', 'o2_conc', 'blp', 'spo2', 'pulse', 'o2_voltage', 'error_percent')
+    # Physiological/device limits; values outside are clamped and counted.
+    VALIDATION_RANGES = {
+        'spo2': (50, 100),      # %
+        'o2_conc': (0, 100),    # %
+        'pulse': (20, 220),     # bpm
+    }
+    BYTES_PER_SAMPLE = _TIMESTAMP_BYTES + _POINTER_BYTES + len(SERIES) * _SERIES_BYTES
+
+    def __init__(self, max_points=1000, retention_seconds=None, max_bytes=None):
+        if retention_seconds is not None and retention_seconds <= 0:
+            raise ValueError("retention_seconds must be > 0")
+        if max_bytes is not None:
+            byte_points = max(1, int(max_bytes // self.BYTES_PER_SAMPLE))
+            max_points = byte_points if max_points is None else min(max_points, byte_points)
+        self.max_points = max_points
+        self.retention_seconds = retention_seconds
+        self.max_bytes = max_bytes
+        self.data = {key: deque(maxlen=max_points) for key in self.SERIES}
+        self.timestamps = deque(maxlen=max_points)
+        # Running summaries kept in step with the buffers (O(1) per sample)
+        self.stats = {
+            key: RollingStats(window=max_points, track_median=False) for key in self.data
+        }
+        self.out_of_range = {key: 0 for key in self.VALIDATION_RANGES}
+        self.start_time = None
+        # Bumped on every mutation so renderers can skip unchanged frames
+        self.version = 0
+        # metrics tuple -> (version, frame); one entry per view (dashboard, export, ...)
+        self._figure_cache = {}
+        self._lock = threading.RLock()
+        
+    @classmethod
+    def estimate_bytes(cls, duration_seconds, poll_interval):
+        """Estimate memory needed to retain ``duration_seconds`` of samples at ``poll_interval``"""
+        if poll_interval <= 0:
+            raise ValueError("poll_interval must be > 0")
+        return int(math.ceil(duration_seconds / poll_interval)) * cls.BYTES_PER_SAMPLE
+        
+    def memory_usage(self):
+        """Report the approximate memory footprint of the retained samples"""
+        samples = len(self.timestamps)
+        series_points = sum(len(series) for series in self.data.values())
+        total = (
+            samples * (_TIMESTAMP_BYTES + _POINTER_BYTES)
+            + series_points * _SERIES_BYTES
+        )
+        span = (
+            (self.timestamps[-1] - self.timestamps[0]).total_seconds()
+            if samples > 1 else 0.0
+        )
+        return {
+            'samples': samples,
+            'bytes': total,
+            'bytes_per_sample': self.BYTES_PER_SAMPLE,
+            'span_seconds': span,
+            'max_points': self.max_points,
+            'retention_seconds': self.retention_seconds,
+        }
+        
+    def add_data(self, timestamp, data_dict):
+        """Add new data point with validation"""
+        with self._lock:
+            if self.start_time is None:
+                self.start_time = timestamp
+            
+            self.timestamps.append(timestamp)
+        
+            # Validate and store data; absent metrics are padded so series stay aligned
+            ranges = self.VALIDATION_RANGES
+            for key in self.data:
+                value = data_dict.get(key, math.nan)
+                bounds = ranges.get(key)
+                if bounds is not None and not (bounds[0] <= value <= bounds[1]) and not math.isnan(value):
+                    self.out_of_range[key] += 1
+                    value = max(bounds[0], min(bounds[1], value))
+                self._extend(key, (value,))
+                
+            if self.retention_seconds is not None:
+                self._evict_older_than(timestamp)
+            self.version += 1
+                
+    def add_many(self, timestamps, columns):
+        """Add a batch of samples given as columnar arrays
+
+        ``timestamps`` is a sequence of datetimes and ``columns`` maps metric
+        names to equally long array-likes (e.g. from a replay, log import or
+        fleet poller). Validation ranges are applied with vectorized clipping
+        and out-of-range counts are accumulated in ``out_of_range``.
+        """
+        import numpy as np  # deferred: the GUI creates a store long before it needs arrays
+        
+        timestamps = list(timestamps)
+        count = len(timestamps)
+        if count == 0:
+            return 0
+        arrays = {}
+        rejected = {}
+        for key, values in columns.items():
+            if key not in self.data:
+                continue
+            arr = np.asarray(values, dtype=float)
+            if arr.shape != (count,):
+                raise ValueError(f"Column '{key}' has {arr.size} values, expected {count}")
+            bounds = self.VALIDATION_RANGES.get(key)
+            if bounds is not None:
+                low, high = bounds
+                rejected[key] = int(np.count_nonzero((arr < low) | (arr > high)))
+                arr = np.clip(arr, low, high)
+            arrays[key] = arr
+            
+        with self._lock:
+            if self.start_time is None:
+                self.start_time = timestamps[0]
+            
+            # Only the tail that fits in the buffers can survive; skip the rest up front.
+            keep = count if self.max_points is None else min(count, self.max_points)
+            self.timestamps.extend(timestamps[count - keep:])
+            for key in self.data:
+                arr = arrays.get(key)
+                self._extend(key, arr[count - keep:].tolist() if arr is not None else [math.nan] * keep)
+            
+            for key, n_rejected in rejected.items():
+                self.out_of_range[key] += n_rejected
+            if self.retention_seconds is not None:
+                self._evict_older_than(timestamps[-1])
+            self.version += 1
+        return count
+        
+    def _extend(self, key, values):
+        """Append one value per new timestamp to a series; ``stats`` only sees the non-NaN ones"""
+        series = self.data[key]
+        stats = self.stats[key]
+        if series.maxlen is not None:
+            # The deque drops its oldest values to make room; drop them from the summary too
+            dropped = len(series) + len(values) - series.maxlen
+            for old in islice(series, max(0, dropped)):
+                if not math.isnan(old):
+                    stats.evict()
+        series.extend(values)
+        stats.extend(value for value in values if not math.isnan(value))
+        
+    def _evict_older_than(self, newest):
+        """Drop samples older than the retention window (amortized O(1))"""
+        timestamps = self.timestamps
+        while len(timestamps) > 1 and (newest - timestamps[0]).total_seconds() > self.retention_seconds:
+            timestamps.popleft()
+            for key, series in self.data.items():
+                if not math.isnan(series.popleft()):
+                    self.stats[key].evict()
+                
+    def get_data(self, metric):
+        """Get data for a specific metric with relative time"""
+        if metric in self.data:
+            # Convert timestamps to relative time in seconds
+            relative_times = [(t - self.start_time).total_seconds() for t in self.timestamps]
+            return relative_times, list(self.data[metric])
+        return [], []
+        
+    def figure_data(self, metrics=None):
+        """Return relative times and series as arrays, memoized on ``version``
+
+        The result is ``{'time': array, metric: array, ...}`` and is shared
+        between callers until the next mutation, so treat it as read-only.
+        """
+        return self.figure_snapshot(metrics)[1]
+        
+    def figure_snapshot(self, metrics=None):
+        """Return ``(version, frame)`` for ``figure_data``, read together under the lock
+
+        Use the returned version, not ``self.version``, as the cache key for
+        anything built from the frame: a producer thread may have added
+        samples since the snapshot was taken.
+        """
+        metrics = tuple(metrics) if metrics is not None else self.SERIES
+        with self._lock:
+            version = self.version
+            cached = self._figure_cache.get(metrics)
+            if cached is not None and cached[0] == version:
+                return cached
+            start = self.start_time
+            timestamps = list(self.timestamps)
+            columns = {metric: list(self.data[metric]) for metric in metrics}
+                
+        import numpy as np
+        
+        if start is None or not timestamps:
+            result = {'time': np.empty(0)}
+            result.update({metric: np.empty(0) for metric in metrics})
+        else:
+            result = {'time': np.array([(t - start).total_seconds() for t in timestamps], dtype=float)}
+            for metric, values in columns.items():
+                result[metric] = np.array(values, dtype=float)
+        with self._lock:
+            if len(self._figure_cache) >= _FIGURE_CACHE_ENTRIES and metrics not in self._figure_cache:
+                self._figure_cache.clear()
+            self._figure_cache[metrics] = (version, result)
+        return version, result
+        
+    def get_stats(self, metric):
+        """Get the running summary (mean/stdev/count) for a specific metric"""
+        return self.stats.get(metric)
+        
+    def clear(self):
+        """Clear all data"""
+        with self._lock:
+            for key in self.data:
+                self.data[key].clear()
+                self.stats[key].clear()
+            self.timestamps.clear()
+            for key in self.out_of_range:
+                self.out_of_range[key] = 0
+            self.start_time = None
+            self.version += 1
+        
+    def export_to_csv(self, filename):
+        """Export all data to a CSV file"""
+        try:
+            # Create directory if it doesn't exist
+            export_dir = Path("exports")
+            export_dir.mkdir(exist_ok=True)
+            
+            # Generate filename with timestamp if not provided
+            if not filename:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                filename = export_dir / f"robd2_data_{timestamp}.csv"
+            else:
+                filename = export_dir / filename
+                
+            with open(filename, 'w', newline='') as csvfile:
+                writer = csv.writer(csvfile)
+                
+                # Write header
+                headers = ['Time (s)', 'Time (min)', 'Altitude (ft)', 'O2 Concentration (%)', 
+                          'BLP (mmHg)', 'SpO2 (%)', 'Pulse (bpm)', 'O2 Voltage (V)', 
+                          'Error (%)']
+                writer.writerow(headers)
+                
+                # Write data
+                for i in range(len(self.timestamps)):
+                    time_s = (self.timestamps[i] - self.start_time).total_seconds()
+                    time_min = time_s / 60
+                    row = [
+                        f"{time_s:.2f}",
+                        f"{time_min:.2f}",
+                        f"{self.data['altitude'][i]:.1f}",
+                        f"{self.data['o2_conc'][i]:.1f}",
+                        f"{self.data['blp'][i]:.1f}",
+                        f"{self.data['spo2'][i]:.1f}",
+                        f"{self.data['pulse'][i]:.1f}",
+                        f"{self.data['o2_voltage'][i]:.3f}",
+                        f"{self.data['error_percent'][i]:.1f}"
+                    ]
+                    writer.writerow(row)
+                    
+            return True, str(filename)
+            
+        except Exception as e:
+            return False, str(e) 
\ No newline at end of file
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+
+class DeviceStateCache:
+    """
+    Last-known device settings that change rarely, with the time each was read.
+
+    Views render from the cache right away and refresh it in the background;
+    writers are usually acquisition jobs on a worker thread, readers the Tk
+    thread, so every method takes the lock. Currently holds program names
+    (``PROG <slot> NAME ?``), keyed by slot number.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._program_names: Dict[int, Tuple[str, float]] = {}
+
+    def set_program_name(self, slot: int, name: str, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        with self._lock:
+            self._program_names[int(slot)] = (name, now)
+
+    def program_name(self, slot: int, max_age: Optional[float] = None, now: Optional[float] = None) -> Optional[str]:
+        """Cached name for ``slot``, or None if unknown or older than ``max_age`` seconds."""
+        with self._lock:
+            entry = self._program_names.get(int(slot))
+        if entry is None:
+            return None
+        name, read_at = entry
+        if max_age is not None:
+            now = time.time() if now is None else now
+            if now - read_at > max_age:
+                return None
+        return name
+
+    def program_names(self) -> Dict[int, str]:
+        with self._lock:
+            return {slot: name for slot, (name, _) in sorted(self._program_names.items())}
+
+    def forget_program(self, slot: int) -> None:
+        with self._lock:
+            self._program_names.pop(int(slot), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._program_names.clear()
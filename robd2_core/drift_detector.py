@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+
+@dataclass
+class DriftEvent:
+    channel: str
+    kind: str  # "step" (CUSUM) or "drift" (EWMA)
+    direction: str  # "up" or "down"
+    value: float
+    baseline: float
+    samples: int  # samples since the baseline was learned
+
+
+class ChannelDriftDetector:
+    """
+    Streaming step/drift detector for one sensor channel.
+
+    The baseline is learned from two consecutive halves of ``warmup // 2``
+    samples each (Welford). It is only accepted once the two half means agree
+    within ``stable_z`` standard errors; otherwise the older half is dropped
+    and learning slides on. A signal still closing in on its setpoint (a
+    first-order response just after settling) therefore never becomes the
+    baseline. The pooled within-half deviation is inflated by
+    ``sigma_margin`` to absorb the estimation error of a short warmup. After
+    that every sample is standardized against the baseline and fed to:
+
+    - a two-sided CUSUM (reference ``k``, decision interval ``h``), which
+      reacts within a few samples to a step change;
+    - an EWMA chart (weight ``lam``, limit ``L`` sigmas of the EWMA), which
+      accumulates evidence of a slow drift.
+
+    Memory is a handful of floats and the cost per sample is constant. After
+    an event the detector re-learns its baseline so it reports each change
+    once instead of alarming continuously.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        min_sigma: float,
+        warmup: int = 40,
+        k: float = 0.5,
+        h: float = 10.0,
+        lam: float = 0.1,
+        L: float = 4.0,
+        sigma_margin: float = 1.25,
+        stable_z: float = 2.0,
+    ) -> None:
+        if warmup < 2:
+            raise ValueError("warmup must be >= 2")
+        if not 0.0 < lam <= 1.0:
+            raise ValueError("lam must be in (0, 1]")
+        self.channel = channel
+        self.min_sigma = min_sigma
+        self.warmup = warmup
+        self.k = k
+        self.h = h
+        self.lam = lam
+        self.sigma_margin = sigma_margin
+        self.stable_z = stable_z
+        self.ewma_limit = L * math.sqrt(lam / (2.0 - lam))
+        self.reset()
+
+    def reset(self) -> None:
+        self._ready = False
+        # Welford state of the half being learned, and (n, mean, m2) of the one before it
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._previous: Optional[Tuple[int, float, float]] = None
+        self._sigma = 0.0
+        self._cusum_hi = 0.0
+        self._cusum_lo = 0.0
+        self._ewma = 0.0
+        self._monitored = 0
+
+    @property
+    def ready(self) -> bool:
+        return self._ready
+
+    @property
+    def baseline(self) -> Optional[float]:
+        return self._mean if self.ready else None
+
+    def update(self, value: Optional[float]) -> Optional[DriftEvent]:
+        if value is None or math.isnan(value):
+            return None
+        if not self._ready:
+            self._learn(value)
+            return None
+
+        self._monitored += 1
+        z = (value - self._mean) / self._sigma
+        self._cusum_hi = max(0.0, self._cusum_hi + z - self.k)
+        self._cusum_lo = max(0.0, self._cusum_lo - z - self.k)
+        self._ewma = self.lam * z + (1.0 - self.lam) * self._ewma
+
+        event = None
+        if self._cusum_hi > self.h or self._cusum_lo > self.h:
+            direction = "up" if self._cusum_hi > self._cusum_lo else "down"
+            event = self._event("step", direction, value)
+        elif abs(self._ewma) > self.ewma_limit:
+            event = self._event("drift", "up" if self._ewma > 0 else "down", value)
+        if event:
+            self.reset()
+        return event
+
+    def _learn(self, value: float) -> None:
+        self._n += 1
+        delta = value - self._mean
+        self._mean += delta / self._n
+        self._m2 += delta * (value - self._mean)
+        if self._n < max(1, self.warmup // 2):
+            return
+        half = (self._n, self._mean, self._m2)
+        if self._previous is not None:
+            n1, mean1, m2_1 = self._previous
+            n2, mean2, m2_2 = half
+            dof = n1 + n2 - 2
+            within = math.sqrt((m2_1 + m2_2) / dof) if dof > 0 else 0.0
+            standard_error = max(self.min_sigma, within) * math.sqrt(1.0 / n1 + 1.0 / n2)
+            if abs(mean2 - mean1) <= self.stable_z * standard_error:
+                self._mean = (n1 * mean1 + n2 * mean2) / (n1 + n2)
+                self._sigma = max(self.min_sigma, within * self.sigma_margin)
+                self._ready = True
+                return
+        # Still moving (or only one half so far): keep the newest half and learn the next
+        self._previous = half
+        self._n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def _event(self, kind: str, direction: str, value: float) -> DriftEvent:
+        return DriftEvent(
+            channel=self.channel,
+            kind=kind,
+            direction=direction,
+            value=value,
+            baseline=self._mean,
+            samples=self._monitored,
+        )
+
+
+class SensorDriftMonitor:
+    """Drift detectors for several channels keyed by the monitor's data field names."""
+
+    # Channel -> noise floor used when the learned baseline is almost constant
+    DEFAULT_CHANNELS = {
+        'o2_conc': 0.02,  # %
+        'voltage1': 0.002,  # V (ADC 1)
+        'voltage12': 0.002,  # V (ADC 12)
+    }
+
+    # Per-channel detector settings that win over ``detector_kwargs``. The ADC
+    # voltages only get a fresh reading every ``AcquisitionPlan.adc_interval``
+    # (5 s) and baselines restart at every altitude, so the default 40-sample
+    # warmup would need over three minutes at one altitude. They learn from two
+    # halves of 4 fresh readings (~40 s) instead, with a wider margin on the short
+    # baseline's deviation: about 1.5% false alarms over 40 monitored readings,
+    # and a 4-sigma step is still caught within about 7 readings.
+    CHANNEL_SETTINGS = {
+        'voltage1': {'warmup': 8, 'sigma_margin': 2.0},
+        'voltage12': {'warmup': 8, 'sigma_margin': 2.0},
+    }
+
+    def __init__(
+        self,
+        channels: Optional[Dict[str, float]] = None,
+        channel_settings: Optional[Dict[str, Dict]] = None,
+        **detector_kwargs
+    ) -> None:
+        channels = channels or self.DEFAULT_CHANNELS
+        channel_settings = self.CHANNEL_SETTINGS if channel_settings is None else channel_settings
+        self.detectors = {
+            name: ChannelDriftDetector(name, min_sigma, **{**detector_kwargs, **channel_settings.get(name, {})})
+            for name, min_sigma in channels.items()
+        }
+
+    def update(self, data: Dict[str, float]) -> List[DriftEvent]:
+        events = []
+        for name, detector in self.detectors.items():
+            event = detector.update(data.get(name))
+            if event:
+                events.append(event)
+        return events
+
+    def reset(self) -> None:
+        for detector in self.detectors.values():
+            detector.reset()
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import math
+from typing import Optional, Tuple
+
+
+class O2Estimator:
+    """
+    Kalman filter over the delivered O2 concentration.
+
+    The state is the true concentration ``x`` plus a slowly varying device
+    offset ``b`` from the spec target. The process model is the mixer's
+    first-order response toward the commanded altitude's target:
+
+        x[k+1] = x[k] + a * (target + b[k] - x[k]),   a = 1 - exp(-dt / tau)
+        b[k+1] = b[k]
+
+    and every reading is a measurement of ``x`` with variance ``r``. Because
+    the offset is estimated rather than assumed zero, a unit that sits off
+    target is tracked where it actually is instead of being pulled toward the
+    spec. Each step yields the filtered value and its variance, whose
+    confidence interval shrinks much faster than that of a plain average.
+
+    ``r`` is only the starting guess for the sensor noise. Readings passed
+    with ``learn_noise=True`` update it from the post-fit residuals: since
+    ``E[residual^2] = r - p_xx``, each one gives a sample of ``r`` that is
+    averaged in with weight ``1/n`` at first and ``r_weight`` later (an EWMA),
+    floored at ``r_floor``. The process noise keeps ``p_xx`` on the high side,
+    so the learned ``r`` errs wide rather than narrow. A noisier unit therefore gets wider intervals
+    instead of overconfident ones. Callers should only learn from settled
+    readings, since a transient inflates the innovations, and should not act
+    on the variance before ``noise_calibrated``.
+    """
+
+    def __init__(
+        self,
+        tau: float = 3.0,
+        r: float = 0.05 ** 2,
+        q_o2: float = 1e-4,
+        q_offset: float = 1e-6,
+        offset_var: float = 1.0,
+        r_floor: float = 0.005 ** 2,
+        r_weight: float = 0.05,
+        min_noise_readings: int = 10,
+    ) -> None:
+        if tau <= 0 or r <= 0 or r_floor <= 0:
+            raise ValueError("tau, r and r_floor must be > 0")
+        if not 0.0 < r_weight <= 1.0:
+            raise ValueError("r_weight must be in (0, 1]")
+        self.tau = tau
+        self.r_prior = r
+        self.q_o2 = q_o2
+        self.q_offset = q_offset
+        self.offset_var = offset_var
+        self.r_floor = r_floor
+        self.r_weight = r_weight
+        self.min_noise_readings = min_noise_readings
+        self.reset()
+
+    def reset(self) -> None:
+        self.r = self.r_prior
+        self.noise_readings = 0
+        self.estimate: Optional[float] = None
+        self.offset = 0.0
+        # Covariance [[p_xx, p_xb], [p_xb, p_bb]]
+        self._p_xx = self._p_xb = self._p_bb = 0.0
+        self._last_t: Optional[float] = None
+        self.readings = 0
+
+    @property
+    def variance(self) -> Optional[float]:
+        return self._p_xx if self.estimate is not None else None
+
+    @property
+    def noise_calibrated(self) -> bool:
+        """True once ``r`` has been learned from ``min_noise_readings`` readings."""
+        return self.noise_readings >= self.min_noise_readings
+
+    def start_step(self) -> None:
+        """New commanded altitude: the device offset may differ, so reopen its uncertainty."""
+        self._p_bb += self.offset_var
+        self.readings = 0
+
+    def update(self, measurement: float, target: float, now: float, learn_noise: bool = True) -> Tuple[float, float]:
+        """
+        Fold in one reading taken at ``now``; returns ``(estimate, variance)``.
+
+        With ``learn_noise`` the reading's innovation also updates ``r``.
+        """
+        self.readings += 1
+        if self.estimate is None:
+            self.estimate = measurement
+            self.offset = measurement - target
+            self._p_xx, self._p_xb, self._p_bb = self.r, 0.0, self.offset_var
+            self._last_t = now
+            return self.estimate, self._p_xx
+
+        # Predict
+        dt = max(0.0, now - self._last_t)
+        self._last_t = now
+        a = 1.0 - math.exp(-dt / self.tau)
+        f_xx = 1.0 - a
+        x = f_xx * self.estimate + a * (target + self.offset)
+        p_xx = (f_xx * f_xx * self._p_xx + 2 * f_xx * a * self._p_xb + a * a * self._p_bb
+                + self.q_o2 * dt)
+        p_xb = f_xx * self._p_xb + a * self._p_bb
+        p_bb = self._p_bb + self.q_offset * dt
+
+        # Correct with the reading
+        s = p_xx + self.r
+        k_x, k_b = p_xx / s, p_xb / s
+        innovation = measurement - x
+        self.estimate = x + k_x * innovation
+        self.offset += k_b * innovation
+        self._p_xx = (1.0 - k_x) * p_xx
+        self._p_xb = (1.0 - k_x) * p_xb
+        self._p_bb = p_bb - k_b * p_xb
+        if learn_noise:
+            self._learn_noise(measurement - self.estimate)
+        return self.estimate, self._p_xx
+
+    def _learn_noise(self, residual: float) -> None:
+        self.noise_readings += 1
+        weight = max(self.r_weight, 1.0 / self.noise_readings)
+        sample = residual * residual + self._p_xx
+        self.r = max(self.r_floor, (1.0 - weight) * self.r + weight * sample)
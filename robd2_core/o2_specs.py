@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+
+@dataclass(frozen=True)
+class AltitudeSpec:
+    altitude: int
+    desired_o2: float
+    range_min: float
+    range_max: float
+
+
+# O2 specifications table
+O2_SPECS = [
+    AltitudeSpec(0, 21.00, 20.9, 21.1),
+    AltitudeSpec(5000, 17.27, 17.0, 17.5),
+    AltitudeSpec(10000, 14.05, 13.8, 14.3),
+    AltitudeSpec(13000, 12.34, 12.2, 12.5),
+    AltitudeSpec(15000, 11.28, 11.1, 11.4),
+    AltitudeSpec(18000, 9.81, 9.66, 10.0),
+    AltitudeSpec(20000, 8.91, 8.76, 9.06),
+    AltitudeSpec(22000, 8.06, 7.9, 8.2),
+    AltitudeSpec(25000, 6.89, 6.74, 7.05),
+    AltitudeSpec(28000, 5.86, 5.73, 6.0),
+    AltitudeSpec(30000, 5.22, 5.1, 5.35),
+    AltitudeSpec(34000, 4.09, 4.0, 4.2),
+]
+
+
+class SpecTable:
+    """
+    Precomputed O2 spec lookup.
+
+    ``lookup`` snaps to the spec at or below the altitude with a bisect on the
+    sorted altitudes. ``interpolated`` treats desired O2 and the tolerance
+    band as piecewise-linear functions of altitude, precomputed every
+    ``grid_step`` feet, so error can be evaluated during CHG ramps as well.
+    Both return ``None`` below the lowest spec altitude and clamp to the
+    highest spec above it.
+    """
+
+    def __init__(self, specs: Sequence[AltitudeSpec] = O2_SPECS, grid_step: int = 50) -> None:
+        if not specs:
+            raise ValueError("specs must not be empty")
+        if grid_step <= 0:
+            raise ValueError("grid_step must be > 0")
+        self.specs: List[AltitudeSpec] = sorted(specs, key=lambda s: s.altitude)
+        self.altitudes: List[int] = [s.altitude for s in self.specs]
+        self.grid_step = grid_step
+        self._grid: List[AltitudeSpec] = self._build_grid()
+
+    def lookup(self, altitude: float) -> Optional[AltitudeSpec]:
+        """Spec at or below ``altitude`` (the monitors' historic behaviour)."""
+        idx = bisect_right(self.altitudes, altitude) - 1
+        return self.specs[idx] if idx >= 0 else None
+
+    def interpolated(self, altitude: float) -> Optional[AltitudeSpec]:
+        """Spec linearly interpolated between the neighbouring table altitudes."""
+        low = self.altitudes[0]
+        if altitude < low:
+            return None
+        if altitude >= self.altitudes[-1]:
+            return self.specs[-1]
+        exact = self.lookup(altitude)
+        if exact.altitude == altitude:
+            return exact
+        idx = int(round((altitude - low) / self.grid_step))
+        return self._grid[min(idx, len(self._grid) - 1)]
+
+    def get(self, altitude: float, interpolate: bool = False) -> Optional[AltitudeSpec]:
+        return self.interpolated(altitude) if interpolate else self.lookup(altitude)
+
+    def _build_grid(self) -> List[AltitudeSpec]:
+        if len(self.specs) < 2:
+            return list(self.specs)
+        low, high = self.altitudes[0], self.altitudes[-1]
+        grid = []
+        steps = int((high - low) // self.grid_step) + 1
+        for i in range(steps):
+            altitude = low + i * self.grid_step
+            idx = min(bisect_right(self.altitudes, altitude) - 1, len(self.specs) - 2)
+            a, b = self.specs[idx], self.specs[idx + 1]
+            frac = (altitude - a.altitude) / (b.altitude - a.altitude)
+            grid.append(AltitudeSpec(
+                altitude=altitude,
+                desired_o2=a.desired_o2 + frac * (b.desired_o2 - a.desired_o2),
+                range_min=a.range_min + frac * (b.range_min - a.range_min),
+                range_max=a.range_max + frac * (b.range_max - a.range_max),
+            ))
+        return grid
+
+
+SPEC_TABLE = SpecTable()
@@ -0,0 +1,65 @@
+"""
+Parsers for ROBD2 serial responses.
+
+Every helper logs and returns ``None`` (or ``False``) on malformed input and
+device error codes (``ERR...``) instead of raising, so acquisition loops can
+simply skip the sample.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Dict, Optional
+
+log = logging.getLogger(__name__)
+
+RUN_ALL_FIELDS = (
+    "timestamp", "program", "current_alt", "final_alt", "o2_conc",
+    "bl_pressure", "elapsed_time", "remaining_time", "spo2", "pulse",
+)
+
+
+def parse_run_all(data: str) -> Optional[Dict[str, str]]:
+    """Split a GET RUN ALL response into its ten named fields."""
+    parts = data.split(',')
+    if len(parts) != len(RUN_ALL_FIELDS):
+        return None
+    if any(p.strip().upper().startswith("ERR") for p in parts):
+        log.error(f"RUN ALL response contained error code: {data}")
+        return None
+    return dict(zip(RUN_ALL_FIELDS, parts))
+
+
+def safe_float(value: Optional[str], label: str) -> Optional[float]:
+    """Convert a string to float; return None on errors or error codes."""
+    if value is None:
+        log.error(f"{label} response is missing")
+        return None
+    stripped = value.strip()
+    if not stripped:
+        log.error(f"{label} response is empty")
+        return None
+    if stripped.upper().startswith("ERR"):
+        log.error(f"{label} returned error code: {stripped}")
+        return None
+    try:
+        return float(stripped)
+    except ValueError:
+        log.error(f"Could not parse {label}: {stripped}")
+        return None
+
+
+def is_single_float_response(response: Optional[str]) -> bool:
+    """
+    Check that a response line looks like a single floating-point value
+    (no commas or multiple tokens). Used to discard stray RUN ALL lines.
+    """
+    if response is None:
+        return False
+    stripped = response.strip()
+    if not stripped or "," in stripped:
+        return False
+    try:
+        float(stripped)
+        return True
+    except ValueError:
+        return False
@@ -0,0 +1,809 @@
+"""
+Shared streaming performance-analysis engine.
+
+``PerformanceEngine`` turns raw samples into analysed samples: settling
+detection, the rolling 12-sample average and statistics, IC95 status,
+sequential verdicts, per-altitude results and sensor drift events. Samples
+come from a pluggable *source* and results go to any number of *sinks*:
+
+Sources (``read()`` returns a sample dict or ``None``):
+    - ``SerialSource``: live device link, RUN ALL fast path with multi-rate ADC
+    - ``ReplaySource``: a recorded performance log CSV
+    - ``SimulatedSource``: synthetic first-order O2 response to altitude steps
+
+A sample's optional ``t`` (seconds, possibly a virtual clock) only drives
+settling and the estimator. The log's Timestamp column is wall-clock time
+unless the source supplies ``logged_at`` (replays keep their recorded times).
+
+Sinks (subclass ``Sink`` and override the hooks you need):
+    - ``CsvSink``: batched performance log writer
+    - ``CallbackSink``: data/verdict callbacks for GUI front ends
+    - ``LogSink``: settling, verdict and drift messages to ``logging``
+    - ``MetricsSink``: throughput and per-sample processing cost
+
+The Rich CLI (``Performance.py``) and the Tk tab (``performance_monitor.py``)
+are thin front ends over this module.
+"""
+from __future__ import annotations
+
+import csv
+import logging
+import math
+import random
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from .acquisition import AcquisitionPlan, AdcCache
+from .drift_detector import DriftEvent, SensorDriftMonitor
+from .o2_estimator import O2Estimator
+from .o2_specs import O2_SPECS, SPEC_TABLE, AltitudeSpec
+from .parsers import is_single_float_response, parse_run_all, safe_float
+from .rolling_stats import RollingStats, StatsAccumulator
+from .sequential_test import SequentialTest, Verdict
+from .settling import SettlingDetector
+
+log = logging.getLogger(__name__)
+
+LOG_HEADERS = [
+    "Timestamp", "Altitude (feet)", "Desired O2 %", "Actual O2 %",
+    "O2 Error %", "O2 Sensor V1", "O2 Sensor V12", "BLP (inH2O)",
+    "Min Range %", "Max Range %", "Program", "Final Altitude",
+    "Elapsed Time", "Remaining Time", "IC95% Status", "Median O2 %",
+    "StdDev", "CV %", "SEM", "Stability %", "Drift %"
+]
+
+
+# ---------- sources ----------
+class SerialSource:
+    """Live acquisition: RUN ALL at full rate, ADC voltages on the acquisition plan's slower cadence."""
+
+    exhausted = False
+    retry_delay = 0.5
+
+    def __init__(self, ser, acquisition: Optional[AcquisitionPlan] = None, lock=None):
+        self.ser = ser
+        self.acquisition = acquisition or AcquisitionPlan()
+        self.adc_cache = AdcCache(self.acquisition)
+        # One command/reply exchange at a time: the engine polls on its own
+        # thread while a front end (performance_runner) may send commands.
+        # Pass the port's shared lock when other code also talks on ``ser``.
+        self.lock = lock if lock is not None else threading.RLock()
+
+    @property
+    def interval(self) -> float:
+        return self.acquisition.run_all_interval
+
+    def reset(self):
+        self.adc_cache.clear()
+
+    def read_line(
+        self,
+        timeout: float = 0.7,
+        label: str = "response",
+        suppress_timeout_log: bool = False
+    ) -> Optional[str]:
+        """Read a single line from serial within a timeout window."""
+        # Blocking read with the port timeout: the thread sleeps in the driver until
+        # the line arrives instead of polling in_waiting every 20 ms
+        previous_timeout = self.ser.timeout
+        try:
+            self.ser.timeout = timeout
+            raw = self.ser.readline()
+        finally:
+            self.ser.timeout = previous_timeout
+        if raw.endswith(b"\n"):
+            # Line noise must not raise out of the poll; a garbled field fails parsing on its own
+            line = raw.decode('utf-8', errors='replace').rstrip()
+            if line:
+                return line
+        elif raw:
+            # readline hit the timeout mid-line; a truncated reply is not a reply
+            log.error(f"Incomplete {label} within {timeout}s: {raw!r}")
+            return None
+        if not suppress_timeout_log:
+            log.error(f"No {label} received within {timeout}s")
+        return None
+
+    def send(self, command: str, timeout: float = 1.5) -> Optional[str]:
+        """Send a command and return the device's reply line (None on timeout)."""
+        with self.lock:
+            self.ser.reset_input_buffer()
+            self.ser.write(f"{command}\r\n".encode('utf-8'))
+            response = self.read_line(timeout=timeout, label=command)
+            log.debug(f"{command} -> {response}")
+            return response
+
+    def read_adc(self, channel: str) -> Optional[float]:
+        """Read ADC channel value safely with validation and bounded retries."""
+        with self.lock:
+            max_attempts = 3
+            for attempt in range(max_attempts):
+                self.ser.reset_input_buffer()
+                time.sleep(0.05)
+                self.ser.write(f"GET ADC {channel}\r\n".encode('utf-8'))
+                attempt_deadline = time.time() + 1.2
+                while time.time() < attempt_deadline:
+                    response = self.read_line(timeout=1.0, label=f"ADC {channel}", suppress_timeout_log=True)
+                    if response is None:
+                        continue
+                    if not is_single_float_response(response):
+                        log.debug(f"Discarding non-ADC line for channel {channel}: {response}")
+                        continue
+                    value = safe_float(response, f"ADC {channel}")
+                    if value is not None:
+                        return value
+
+                if attempt < max_attempts - 1:
+                    log.warning(
+                        f"Retrying ADC {channel} (attempt {attempt + 2} of {max_attempts}) "
+                        "after no valid response"
+                    )
+
+            log.error(f"Failed to read ADC {channel} after {max_attempts} attempts")
+            return None
+
+    def read(self) -> Optional[Dict]:
+        """Poll RUN ALL and attach the (possibly carried-forward) ADC voltages."""
+        with self.lock:
+            self.ser.reset_input_buffer()
+            self.ser.write("GET RUN ALL\r\n".encode('utf-8'))
+            line = self.read_line(timeout=1.5, label="RUN ALL")
+            if not line:
+                return None
+            # Stamp the reading when it arrives, not when a consumer gets to it
+            received_at = time.time()
+            parsed = parse_run_all(line)
+            if not parsed:
+                return None
+
+            o2_conc = safe_float(parsed["o2_conc"], "O2 concentration")
+            altitude = safe_float(parsed["current_alt"], "Altitude")
+            blp = safe_float(parsed["bl_pressure"], "BL pressure")
+            if o2_conc is None or altitude is None or blp is None:
+                return None
+            altitude = int(altitude)
+
+            # ADC voltages change slowly: re-read on schedule or altitude change, else carry forward
+            adc_fresh = False
+            if self.adc_cache.due(altitude):
+                adc_fresh = self.adc_cache.refresh(altitude, self.read_adc)
+            if not self.adc_cache.values:
+                return None
+
+            return {
+                "t": received_at,
+                "o2_conc": o2_conc,
+                "altitude": altitude,
+                "voltage1": self.adc_cache.values["1"],
+                "voltage12": self.adc_cache.values["12"],
+                "adc_fresh": adc_fresh,
+                "adc_age": self.adc_cache.age(),
+                "blp": blp,
+                "timestamp": parsed["timestamp"],
+                "program": parsed["program"],
+                "final_alt": parsed["final_alt"],
+                "elapsed_time": parsed["elapsed_time"],
+                "remaining_time": parsed["remaining_time"]
+            }
+
+
+class ReplaySource:
+    """
+    Replays a recorded performance log (``LOG_HEADERS`` format).
+
+    The log stores the 12-sample rolling average rather than raw O2, so a
+    replay reproduces the timing and structure of a run, not its exact
+    statistics. Samples are spread evenly between the recorded timestamps;
+    ``realtime=True`` also sleeps so the replay runs at the recorded pace.
+    Logged voltages are carried forward between ADC reads, so a row only
+    counts as a fresh ADC reading when its voltages differ from the last row's.
+    """
+
+    retry_delay = 0.0
+
+    def __init__(self, path: Path, realtime: bool = False):
+        self.path = Path(path)
+        with open(self.path, newline='') as f:
+            self.rows = list(csv.DictReader(f))
+        self.realtime = realtime
+        self.index = 0
+        self.exhausted = not self.rows
+        self._times = self._sample_times()
+        self._last_voltages = None
+
+    @property
+    def interval(self) -> float:
+        if not self.realtime or len(self._times) < 2:
+            return 0.0
+        return (self._times[-1] - self._times[0]) / (len(self._times) - 1)
+
+    def _sample_times(self) -> List[float]:
+        stamps = []
+        for row in self.rows:
+            try:
+                stamps.append(datetime.strptime(row["Timestamp"], "%Y-%m-%d %H:%M:%S").timestamp())
+            except (KeyError, ValueError):
+                stamps.append(stamps[-1] if stamps else 0.0)
+        if len(stamps) < 2:
+            return stamps
+        step = max(stamps[-1] - stamps[0], 1.0) / (len(stamps) - 1)
+        return [stamps[0] + i * step for i in range(len(stamps))]
+
+    def reset(self):
+        self.index = 0
+        self.exhausted = not self.rows
+        self._last_voltages = None
+
+    def read(self) -> Optional[Dict]:
+        if self.index >= len(self.rows):
+            self.exhausted = True
+            return None
+        row, t = self.rows[self.index], self._times[self.index]
+        self.index += 1
+        if self.index >= len(self.rows):
+            self.exhausted = True
+        try:
+            voltages = (float(row["O2 Sensor V1"]), float(row["O2 Sensor V12"]))
+            adc_fresh = voltages != self._last_voltages
+            self._last_voltages = voltages
+            return {
+                "t": t,
+                "logged_at": datetime.fromtimestamp(t),
+                "o2_conc": float(row["Actual O2 %"]),
+                "altitude": int(float(row["Altitude (feet)"])),
+                "voltage1": voltages[0],
+                "voltage12": voltages[1],
+                "adc_fresh": adc_fresh,
+                "blp": float(row["BLP (inH2O)"]),
+                "timestamp": row["Timestamp"],
+                "program": row["Program"],
+                "final_alt": row["Final Altitude"],
+                "elapsed_time": row["Elapsed Time"],
+                "remaining_time": row["Remaining Time"]
+            }
+        except (KeyError, ValueError):
+            return None
+
+
+class SimulatedSource:
+    """
+    Synthetic ROBD2: O2 follows the spec for the commanded altitude with a
+    first-order lag ``tau`` and Gaussian noise, on a virtual clock.
+
+    With ``altitudes`` it walks through each for ``dwell`` seconds and then
+    reports ``exhausted``; without, it holds whatever ``SET FSALT`` last
+    commanded (so ``PerformanceRunner`` can drive it). Logged timestamps are
+    the wall-clock start of the run plus the virtual clock, so a log written
+    faster than real time still replays with the simulated timing.
+    """
+
+    retry_delay = 0.0
+
+    def __init__(
+        self,
+        altitudes: Optional[Sequence[int]] = None,
+        dwell: float = 60.0,
+        interval: float = 0.3,
+        tau: float = 3.0,
+        noise: float = 0.02,
+        adc_interval: float = 5.0,
+        seed: Optional[int] = None,
+        realtime: bool = False,
+    ):
+        self.altitudes = list(altitudes) if altitudes is not None else None
+        self.dwell = dwell
+        self.step = interval
+        self.tau = tau
+        self.noise = noise
+        self.adc_interval = adc_interval
+        self.realtime = realtime
+        self._rng = random.Random(seed)
+        self.reset()
+
+    @property
+    def interval(self) -> float:
+        return self.step if self.realtime else 0.0
+
+    def reset(self):
+        self.clock = 0.0
+        self.started_at = time.time()
+        self.altitude = self.altitudes[0] if self.altitudes else 0
+        self.o2 = SPEC_TABLE.lookup(self.altitude).desired_o2
+        self.exhausted = False
+        self._adc_read_at = None
+
+    def send(self, command: str) -> Optional[str]:
+        parts = command.split()
+        if parts[:2] == ["SET", "FSALT"] and len(parts) == 3:
+            self.altitude = int(parts[2])
+        return "OK"
+
+    def read(self) -> Optional[Dict]:
+        if self.exhausted:
+            return None
+        self.clock += self.step
+        if self.altitudes is not None:
+            index = int(self.clock // self.dwell)
+            if index >= len(self.altitudes):
+                self.exhausted = True
+                return None
+            self.altitude = self.altitudes[index]
+        target = SPEC_TABLE.lookup(self.altitude).desired_o2
+        self.o2 += (target - self.o2) * (1.0 - math.exp(-self.step / self.tau))
+        adc_fresh = self._adc_read_at is None or self.clock - self._adc_read_at >= self.adc_interval
+        if adc_fresh:
+            self._adc_read_at = self.clock
+        return {
+            "t": self.clock,
+            "logged_at": datetime.fromtimestamp(self.started_at + self.clock),
+            "o2_conc": self.o2 + self._rng.gauss(0.0, self.noise),
+            "altitude": self.altitude,
+            "voltage1": 0.05 * self.o2,
+            "voltage12": 0.05 * self.o2,
+            "adc_fresh": adc_fresh,
+            "blp": 1.0,
+            "timestamp": f"{self.clock:.1f}",
+            "program": "SIM",
+            "final_alt": str(self.altitude),
+            "elapsed_time": f"{self.clock:.0f}",
+            "remaining_time": "0"
+        }
+
+
+# ---------- sinks ----------
+class Sink:
+    """Base class for engine outputs; every hook is optional."""
+
+    def on_start(self, engine: "PerformanceEngine"):
+        pass
+
+    def on_sample(self, sample: Dict):
+        pass
+
+    def on_settled(self, altitude: int, settling: SettlingDetector):
+        pass
+
+    def on_verdict(self, verdict: Verdict):
+        pass
+
+    def on_drift(self, event: DriftEvent, altitude: int):
+        pass
+
+    def flush(self):
+        pass
+
+    def on_stop(self, engine: "PerformanceEngine"):
+        pass
+
+
+class CsvSink(Sink):
+    """
+    Performance log writer. Rows are buffered and written in batches (every
+    ``batch_size`` rows or ``flush_interval`` seconds) through a file handle
+    kept open for the whole run, instead of reopening the file per row.
+    ``headers`` defaults to the performance log columns; other loggers
+    (e.g. the acquisition daemon) pass their own and feed ``log_row`` lists.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        batch_size: int = 10,
+        flush_interval: float = 2.0,
+        headers: Sequence[str] = LOG_HEADERS
+    ):
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._rows: List[List] = []
+        self._last_flush = time.time()
+        self._lock = threading.Lock()
+        self._file = None
+        self._writer = None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w', newline='') as f:
+            csv.writer(f).writerow(headers)
+
+    def on_sample(self, sample: Dict):
+        with self._lock:
+            self._rows.append(sample['log_row'])
+            if len(self._rows) >= self.batch_size or time.time() - self._last_flush >= self.flush_interval:
+                self._flush_locked()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def on_stop(self, engine: "PerformanceEngine"):
+        with self._lock:
+            self._flush_locked()
+            if self._file:
+                self._file.close()
+                self._file = None
+                self._writer = None
+
+    def _flush_locked(self):
+        self._last_flush = time.time()
+        if not self._rows:
+            return
+        try:
+            if self._file is None:
+                self._file = open(self.path, 'a', newline='')
+                self._writer = csv.writer(self._file)
+            self._writer.writerows(self._rows)
+            self._file.flush()
+            self._rows.clear()
+        except Exception as e:
+            log.error(f"Error writing to CSV: {e}")
+
+
+class CallbackSink(Sink):
+    """Forward analysed samples and verdicts to plain callables (GUI front ends)."""
+
+    def __init__(self, data_callback=None, verdict_callback=None):
+        self.data_callback = data_callback
+        self.verdict_callback = verdict_callback
+
+    def on_sample(self, sample: Dict):
+        if self.data_callback:
+            self.data_callback(sample)
+
+    def on_verdict(self, verdict: Verdict):
+        if self.verdict_callback:
+            self.verdict_callback(verdict)
+
+
+class LogSink(Sink):
+    """Report settling, verdicts and drift events through a logger."""
+
+    def __init__(self, logger: logging.Logger = log):
+        self.log = logger
+
+    def on_settled(self, altitude: int, settling: SettlingDetector):
+        if settling.settled_by_cap:
+            self.log.info(f"Altitude {altitude} ft: O2 not settled, safety cap of {settling.max_seconds:.0f}s reached")
+        else:
+            elapsed = settling.settled_at - settling.step_started
+            self.log.info(
+                f"Altitude {altitude} ft: O2 settled after {elapsed:.1f}s "
+                f"(saved {settling.saved_seconds():.1f}s, {settling.total_saved:.1f}s total)"
+            )
+
+    def on_verdict(self, verdict: Verdict):
+        self.log.info(
+            f"Altitude {verdict.altitude} ft: {verdict.status} decided after {verdict.readings} readings "
+            f"({verdict.passes} passes, {verdict.reason})"
+        )
+
+    def on_drift(self, event: DriftEvent, altitude: int):
+        self.log.warning(
+            f"Sensor {event.kind} on {event.channel} at {altitude} ft: {event.direction} to "
+            f"{event.value:.3f} from baseline {event.baseline:.3f} after {event.samples} samples"
+        )
+
+
+class MetricsSink(Sink):
+    """Throughput and processing-cost counters for a run."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.samples = 0
+        self.stabilizing = 0
+        self.verdicts = 0
+        self.drift_events = 0
+        self.process_seconds = 0.0
+        self.max_process_seconds = 0.0
+        self.started = None
+        self.stopped = None
+        self.time_saved = 0.0
+        self._engine = None
+
+    def on_start(self, engine: "PerformanceEngine"):
+        self.reset()
+        self._engine = engine
+        self.started = time.perf_counter()
+
+    def on_sample(self, sample: Dict):
+        self.samples += 1
+        if sample['in_stabilization']:
+            self.stabilizing += 1
+        cost = self._engine.last_process_seconds if self._engine else 0.0
+        self.process_seconds += cost
+        self.max_process_seconds = max(self.max_process_seconds, cost)
+
+    def on_verdict(self, verdict: Verdict):
+        self.verdicts += 1
+
+    def on_drift(self, event: DriftEvent, altitude: int):
+        self.drift_events += 1
+
+    def on_stop(self, engine: "PerformanceEngine"):
+        self.stopped = time.perf_counter()
+        self.time_saved = engine.settling.total_saved
+
+    def summary(self) -> Dict[str, float]:
+        end = self.stopped if self.stopped is not None else time.perf_counter()
+        wall = end - self.started if self.started is not None else 0.0
+        return {
+            'samples': self.samples,
+            'stabilizing': self.stabilizing,
+            'verdicts': self.verdicts,
+            'drift_events': self.drift_events,
+            'wall_seconds': wall,
+            'samples_per_second': self.samples / wall if wall > 0 else 0.0,
+            'mean_process_ms': self.process_seconds / self.samples * 1000 if self.samples else 0.0,
+            'max_process_ms': self.max_process_seconds * 1000,
+            'settling_time_saved': self.time_saved,
+        }
+
+
+# ---------- engine ----------
+STABILIZING_STATS = {
+    "std_dev": 0.0,
+    "cv": 0.0,
+    "sem": 0.0,
+    "stability": 0.0,
+    "drift": 0.0
+}
+
+# Seconds after settling before drift baselines are learned. Settling only
+# requires O2 to be inside the spec band; a first-order response (tau ~3 s)
+# is still closing in on the setpoint by several noise sigmas at that point.
+DRIFT_HOLDOFF_SECONDS = 10.0
+
+
+class PerformanceEngine:
+    def __init__(
+        self,
+        source,
+        sinks: Iterable[Sink] = (),
+        interpolate_specs: bool = False,
+        kalman: bool = False
+    ):
+        self.source = source
+        self.sinks: List[Sink] = list(sinks)
+        # Interpolate desired O2 and band between table altitudes (live error during CHG ramps)
+        self.interpolate_specs = interpolate_specs
+        # Kalman-filtered O2 (estimate + variance) instead of the 12-sample average for IC95
+        self.estimator = O2Estimator() if kalman else None
+        self.running = False
+        # Rolling window behind the 12-sample average and live statistics
+        self.window_stats = RollingStats(window=12)
+        # Signal-driven settling after altitude changes; 25 s remains the safety cap
+        self.settling = SettlingDetector(max_seconds=25)
+        # Early PASS/REVIEW decision per altitude from the IC95 outcomes
+        self.sequential = SequentialTest()
+        # Streaming CUSUM/EWMA step and drift detection on O2 and ADC 1/ADC 12
+        self.drift_monitor = SensorDriftMonitor()
+        self.altitude_results: Dict[int, Dict] = {}
+        self.last_process_seconds = 0.0
+        self.reset()
+
+    def add_sink(self, sink: Sink):
+        self.sinks.append(sink)
+
+    def reset(self):
+        """Forget all per-run state (called at the start of every run)."""
+        self.window_stats.clear()
+        self.readings_at_altitude = 0
+        self.last_altitude = None
+        self.altitude_change_time = None
+        self.settling.total_saved = 0.0
+        self.drift_monitor.reset()
+        if self.estimator:
+            self.estimator.reset()
+        self.altitude_results = {alt.altitude: {
+            'passes': 0,
+            'total_readings': 0,
+            'stats': StatsAccumulator(),
+            'completed': False,
+            'verdict': None
+        } for alt in O2_SPECS}
+        self.sequential.reset()
+
+    def get_spec(self, altitude: int) -> Optional[AltitudeSpec]:
+        return SPEC_TABLE.get(altitude, interpolate=self.interpolate_specs)
+
+    def calculate_ic95(self, error: float, spec: AltitudeSpec, variance: Optional[float] = None) -> tuple[str, str]:
+        """Calculate 95% confidence interval and determine status"""
+        try:
+            if variance is not None:
+                # Filtered estimate: the interval comes straight from its covariance
+                margin_of_error = 1.96 * math.sqrt(variance)
+            else:
+                # Calculate standard error (using 1.96 for 95% CI)
+                margin_of_error = 1.96 * abs(error) / math.sqrt(self.readings_at_altitude)
+            lower_bound = error - margin_of_error
+            upper_bound = error + margin_of_error
+
+            # Check if the error range falls within acceptable limits
+            if (spec.range_min <= (spec.desired_o2 + upper_bound) <= spec.range_max and
+                    spec.range_min <= (spec.desired_o2 + lower_bound) <= spec.range_max):
+                return "PASS", "green"
+            # If initial check results in REVIEW, check error percentage
+            if abs(error) < 1.5:  # If error is less than 1.5%
+                return "PASS", "green"
+            return "REVIEW", "yellow"
+        except Exception as e:
+            log.error(f"Error calculating IC95: {e}")
+            return "ERROR", "red"
+
+    def _estimate_confident(self, error: float, spec: AltitudeSpec, variance: Optional[float]) -> bool:
+        """True when the filtered estimate's 95% interval falls wholly on one side of the IC95 decision."""
+        # Until the sensor noise has been learned the interval may be too narrow to trust
+        if variance is None or not self.estimator.noise_calibrated:
+            return False
+        margin = 1.96 * math.sqrt(variance)
+        low, high = spec.desired_o2 + error - margin, spec.desired_o2 + error + margin
+        if spec.range_min <= low and high <= spec.range_max:
+            return True
+        if abs(error) + margin < 1.5:
+            return True
+        # Confidently outside both the band and the 1.5% error allowance
+        outside_band = high < spec.range_min or low > spec.range_max
+        return outside_band and abs(error) - margin >= 1.5
+
+    def _update_settling(self, altitude: int, o2: float, now: float) -> bool:
+        """Return True while O2 is still settling after an altitude change."""
+        if self.last_altitude is None or altitude != self.last_altitude:
+            # Readings from the previous altitude no longer count
+            self.window_stats.clear()
+            self.readings_at_altitude = 0
+            self.last_altitude = altitude
+            self.altitude_change_time = now
+            self.settling.start_step(now)
+            self.drift_monitor.reset()  # New setpoint, new baseline
+            if self.estimator:
+                self.estimator.start_step()
+
+        was_settled = self.settling.settled
+        settled = self.settling.update(o2, self.get_spec(altitude), now)
+        if settled and not was_settled:
+            self._emit('on_settled', altitude, self.settling)
+        return not settled
+
+    def process(self, data: Dict) -> Optional[Dict]:
+        """Analyse one raw sample; returns the enriched sample (None outside the spec table)."""
+        started = time.perf_counter()
+        now = data.get('t', time.time())
+        altitude = data["altitude"]
+        o2 = data["o2_conc"]
+
+        in_stabilization = self._update_settling(altitude, o2, now)
+        self.readings_at_altitude += 1
+        self.window_stats.push(o2)
+        avg_o2 = self.window_stats.mean
+
+        # Baselines are learned per altitude once O2 has settled and the tail of the
+        # response has died out; only fresh voltages count
+        drift_events: List[DriftEvent] = []
+        if not in_stabilization and now - self.settling.settled_at >= DRIFT_HOLDOFF_SECONDS:
+            inputs = data if data.get('adc_fresh', True) else {'o2_conc': o2}
+            drift_events = self.drift_monitor.update(inputs)
+            for event in drift_events:
+                self._emit('on_drift', event, altitude)
+
+        spec = self.get_spec(altitude)
+        if not spec:
+            return None
+        variance = None
+        if self.estimator:
+            # Only settled readings teach the filter the sensor noise
+            avg_o2, variance = self.estimator.update(o2, spec.desired_o2, now, learn_noise=not in_stabilization)
+        error = avg_o2 - spec.desired_o2
+
+        # Only calculate statistics once O2 has settled
+        if not in_stabilization and self.window_stats.count > 1:
+            ic95_status, color = self.calculate_ic95(error, spec, variance)
+            stats = self.window_stats.statistics(spec)
+        else:
+            ic95_status, color = "STABILIZING", "yellow"
+            stats = dict(STABILIZING_STATS, median=avg_o2)
+
+        # Track altitude results for analysis
+        results = self.altitude_results.get(altitude)
+        if not in_stabilization and results is not None:
+            results['total_readings'] += 1
+            if ic95_status == "PASS":
+                results['passes'] += 1
+            results['stats'].add(stats)
+            results['completed'] = True
+            confident = self._estimate_confident(error, spec, variance)
+            verdict = self.sequential.update(altitude, ic95_status, confident)
+            if verdict:
+                results['verdict'] = verdict.status
+                self._emit('on_verdict', verdict)
+
+        sample = dict(data)
+        sample.update({
+            't': now,
+            'avg_o2': avg_o2,
+            'o2_variance': variance,
+            'error': error,
+            'ic95_status': ic95_status,
+            'color': color,
+            'in_stabilization': in_stabilization,
+            'stats': stats,
+            'spec': spec,
+            'verdict': results.get('verdict') if results else None,
+            'drift_events': drift_events,
+        })
+        # ``t`` may be a virtual clock (SimulatedSource starts at 0); the log gets wall-clock time
+        sample['log_row'] = self._log_row(sample, data.get('logged_at') or datetime.now())
+        self.last_process_seconds = time.perf_counter() - started
+        self._emit('on_sample', sample)
+        return sample
+
+    def _log_row(self, sample: Dict, logged_at: datetime) -> List:
+        spec, stats = sample['spec'], sample['stats']
+        return [
+            logged_at.strftime("%Y-%m-%d %H:%M:%S"),
+            sample["altitude"],
+            f"{spec.desired_o2:.2f}",
+            f"{sample['avg_o2']:.2f}",
+            f"{sample['error']:.2f}",
+            f"{sample['voltage1']:.3f}",
+            f"{sample['voltage12']:.3f}",
+            f"{sample['blp']:.2f}",
+            f"{spec.range_min:.2f}",
+            f"{spec.range_max:.2f}",
+            sample["program"],
+            sample["final_alt"],
+            sample["elapsed_time"],
+            sample["remaining_time"],
+            sample['ic95_status'],
+            f"{stats['median']:.2f}",
+            f"{stats['std_dev']:.3f}",
+            f"{stats['cv']:.2f}",
+            f"{stats['sem']:.3f}",
+            f"{stats['stability']:.1f}",
+            f"{stats['drift']:.3f}"
+        ]
+
+    def _emit(self, hook: str, *args):
+        for sink in self.sinks:
+            try:
+                getattr(sink, hook)(*args)
+            except Exception as e:
+                log.error(f"{type(sink).__name__}.{hook} failed: {e}")
+
+    # ---------- run loop ----------
+    def run(self):
+        """Pull samples from the source until stopped or the source is exhausted."""
+        self.running = True
+        self.reset()
+        if hasattr(self.source, 'reset'):
+            self.source.reset()
+        self._emit('on_start', self)
+        try:
+            while self.running and not self.source.exhausted:
+                loop_start = time.time()
+                try:
+                    data = self.source.read()
+                    if data is None:
+                        if self.source.retry_delay:
+                            time.sleep(self.source.retry_delay)
+                        continue
+                    self.process(data)
+                except Exception as e:
+                    log.error(f"Error in monitoring loop: {e}")
+                    if self.source.retry_delay:
+                        time.sleep(self.source.retry_delay)
+                    continue
+                # Pace polls to the source's cadence (keeps live links within their command budget)
+                remaining = self.source.interval - (time.time() - loop_start)
+                if remaining > 0:
+                    time.sleep(remaining)
+        finally:
+            self.running = False
+            self._emit('on_stop', self)
+
+    def stop(self):
+        """Ask the run loop to finish and flush buffered output now."""
+        self.running = False
+        self._emit('flush')
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, insort
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class RollingStats:
+    """
+    Constant-cost running statistics over a sliding window of samples.
+
+    - Mean and variance use Welford's update with removal support.
+    - Window sums come from a prefix-sum deque so thirds-based drift is O(1).
+    - The running median keeps a sorted copy of the window (bisect insert/remove).
+    - In-range counts are maintained incrementally against an optional band.
+
+    ``window=None`` keeps every sample until ``evict()`` is called explicitly,
+    which lets callers implement their own retention (e.g. time-based).
+    """
+
+    def __init__(
+        self,
+        window: Optional[int] = None,
+        band: Optional[Tuple[float, float]] = None,
+        track_median: bool = True,
+    ) -> None:
+        if window is not None and window <= 0:
+            raise ValueError("window must be > 0")
+        self._window = window
+        self._track_median = track_median
+        self._band = band
+        self._values: deque[float] = deque()
+        # _prefix[i] is the running total *before* _values[i]; _total is after the last value.
+        self._prefix: deque[float] = deque()
+        self._total = 0.0
+        self._sorted: List[float] = []
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._in_range = 0
+
+    @classmethod
+    def from_values(
+        cls,
+        values: Iterable[float],
+        window: Optional[int] = None,
+        band: Optional[Tuple[float, float]] = None,
+        track_median: bool = True,
+    ) -> "RollingStats":
+        stats = cls(window=window, band=band, track_median=track_median)
+        stats.extend(values)
+        return stats
+
+    # ---------- updates ----------
+    def push(self, value: float) -> None:
+        """Add a sample, evicting the oldest one if the window is full."""
+        if self._window is not None and len(self._values) >= self._window:
+            self.evict()
+        value = float(value)
+        self._values.append(value)
+        self._prefix.append(self._total)
+        self._total += value
+
+        n = len(self._values)
+        delta = value - self._mean
+        self._mean += delta / n
+        self._m2 += delta * (value - self._mean)
+
+        if self._track_median:
+            insort(self._sorted, value)
+        if self._in_band(value):
+            self._in_range += 1
+
+    def extend(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.push(value)
+
+    def evict(self) -> Optional[float]:
+        """Remove and return the oldest sample (``None`` if empty)."""
+        if not self._values:
+            return None
+        value = self._values.popleft()
+        self._prefix.popleft()
+
+        n = len(self._values)
+        if n == 0:
+            self._reset_moments()
+        else:
+            delta = value - self._mean
+            self._mean -= delta / n
+            self._m2 = max(0.0, self._m2 - delta * (value - self._mean))
+
+        if self._track_median:
+            del self._sorted[bisect_left(self._sorted, value)]
+        if self._in_band(value):
+            self._in_range -= 1
+        return value
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._prefix.clear()
+        self._sorted.clear()
+        self._reset_moments()
+        self._in_range = 0
+
+    def set_band(self, range_min: float, range_max: float) -> None:
+        """Change the in-range band; recounts only when the band actually changes."""
+        band = (range_min, range_max)
+        if band == self._band:
+            return
+        self._band = band
+        self._in_range = sum(1 for value in self._values if self._in_band(value))
+
+    # ---------- queries ----------
+    @property
+    def count(self) -> int:
+        return len(self._values)
+
+    @property
+    def mean(self) -> float:
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (n - 1 denominator), 0 with fewer than two samples."""
+        n = len(self._values)
+        return self._m2 / (n - 1) if n > 1 else 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def median(self) -> float:
+        if not self._track_median:
+            raise RuntimeError("median tracking is disabled for this instance")
+        n = len(self._sorted)
+        if n == 0:
+            return 0.0
+        mid = n // 2
+        if n % 2:
+            return self._sorted[mid]
+        return (self._sorted[mid - 1] + self._sorted[mid]) / 2.0
+
+    @property
+    def in_range(self) -> int:
+        return self._in_range
+
+    @property
+    def last(self) -> Optional[float]:
+        return self._values[-1] if self._values else None
+
+    def window_sum(self, start: int, stop: int) -> float:
+        """Sum of samples ``[start:stop]`` (non-negative indices, oldest first) in O(1)."""
+        n = len(self._values)
+        start = max(0, min(start, n))
+        stop = max(start, min(stop, n))
+        return self._prefix_at(stop) - self._prefix_at(start)
+
+    def drift(self) -> float:
+        """Mean of the last third minus mean of the first third (same slicing as before)."""
+        n = len(self._values)
+        if n < 3:
+            return 0.0
+        head = n // 3
+        tail = -((-n) // 3)  # len(values[-n//3:])
+        first_third = self.window_sum(0, head) / head
+        last_third = self.window_sum(n - tail, n) / tail
+        return last_third - first_third
+
+    def values(self) -> List[float]:
+        return list(self._values)
+
+    def statistics(self, spec) -> Dict[str, float]:
+        """
+        Return the same dictionary as ``PerformanceMonitor.calculate_statistics``
+        for an ``AltitudeSpec``-like object, without rescanning the window.
+        """
+        self.set_band(spec.range_min, spec.range_max)
+        n = len(self._values)
+        mean = self._mean
+        std_dev = self.stdev if n > 1 else 0
+        return {
+            "mean": mean,
+            "median": self.median if self._track_median else mean,
+            "std_dev": std_dev,
+            "error": mean - spec.desired_o2,
+            "cv": (std_dev / mean) * 100 if mean != 0 else 0,
+            "sem": std_dev / math.sqrt(n) if n > 1 else 0,
+            "stability": (self._in_range / n) * 100 if n else 0.0,
+            "drift": self.drift(),
+        }
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    # ---------- internal ----------
+    def _prefix_at(self, index: int) -> float:
+        return self._total if index >= len(self._prefix) else self._prefix[index]
+
+    def _in_band(self, value: float) -> bool:
+        return self._band is not None and self._band[0] <= value <= self._band[1]
+
+    def _reset_moments(self) -> None:
+        self._mean = 0.0
+        self._m2 = 0.0
+        # Rebase the prefix sums whenever the window empties to bound float growth.
+        self._total = 0.0
+
+
+class StatsAccumulator:
+    """
+    Running per-key averages of ``RollingStats.statistics`` dictionaries.
+
+    Replaces an ever-growing list of per-sample dictionaries: memory stays
+    constant however many samples are added, and ``mean()`` gives the same
+    averages the list would have produced.
+    """
+
+    def __init__(self) -> None:
+        self._sums: Dict[str, float] = {}
+        self._count = 0
+
+    def add(self, stats: Dict[str, float]) -> None:
+        for key, value in stats.items():
+            self._sums[key] = self._sums.get(key, 0.0) + value
+        self._count += 1
+
+    def mean(self) -> Dict[str, float]:
+        if not self._count:
+            return {}
+        return {key: total / self._count for key, total in self._sums.items()}
+
+    def clear(self) -> None:
+        self._sums.clear()
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
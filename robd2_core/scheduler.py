@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Dict, Optional
+
+from .rolling_stats import RollingStats
+
+
+class FixedRateScheduler:
+    """
+    Fixed-rate loop timing on monotonic deadlines.
+
+    Tick ``k`` is due at ``start + k * interval``, so the time a loop spends
+    working never pushes later ticks back and the long-run rate stays exact.
+    ``wait`` blocks on an ``Event`` until the next deadline (no polling);
+    when a loop overruns one or more whole periods the missed slots are
+    skipped and counted rather than fired back to back. Wake-up lateness is
+    kept over the last ``window`` ticks as the jitter figure.
+    """
+
+    def __init__(self, interval: float, stop_event: Optional[threading.Event] = None, window: int = 300):
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        self.interval = interval
+        self.stop_event = stop_event if stop_event is not None else threading.Event()
+        self._lateness_ms = RollingStats(window=window, track_median=False)
+        self.reset()
+
+    def reset(self) -> None:
+        self.started: Optional[float] = None
+        self.last_tick: Optional[float] = None
+        self._next_due: Optional[float] = None
+        self.ticks = 0
+        self.missed = 0
+        self._lateness_ms.clear()
+
+    def wait(self) -> bool:
+        """Sleep until the next tick; returns False if ``stop_event`` was set meanwhile."""
+        now = time.monotonic()
+        if self._next_due is None:
+            self.started = self._next_due = now
+        elif now - self._next_due >= self.interval:
+            skipped = int((now - self._next_due) // self.interval)
+            self.missed += skipped
+            self._next_due += skipped * self.interval
+        delay = self._next_due - now
+        if delay > 0 and self.stop_event.wait(delay):
+            return False
+        if self.stop_event.is_set():
+            return False
+        self.last_tick = time.monotonic()
+        self._lateness_ms.push(max(0.0, self.last_tick - self._next_due) * 1000)
+        self.ticks += 1
+        self._next_due += self.interval
+        return True
+
+    def stop(self) -> None:
+        self.stop_event.set()
+
+    @property
+    def achieved_rate(self) -> float:
+        """Ticks per second between the first and latest tick (0 until two ticks have run)."""
+        if self.started is None or self.ticks < 2:
+            return 0.0
+        elapsed = self.last_tick - self.started
+        return (self.ticks - 1) / elapsed if elapsed > 0 else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        lateness = self._lateness_ms
+        return {
+            'interval': self.interval,
+            'ticks': self.ticks,
+            'missed': self.missed,
+            'target_hz': 1.0 / self.interval,
+            'achieved_hz': self.achieved_rate,
+            'jitter_mean_ms': lateness.mean,
+            'jitter_std_ms': lateness.stdev,
+            'jitter_max_ms': max(lateness.values(), default=0.0),
+        }
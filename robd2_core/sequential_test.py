@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+
+@dataclass
+class Verdict:
+    altitude: int
+    status: str  # "PASS" or "REVIEW"
+    readings: int
+    passes: int
+    llr: float
+    reason: str
+
+
+class SequentialTest:
+    """
+    Wald sequential probability ratio test over per-reading IC95 outcomes.
+
+    Each post-settling reading is a Bernoulli trial (PASS / not PASS) from
+    ``calculate_ic95``. The log-likelihood ratio of "good unit" (PASS rate
+    ``p_good``) against "bad unit" (PASS rate ``p_bad``) is accumulated and a
+    verdict is issued as soon as it crosses a Wald boundary:
+
+    - PASS once ``llr >= log((1 - beta) / alpha)`` and at least ``min_passes``
+      readings passed (the same >= 3 rule the final report applies);
+    - REVIEW once ``llr <= log(beta / (1 - alpha))``.
+
+    ``max_readings`` truncates the test; at that point the classic
+    ``passes >= min_passes`` rule decides. Readings from the rolling 12-sample
+    average are correlated, so ``stride`` only counts every n-th reading to
+    keep the trials closer to independent.
+
+    Readings flagged ``confident`` (the Kalman estimate's 95% interval lies
+    entirely on one side of the decision) are counted without the stride,
+    and ``min_passes`` consecutive confident readings with the same outcome
+    decide the altitude directly.
+
+    A verdict is advisory: it tells the operator (or ``performance_runner``)
+    when enough evidence is in to advance. The final report still passes an
+    altitude on the ``passes >= min_passes`` count over all its readings
+    and lists the verdict next to it.
+    """
+
+    def __init__(
+        self,
+        p_good: float = 0.95,
+        p_bad: float = 0.6,
+        alpha: float = 0.05,
+        beta: float = 0.05,
+        min_passes: int = 3,
+        max_readings: int = 60,
+        stride: int = 2,
+    ) -> None:
+        if not 0.0 < p_bad < p_good < 1.0:
+            raise ValueError("require 0 < p_bad < p_good < 1")
+        if not (0.0 < alpha < 1.0 and 0.0 < beta < 1.0):
+            raise ValueError("alpha and beta must be in (0, 1)")
+        self.min_passes = min_passes
+        self.max_readings = max_readings
+        self.stride = max(1, stride)
+        self.upper = math.log((1.0 - beta) / alpha)
+        self.lower = math.log(beta / (1.0 - alpha))
+        self._pass_step = math.log(p_good / p_bad)
+        self._fail_step = math.log((1.0 - p_good) / (1.0 - p_bad))
+        self._state: Dict[int, Dict[str, float]] = {}
+        self.verdicts: Dict[int, Verdict] = {}
+
+    def reset(self, altitude: Optional[int] = None) -> None:
+        """Forget the evidence for one altitude, or for all of them."""
+        if altitude is None:
+            self._state.clear()
+            self.verdicts.clear()
+        else:
+            self._state.pop(altitude, None)
+            self.verdicts.pop(altitude, None)
+
+    def verdict(self, altitude: int) -> Optional[Verdict]:
+        return self.verdicts.get(altitude)
+
+    def update(self, altitude: int, ic95_status: str, confident: bool = False) -> Optional[Verdict]:
+        """
+        Record one reading and return a ``Verdict`` the first time the
+        altitude is decided; ``None`` otherwise (including after a decision).
+        """
+        if altitude in self.verdicts:
+            return None
+        state = self._state.setdefault(
+            altitude, {"seen": 0, "readings": 0, "passes": 0, "llr": 0.0, "streak": 0, "last": None}
+        )
+        state["seen"] += 1
+        if confident:
+            state["streak"] = state["streak"] + 1 if state["last"] == ic95_status else 1
+            state["last"] = ic95_status
+        else:
+            state["streak"], state["last"] = 0, None
+            if (state["seen"] - 1) % self.stride:
+                return None
+
+        state["readings"] += 1
+        if ic95_status == "PASS":
+            state["passes"] += 1
+            state["llr"] += self._pass_step
+        else:
+            state["llr"] += self._fail_step
+
+        readings, passes, llr = state["readings"], state["passes"], state["llr"]
+        if state["streak"] >= self.min_passes:
+            status = "PASS" if ic95_status == "PASS" else "REVIEW"
+            if status == "REVIEW" or passes >= self.min_passes:
+                return self._decide(altitude, status, "filtered estimate confident")
+        if llr >= self.upper and passes >= self.min_passes:
+            return self._decide(altitude, "PASS", "evidence threshold reached")
+        if llr <= self.lower:
+            return self._decide(altitude, "REVIEW", "evidence threshold reached")
+        if readings >= self.max_readings:
+            status = "PASS" if passes >= self.min_passes else "REVIEW"
+            return self._decide(altitude, status, "reading limit reached")
+        return None
+
+    def _decide(self, altitude: int, status: str, reason: str) -> Verdict:
+        state = self._state[altitude]
+        verdict = Verdict(
+            altitude=altitude,
+            status=status,
+            readings=int(state["readings"]),
+            passes=int(state["passes"]),
+            llr=state["llr"],
+            reason=reason,
+        )
+        self.verdicts[altitude] = verdict
+        return verdict
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from typing import Optional, Tuple
+
+
+class SettlingDetector:
+    """
+    Online detector that decides when O2 has settled after an altitude change.
+
+    A step is declared settled once the last ``window`` samples are all inside
+    the spec band, their spread is small relative to the band and their
+    least-squares slope would not move the value by more than a fraction of
+    the band over the window. A first-order response passes that check while
+    it is still closing in on the setpoint, so the check has to keep passing
+    on every sample across ``confirm_windows`` back-to-back windows before
+    the step counts as settled. ``max_seconds`` is kept as a safety cap so a
+    noisy unit never waits longer than the old fixed stabilization period.
+    """
+
+    def __init__(
+        self,
+        window: int = 8,
+        min_seconds: float = 2.0,
+        max_seconds: float = 25.0,
+        std_fraction: float = 0.5,
+        slope_fraction: float = 0.5,
+        confirm_windows: int = 2,
+    ) -> None:
+        if window < 3:
+            raise ValueError("window must be >= 3")
+        if confirm_windows < 1:
+            raise ValueError("confirm_windows must be >= 1")
+        self.window = window
+        self.min_seconds = min_seconds
+        self.max_seconds = max_seconds
+        self.std_fraction = std_fraction
+        self.slope_fraction = slope_fraction
+        # Consecutive passing checks needed: the first window plus the confirming ones
+        self.confirm_checks = (confirm_windows - 1) * window + 1
+        self._passing = 0
+        self._samples: deque[Tuple[float, float]] = deque(maxlen=window)
+        self.step_started: Optional[float] = None
+        self.settled_at: Optional[float] = None
+        self.settled_by_cap = False
+        self.total_saved = 0.0
+
+    def start_step(self, now: Optional[float] = None) -> None:
+        """Reset for a new altitude step starting at ``now``."""
+        self._samples.clear()
+        self._passing = 0
+        self.step_started = time.time() if now is None else now
+        self.settled_at = None
+        self.settled_by_cap = False
+
+    @property
+    def settled(self) -> bool:
+        return self.settled_at is not None
+
+    def elapsed(self, now: Optional[float] = None) -> float:
+        if self.step_started is None:
+            return 0.0
+        now = time.time() if now is None else now
+        return now - self.step_started
+
+    def remaining(self, now: Optional[float] = None) -> float:
+        """Seconds left before the safety cap forces the step to settle."""
+        return max(0.0, self.max_seconds - self.elapsed(now))
+
+    def saved_seconds(self) -> float:
+        """Time saved on the current step compared with the fixed cap."""
+        if self.settled_at is None or self.step_started is None:
+            return 0.0
+        return max(0.0, self.max_seconds - (self.settled_at - self.step_started))
+
+    def update(self, value: Optional[float], spec=None, now: Optional[float] = None) -> bool:
+        """
+        Feed one O2 sample and return ``True`` once the step has settled.
+
+        ``spec`` is an ``AltitudeSpec``-like object providing ``range_min`` and
+        ``range_max``. Without a spec or a value only the safety cap applies.
+        Once settled, the step stays settled until ``start_step()`` is called.
+        """
+        now = time.time() if now is None else now
+        if self.step_started is None:
+            self.start_step(now)
+        if self.settled_at is not None:
+            return True
+
+        if value is not None:
+            self._samples.append((now, float(value)))
+
+        elapsed = now - self.step_started
+        if elapsed >= self.max_seconds:
+            self.settled_at = now
+            self.settled_by_cap = True
+            return True
+        if spec is None or elapsed < self.min_seconds:
+            return False
+
+        self._passing = self._passing + 1 if self._is_settled(spec.range_min, spec.range_max) else 0
+        if self._passing >= self.confirm_checks:
+            self.settled_at = now
+            self.total_saved += self.saved_seconds()
+            return True
+        return False
+
+    def _is_settled(self, range_min: float, range_max: float) -> bool:
+        n = len(self._samples)
+        if n < self.window:
+            return False
+        half_width = (range_max - range_min) / 2.0
+        if half_width <= 0:
+            return False
+
+        # In-band check on every sample of the window
+        for _, value in self._samples:
+            if not range_min <= value <= range_max:
+                return False
+
+        t0 = self._samples[0][0]
+        sum_t = sum_v = sum_tt = sum_tv = sum_vv = 0.0
+        for t, value in self._samples:
+            dt = t - t0
+            sum_t += dt
+            sum_v += value
+            sum_tt += dt * dt
+            sum_tv += dt * value
+            sum_vv += value * value
+
+        # Spread relative to the band
+        mean = sum_v / n
+        variance = max(0.0, (sum_vv - n * mean * mean) / (n - 1))
+        if math.sqrt(variance) > self.std_fraction * half_width:
+            return False
+
+        # Least-squares slope; the projected change over the window must stay small
+        span = self._samples[-1][0] - t0
+        denom = n * sum_tt - sum_t * sum_t
+        if span <= 0 or denom <= 0:
+            return False
+        slope = (n * sum_tv - sum_t * sum_v) / denom
+        return abs(slope) * span <= self.slope_fraction * half_width
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+ArrayLike = Union[Sequence[float], np.ndarray]
+
+
+def moving_average(values: ArrayLike, window: int) -> np.ndarray:
+    """
+    Trailing moving average computed from a cumulative sum in O(n).
+
+    The first ``window - 1`` points average over the samples available so far,
+    matching the dashboard's original shrinking-window behaviour. NaN samples
+    (gaps ``DataStore`` pads in) are skipped: each point averages the valid
+    samples in its window and is NaN only when the whole window is missing.
+    """
+    arr = np.asarray(values, dtype=float)
+    if window <= 1 or arr.size == 0:
+        return arr
+    valid = ~np.isnan(arr)
+    csum = np.concatenate(([0.0], np.cumsum(np.where(valid, arr, 0.0))))
+    count = np.concatenate(([0], np.cumsum(valid)))
+    idx = np.arange(1, arr.size + 1)
+    start = np.maximum(0, idx - window)
+    n = count[idx] - count[start]
+    out = np.full(arr.size, np.nan)
+    np.divide(csum[idx] - csum[start], n, out=out, where=n > 0)
+    return out
+
+
+def ema(values: ArrayLike, alpha: float | None = None, span: int | None = None) -> np.ndarray:
+    """
+    Exponential moving average seeded with the first sample.
+
+    Pass either ``alpha`` in (0, 1] or a pandas-style ``span`` (alpha = 2 / (span + 1)).
+    """
+    if alpha is None:
+        if span is None or span < 1:
+            raise ValueError("provide alpha or span >= 1")
+        alpha = 2.0 / (span + 1.0)
+    if not 0.0 < alpha <= 1.0:
+        raise ValueError("alpha must be in (0, 1]")
+    arr = np.asarray(values, dtype=float)
+    if arr.size == 0 or alpha == 1.0:
+        return arr
+    # Closed form: y[i] = (1-a)^i * x0 + a * sum_k (1-a)^(i-k) x[k], evaluated
+    # block-wise so the decay powers never underflow on long series.
+    out = np.empty_like(arr)
+    decay = 1.0 - alpha
+    block = max(1, int(np.log(1e-12) / np.log(decay))) if decay > 0 else arr.size
+    prev = arr[0]
+    for start in range(0, arr.size, block):
+        chunk = arr[start : start + block]
+        n = chunk.size
+        powers = decay ** np.arange(1, n + 1)
+        weights = alpha * chunk / powers
+        if start == 0:
+            weights[0] = chunk[0] / powers[0]
+            out[:n] = np.cumsum(weights) * powers
+        else:
+            out[start : start + n] = (prev + np.cumsum(weights)) * powers
+        prev = out[start + n - 1]
+    return out
+
+
+def median_filter(values: ArrayLike, window: int) -> np.ndarray:
+    """Trailing median filter; the first points use the samples available so far."""
+    arr = np.asarray(values, dtype=float)
+    if window <= 1 or arr.size == 0:
+        return arr
+    window = min(window, arr.size)
+    out = np.empty_like(arr)
+    out[window - 1 :] = np.median(sliding_window_view(arr, window), axis=1)
+    head = window - 1
+    if head:
+        # Row i holds the first i + 1 samples padded with +inf, so after sorting
+        # its median sits at the middle of the first i + 1 columns
+        first = arr[:head]
+        rows = np.where(np.tri(head, dtype=bool), first, np.inf)
+        rows.sort(axis=1)
+        counts = np.arange(1, head + 1)
+        lower = rows[np.arange(head), (counts - 1) // 2]
+        upper = rows[np.arange(head), counts // 2]
+        out[:head] = (lower + upper) / 2.0
+        # np.median propagates NaN; so does the head
+        out[:head][np.logical_or.accumulate(np.isnan(first))] = np.nan
+    return out
+
+
+def resample(times: ArrayLike, values: ArrayLike, interval: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Linearly interpolate an irregularly sampled series onto a fixed grid.
+
+    Returns ``(grid_times, grid_values)`` spanning the first to last timestamp.
+    """
+    if interval <= 0:
+        raise ValueError("interval must be > 0")
+    t = np.asarray(times, dtype=float)
+    v = np.asarray(values, dtype=float)
+    if t.size != v.size:
+        raise ValueError("times and values must have the same length")
+    if t.size < 2:
+        return t.copy(), v.copy()
+    grid = np.arange(t[0], t[-1] + interval * 0.5, interval)
+    return grid, np.interp(grid, t, v)
+
+
+def tail(values: ArrayLike, max_points: int) -> np.ndarray:
+    """Last ``max_points`` samples as an array view."""
+    arr = np.asarray(values, dtype=float)
+    return arr[-max_points:] if arr.size > max_points else arr
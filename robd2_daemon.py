@@ -0,0 +1,51 @@
+"""
+Headless ROBD2 acquisition daemon for soak tests and unattended training days.
+
+Polls GET RUN ALL at a fixed rate with no GUI and writes everything to
+``--output``: the batched sample log (``ROBD2_daemon_*.csv``),
+``alarms.csv``, ``health.json`` (refreshed by the watchdog) and
+``daemon.log``. Stops cleanly on Ctrl+C / SIGTERM or after ``--duration``.
+
+Examples:
+
+    python robd2_daemon.py --port COM8 --output soak_logs
+    python robd2_daemon.py --demo --interval 0.5 --duration 60
+"""
+import argparse
+import logging
+import signal
+from pathlib import Path
+
+from log_pipeline import configure_logging
+from robd2_core.daemon import AcquisitionDaemon, DemoPort, SerialPort
+
+log = logging.getLogger("robd2_daemon")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Headless ROBD2 acquisition daemon')
+    parser.add_argument('--port', default='COM8', help='COM port of the ROBD2')
+    parser.add_argument('--baudrate', type=int, default=9600, help='Baudrate')
+    parser.add_argument('--demo', action='store_true', help='Synthesize RUN ALL replies instead of opening a port')
+    parser.add_argument('--output', type=Path, default=Path('daemon_logs'), help='Directory for logs, alarms and health')
+    parser.add_argument('--interval', type=float, default=1.0, help='Seconds between RUN ALL polls')
+    parser.add_argument('--health-interval', type=float, default=10.0, help='Seconds between health.json updates')
+    parser.add_argument('--duration', type=float, default=None, help='Stop after this many seconds')
+    args = parser.parse_args()
+
+    args.output.mkdir(parents=True, exist_ok=True)
+    configure_logging(
+        [logging.FileHandler(args.output / 'daemon.log'), logging.StreamHandler()],
+        root_level=logging.INFO,
+        fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
+    port = DemoPort() if args.demo else SerialPort(args.port, args.baudrate)
+    daemon = AcquisitionDaemon(port, args.output, interval=args.interval, health_interval=args.health_interval)
+    signal.signal(signal.SIGTERM, lambda signum, frame: daemon.stop())
+    try:
+        daemon.run(duration=args.duration)
+    except KeyboardInterrupt:
+        daemon.stop()
+    log.info(f"Scheduler: {daemon.scheduler.stats()}")
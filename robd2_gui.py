@@ -1,3 +1,7 @@
+import time
+
+_import_started = time.perf_counter()
+
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 import sys
@@ -5,23 +9,23 @@ import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from matplotlib.figure import Figure
 import csv
-import time
 import threading
 
-from data_store import DataStore
+# matplotlib/numpy (dashboard, gas calculator, performance tab), rich (calibration,
+# flight logger) and the tab modules are imported where they are first used
+from robd2_core.data_store import DataStore
 from modern_widgets import ModernFrame, ModernButton, ModernLabelFrame
 from windows import ChecklistWindow, ScriptViewerWindow, LoadingIndicator
-from serial_comm import SerialCommunicator
-from calibration_data import CalibrationMonitor
-from Performance import PerformanceMonitor
-from COM_serial import DataLogger
-from program_manager import ProgramManager
-from performance_gui import PerformanceTab
-from gas_calculator_tab import GasCalculatorTab
+from robd2_core.serial_comm import SerialCommunicator
+from robd2_core.device_state import DeviceStateCache
+from acquisition_worker import AcquisitionWorker
+from ui_bus import RingTextView, UIUpdateBus
+from startup_profile import StartupProfile
+from log_pipeline import configure_logging
+
+STARTUP = StartupProfile(started=_import_started)
+STARTUP.checkpoint('import', "core modules")
 
 # Create logs directory if it doesn't exist
 logs_dir = Path("logs")
@@ -47,18 +51,11 @@ def setup_logging():
         datefmt='%Y-%m-%d %H:%M:%S'
     ))
     
-    # Configure root logger
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S',
-        handlers=[file_handler, console_handler]
-    )
-    
-    return file_handler
+    # Both handlers run on the pipeline's listener thread; loggers only enqueue
+    return configure_logging([file_handler, console_handler])
 
-# Setup logging and get file handler reference
-debug_file_handler = setup_logging()
+# Setup logging and keep the pipeline to flush it on exit
+log_pipeline = setup_logging()
 log = logging.getLogger("robd2_gui")
 
 # Log application startup
@@ -66,6 +63,18 @@ log.info("ROBD2 GUI Application starting up")
 log.info(f"Debug logs will be saved to: {logs_dir}")
 log.debug("Debug logging enabled - all debug messages will be saved to file")
 
+# Dashboard poll period and how often the Tk thread drains acquisition results
+DASHBOARD_POLL_SECONDS = 5.0
+UI_TICK_MS = 100
+UI_FPS = 15
+LOG_PANE_LINES = 500
+
+# Calibration points recorded by record_room_air_calibration / record_pure_o2_calibration
+CALIBRATION_POINTS = {
+    'room_air': {'title': "Room Air", 'label': "Room air", 'status': "Recording room air values..."},
+    'pure_o2': {'title': "100% O2", 'label': "100% O2", 'status': "Recording 100% O2 values..."},
+}
+
 class ROBD2GUI:
     def __init__(self, root):
         """Initialize the GUI"""
@@ -83,6 +92,14 @@ class ROBD2GUI:
         # Initialize serial communicator
         self.serial_comm = SerialCommunicator()
         
+        # Device I/O for the dashboard and calibration recorders runs on this worker;
+        # results come back through its queue and are applied on the UI tick
+        self.acquisition = AcquisitionWorker(self.serial_comm)
+        self.acquisition.start()
+        
+        # Last-known device settings (program names), filled in by worker jobs
+        self.device_state = DeviceStateCache()
+        
         # Create the main frame
         main_frame = ModernFrame(root)
         main_frame.pack(fill=tk.BOTH, expand=True)
@@ -101,16 +118,23 @@ class ROBD2GUI:
         self.status_bar = ttk.Label(status_frame, text="Not connected", anchor=tk.W)
         self.status_bar.pack(fill=tk.X, side=tk.LEFT, padx=5)
         
-        # Create tabs
-        self.create_gas_calculator_tab()  # Add the gas calculator tab first
-        self.create_connection_tab()
-        self.create_calibration_tab()
-        self.create_performance_tab()
-        self.create_training_tab()
-        self.create_dashboard_tab()
-        self.create_diagnostics_tab()
-        self.create_programming_tab()
-        self.create_logging_tab()
+        # Dashboard plot frame time (filled in by update_plots)
+        self.frame_time_label = ttk.Label(status_frame, text="", anchor=tk.E)
+        self.frame_time_label.pack(side=tk.RIGHT, padx=5)
+        
+        # Create tabs: each starts as a placeholder and is built on first selection.
+        # The connection tab is built now because the menu and shortcuts use it.
+        self._tab_builders = {}
+        self.add_lazy_tab("Gas Calculator", self.create_gas_calculator_tab)  # Add the gas calculator tab first
+        self.add_lazy_tab("Connection", self.create_connection_tab)
+        self.add_lazy_tab("Calibration", self.create_calibration_tab)
+        self.add_lazy_tab("Performance", self.create_performance_tab)
+        self.add_lazy_tab("Training", self.create_training_tab)
+        self.add_lazy_tab("Dashboard", self.create_dashboard_tab)
+        self.add_lazy_tab("Diagnostics", self.create_diagnostics_tab)
+        self.add_lazy_tab("Programming", self.create_programming_tab)
+        self.add_lazy_tab("Logging", self.create_logging_tab)
+        self.ensure_tab("Connection")
         
         # Add tab selection callback to handle starting/stopping data collection
         self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
@@ -124,6 +148,67 @@ class ROBD2GUI:
         # Track the after event ID
         self.poll_after_id = None
         
+        # Apply acquisition results on a fixed UI tick
+        self.acquisition_handlers = {
+            'dashboard': self._on_dashboard_sample,
+            'calibration_sample': self._on_calibration_sample,
+            'calibration': self._on_calibration_done,
+        }
+        self.acquisition_after_id = self.root.after(UI_TICK_MS, self._drain_acquisition_events)
+        
+        # Batched, frame-rate-limited updates from producer threads (flight data logger)
+        self.ui_bus = UIUpdateBus(self.root, fps=UI_FPS)
+        self.ui_bus.subscribe('log_lines', self._apply_log_lines)
+        self.ui_bus.start()
+        
+        STARTUP.checkpoint('init', "main window")
+        self.root.after_idle(self._finish_startup)
+        
+    def add_lazy_tab(self, text, builder):
+        """Add a placeholder tab whose content ``builder`` creates on first selection"""
+        placeholder = ModernFrame(self.notebook)
+        ttk.Label(placeholder, text="Loading...").pack(expand=True)
+        self.notebook.add(placeholder, text=text)
+        self._tab_builders[text] = (placeholder, builder)
+        
+    def ensure_tab(self, text):
+        """Build the tab ``text`` if it is still a placeholder (no-op otherwise)"""
+        entry = self._tab_builders.pop(text, None)
+        if entry is None:
+            return
+        placeholder, builder = entry
+        with STARTUP.measure('tab', text):
+            index = self.notebook.index(placeholder)
+            selected = self.notebook.select() == str(placeholder)
+            
+            # Builders add their frame at the end; move it into the placeholder's slot
+            builder()
+            frame = self.notebook.tabs()[-1]
+            self.notebook.insert(index, frame)
+            if selected:
+                self.notebook.select(frame)
+            self.notebook.forget(placeholder)
+            placeholder.destroy()
+        log.info(f"Built {text} tab in {STARTUP.entries[-1][2]:.0f} ms")
+        
+    def _finish_startup(self):
+        """First idle moment of the main loop: report start-up, then build the visible tab"""
+        STARTUP.mark_interactive()
+        log.info(STARTUP.report())
+        self.ensure_tab(self.notebook.tab(self.notebook.select(), "text"))
+        
+    def show_startup_report(self):
+        """Show the start-up and tab build timings"""
+        messagebox.showinfo("Startup Timing", STARTUP.report())
+        
+    def _sync_connection_state(self):
+        """Enable or disable the device features on the tabs built so far (the rest pick it up when built)"""
+        state = tk.NORMAL if self.serial_comm.is_connected else tk.DISABLED
+        if hasattr(self, 'start_calibration_btn'):
+            self.start_calibration_btn.configure(state=state)
+        if hasattr(self, 'start_logging_btn'):
+            self.start_logging_btn.configure(state=state)
+        
     def enable_scrolling(self, widget):
         """Enable mouse wheel scrolling for a widget"""
         def _on_mousewheel(event):
@@ -203,6 +288,8 @@ class ROBD2GUI:
 
     def create_gas_calculator_tab(self):
         """Create the gas calculator tab"""
+        with STARTUP.measure('import', "gas_calculator_tab"):
+            from gas_calculator_tab import GasCalculatorTab
         gas_calculator_tab = GasCalculatorTab(self.notebook)
         self.notebook.add(gas_calculator_tab, text="Gas Calculator")
         
@@ -239,6 +326,7 @@ class ROBD2GUI:
         help_menu = tk.Menu(self.menu_bar, tearoff=0)
         self.menu_bar.add_cascade(label="Help", menu=help_menu)
         help_menu.add_command(label="Documentation", command=self.show_documentation)
+        help_menu.add_command(label="Startup Timing", command=self.show_startup_report)
         help_menu.add_command(label="About", command=self.show_about)
         
     def add_keyboard_shortcuts(self):
@@ -278,8 +366,7 @@ class ROBD2GUI:
                 self.port_combo.configure(state=tk.DISABLED)
                 
                 # Enable features
-                self.start_calibration_btn.configure(state=tk.NORMAL)
-                self.start_logging_btn.configure(state=tk.NORMAL)
+                self._sync_connection_state()
                 
                 # Update status
                 self.status_bar.configure(text=f"Connected to {port}")
@@ -313,15 +400,19 @@ class ROBD2GUI:
             self.port_combo.configure(state=tk.NORMAL)
             
             # Disable features
-            self.start_calibration_btn.configure(state=tk.DISABLED)
-            self.start_logging_btn.configure(state=tk.DISABLED)
+            self._sync_connection_state()
+            
+            # Cached settings may belong to a different unit next time
+            self.device_state.clear()
+            if hasattr(self, 'program_manager'):
+                self.program_manager.cancel_program_fetch()
             
             # Update status
             self.status_bar.configure(text="Disconnected")
             self.status_text.insert(tk.END, f"{datetime.now().strftime('%H:%M:%S')} - Disconnected\n")
             
             # Stop data collection if active
-            self.plotting_active = False
+            self.stop_data_collection()
         else:
             messagebox.showerror("Error", message)
             
@@ -340,7 +431,8 @@ class ROBD2GUI:
     def poll_responses(self):
         """Poll for responses from the device"""
         try:
-            response = self.serial_comm.get_response()
+            # Leave the port to the acquisition worker while it waits for a reply
+            response = None if self.acquisition.busy else self.serial_comm.get_response()
             if response:
                 self.response_text.insert(tk.END, f"{datetime.now().strftime('%H:%M:%S')} ← {response}\n")
                 self.response_text.see(tk.END)
@@ -364,6 +456,7 @@ class ROBD2GUI:
             
         # Run calibration in a separate thread
         def run_calibration():
+            from calibration_data import CalibrationMonitor
             monitor = CalibrationMonitor(self.serial_comm.serial_port)
             monitor.device_id = device_id
             
@@ -382,6 +475,8 @@ class ROBD2GUI:
                 
     def start_logging(self):
         """Start flight data logging"""
+        # Ctrl+S can arrive before the logging tab was ever opened
+        self.ensure_tab("Logging")
         if not self.serial_comm.is_connected:
             messagebox.showerror("Error", "Not connected to device")
             return
@@ -408,38 +503,22 @@ class ROBD2GUI:
         file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
         log.addHandler(file_handler)
         
-        # Create a custom list class for communications
-        class LoggingList(list):
-            def __init__(self, *args, **kwargs):
-                super().__init__(*args, **kwargs)
-                self.callback = None
-                
-            def append(self, item):
-                super().append(item)
-                if self.callback:
-                    self.callback(item)
-                    
-        # Run logging in a separate thread
+        # Run logging in a separate thread; its messages reach the log pane through the UI bus
         def run_logging():
-            self.data_logger = DataLogger(self.serial_comm.serial_port, [])
-            
-            # Create custom list for communications
-            self.data_logger.communications = LoggingList()
-            
-            # Update the log display
-            def update_log(message):
-                self.log_text.insert(tk.END, f"{message}\n")
-                self.log_text.see(tk.END)
-                log.info(message)
-                
-            # Set the callback for the custom list
-            self.data_logger.communications.callback = update_log
+            from COM_serial import DataLogger
+            self.data_logger = DataLogger(self.serial_comm.serial_port, self.ui_bus.feed('log_lines'))
             
             # Start logging (blocking call in the thread)
             self.data_logger.start_logging(flight_id)
         
         threading.Thread(target=run_logging, daemon=True).start()
         
+    def _apply_log_lines(self, messages):
+        """Show the logger messages received since the last frame"""
+        self.log_view.extend(messages)
+        for message in messages:
+            log.info(message)
+        
     def stop_logging(self):
         """Stop flight data logging"""
         if hasattr(self, 'data_logger'):
@@ -835,12 +914,33 @@ For more information, please refer to the ROBD2 Technical Manual.
             return
             
         try:
-            # Get current data
-            time_data, altitude_data = self.data_store.get_data('altitude')
-            _, o2_data = self.data_store.get_data('o2_conc')
-            _, blp_data = self.data_store.get_data('blp')
-            _, spo2_data = self.data_store.get_data('spo2')
-            _, pulse_data = self.data_store.get_data('pulse')
+            # Optional visual-only smoothing (vectorized moving average)
+            try:
+                smoothing = max(1, int(self.smoothing_var.get()))
+            except ValueError:
+                smoothing = 1
+            time_scale = float(self.time_scale_var.get())
+            
+            # Current data (memoized on the store's version); skip the redraw
+            # entirely when neither the data nor the view changed
+            version, frame = self.data_store.figure_snapshot(('altitude', 'o2_conc', 'blp', 'spo2', 'pulse'))
+            render_key = (version, smoothing, time_scale)
+            if render_key == self._plotted_key:
+                return
+            time_data = frame['time']
+            altitude_data = frame['altitude']
+            o2_data = frame['o2_conc']
+            blp_data = frame['blp']
+            spo2_data = frame['spo2']
+            pulse_data = frame['pulse']
+            
+            if smoothing > 1:
+                from robd2_core.signal_filters import moving_average
+                altitude_data = moving_average(altitude_data, smoothing)
+                o2_data = moving_average(o2_data, smoothing)
+                blp_data = moving_average(blp_data, smoothing)
+                spo2_data = moving_average(spo2_data, smoothing)
+                pulse_data = moving_average(pulse_data, smoothing)
             
             # Update plot data
             self.plot_data['time'] = time_data
@@ -857,26 +957,39 @@ For more information, please refer to the ROBD2 Technical Manual.
             self.spo2_line.set_data(time_data, spo2_data)
             self.pulse_line.set_data(time_data, pulse_data)
             
-            # Update plot limits
-            time_scale = float(self.time_scale_var.get())
-            if time_data:
-                self.altitude_ax.set_xlim(max(0, time_data[-1] - time_scale), max(time_data[-1], time_scale))
-                self.o2_ax.set_xlim(max(0, time_data[-1] - time_scale), max(time_data[-1], time_scale))
-                self.vitals_ax.set_xlim(max(0, time_data[-1] - time_scale), max(time_data[-1], time_scale))
+            # Update plot limits in coarse steps so most frames only blit the lines
+            from plot_renderer import coarse_limits
+            if len(time_data):
+                x_step = time_scale / 5
+                x_max = max(time_scale, coarse_limits(0, time_data[-1], x_step)[1])
+                xlim = (max(0, x_max - time_scale), x_max)
+                for ax in (self.altitude_ax, self.o2_ax, self.vitals_ax):
+                    self.plot_renderer.set_limits(ax, xlim=xlim)
                 
                 # Update y-axis limits based on data
-                if altitude_data:
-                    self.altitude_ax.set_ylim(0, max(35000, max(altitude_data) * 1.1))
-                if o2_data:
-                    self.o2_ax.set_ylim(0, max(30, max(o2_data) * 1.1))
-                if spo2_data:
-                    max_vitals = max(max(spo2_data) if spo2_data else 100, 
-                                   max(pulse_data) if pulse_data else 100,
-                                   max(blp_data) if blp_data else 10)
-                    self.vitals_ax.set_ylim(0, max_vitals * 1.1)
-            
-            # Redraw canvas
-            self.canvas.draw()
+                if len(altitude_data):
+                    self.plot_renderer.set_limits(
+                        self.altitude_ax, ylim=coarse_limits(0, max(35000, altitude_data.max() * 1.1), 5000)
+                    )
+                if len(o2_data):
+                    self.plot_renderer.set_limits(
+                        self.o2_ax, ylim=coarse_limits(0, max(30, o2_data.max() * 1.1), 10)
+                    )
+                if len(spo2_data):
+                    max_vitals = max(spo2_data.max() if len(spo2_data) else 100, 
+                                   pulse_data.max() if len(pulse_data) else 100,
+                                   blp_data.max() if len(blp_data) else 10)
+                    self.plot_renderer.set_limits(
+                        self.vitals_ax, ylim=coarse_limits(0, max(10, max_vitals * 1.1), 20)
+                    )
+            
+            # Blit the lines (full redraw only when limits moved)
+            mode = self.plot_renderer.render()
+            self._plotted_key = render_key
+            self.frame_time_label.configure(
+                text=f"Plot frame: {self.plot_renderer.frame_ms:.1f} ms ({mode}, "
+                     f"avg {self.plot_renderer.avg_frame_ms:.1f} ms)"
+            )
             
         except Exception as e:
             log.error(f"Error updating plots: {e}", exc_info=True)
@@ -1107,7 +1220,7 @@ Before starting calibration:
             manual_cal_frame,
             text="Record Full Calibration Sequence",
             command=self.start_calibration_recording,
-            state=tk.DISABLED,
+            state=tk.NORMAL if self.serial_comm.is_connected else tk.DISABLED,
             variant="primary",
         )
         self.start_calibration_btn.pack(pady=5)
@@ -1199,202 +1312,111 @@ Before starting calibration:
         
     def record_room_air_calibration(self):
         """Record room air (21% O2) calibration values"""
-        if not self.serial_comm.is_connected:
-            messagebox.showerror("Error", "Not connected to device")
-            return
-            
-        try:
-            # Update UI state
-            self.update_calibration_status("Recording room air values...", "blue")
-            self.update_calibration_ui_state(in_progress=True)
-            
-            # Collect multiple samples to ensure stability
-            o2_values = []
-            voltage_values = []
-            
-            # Add header to results
-            timestamp = datetime.now().strftime('%H:%M:%S')
-            self.results_text.insert(tk.END, f"\n", 'header')
-            self.results_text.insert(tk.END, f"=== Room Air Calibration Started at {timestamp} ===\n", 'header')
-            
-            for i in range(5):
-                # Update progress
-                self.calibration_progress['value'] = (i + 1) * 20
-                self.root.update_idletasks()
-                
-                try:
-                    # Get O2 concentration
-                    success, _ = self.serial_comm.send_command("GET RUN O2CONC")
-                    if not success:
-                        raise Exception("Failed to send O2CONC command")
-                    
-                    time.sleep(0.1)  # Wait for response
-                    o2_response = self.serial_comm.get_response()
-                    o2_conc = self._parse_float_response(o2_response, "O2 concentration")
-                    o2_values.append(o2_conc)
-                    
-                    # Get ADC voltage
-                    success, _ = self.serial_comm.send_command("GET ADC 12")
-                    if not success:
-                        raise Exception("Failed to send ADC command")
-                    
-                    time.sleep(0.1)  # Wait for response
-                    voltage_response = self.serial_comm.get_response()
-                    voltage = self._parse_float_response(voltage_response, "ADC voltage")
-                    voltage_values.append(voltage)
-                    
-                    # Add sample data with timestamp
-                    timestamp = datetime.now().strftime('%H:%M:%S')
-                    self.results_text.insert(tk.END, f"[{timestamp}] ", 'timestamp')
-                    self.results_text.insert(tk.END, f"Sample {i+1}: ", 'info')
-                    self.results_text.insert(tk.END, f"O2={o2_conc:.2f}%, Voltage={voltage:.3f}V\n")
-                    self.results_text.see(tk.END)
-                    time.sleep(0.5)
-                except Exception as e:
-                    log.error(f"Error collecting sample {i+1}: {e}")
-                    timestamp = datetime.now().strftime('%H:%M:%S')
-                    self.results_text.insert(tk.END, f"[{timestamp}] ", 'timestamp')
-                    self.results_text.insert(tk.END, f"Error in sample {i+1}: {str(e)}\n", 'error')
-                    self.results_text.see(tk.END)
-                    
-            # Calculate averages if we have data
-            if o2_values and voltage_values:
-                avg_o2 = sum(o2_values) / len(o2_values)
-                avg_voltage = sum(voltage_values) / len(voltage_values)
-                
-                # Update display
-                self.room_air_o2_var.set(f"{avg_o2:.2f}")
-                self.room_air_voltage_var.set(f"{avg_voltage:.3f}")
-                
-                # Store in shared data structure
-                self.calibration_data['room_air']['o2_values'] = o2_values
-                self.calibration_data['room_air']['voltage_values'] = voltage_values
-                
-                timestamp = datetime.now().strftime('%H:%M:%S')
-                self.results_text.insert(tk.END, f"\n[{timestamp}] ", 'timestamp')
-                self.results_text.insert(tk.END, "Room air calibration completed successfully\n", 'success')
-                self.results_text.insert(tk.END, f"Average O2: {avg_o2:.2f}%\n")
-                self.results_text.insert(tk.END, f"Average Voltage: {avg_voltage:.3f}V\n")
-                self.results_text.see(tk.END)
-                
-                # Update status to success
-                self.update_calibration_status("Room air calibration complete ✓", "green", 100)
-            else:
-                self.update_calibration_status("Room air calibration failed", "red", 0)
-                timestamp = datetime.now().strftime('%H:%M:%S')
-                self.results_text.insert(tk.END, f"[{timestamp}] ", 'timestamp')
-                self.results_text.insert(tk.END, "Error: Failed to collect valid data\n", 'error')
-                self.results_text.see(tk.END)
-                
-        except Exception as e:
-            log.error(f"Error in room air calibration: {e}", exc_info=True)
-            self.update_calibration_status(f"Error: {str(e)}", "red", 0)
-            timestamp = datetime.now().strftime('%H:%M:%S')
-            self.results_text.insert(tk.END, f"[{timestamp}] ", 'timestamp')
-            self.results_text.insert(tk.END, f"Error: {str(e)}\n", 'error')
-            self.results_text.see(tk.END)
-            
-        finally:
-            # Restore UI state
-            self.update_calibration_ui_state(in_progress=False)
+        self._record_calibration_point('room_air')
             
     def record_pure_o2_calibration(self):
         """Record 100% O2 calibration values"""
+        self._record_calibration_point('pure_o2')
+        
+    def _record_calibration_point(self, point):
+        """Start sampling a calibration point on the acquisition worker"""
         if not self.serial_comm.is_connected:
             messagebox.showerror("Error", "Not connected to device")
             return
             
+        info = CALIBRATION_POINTS[point]
+        
+        # Update UI state
+        self.update_calibration_status(info['status'], "blue")
+        self.update_calibration_ui_state(in_progress=True)
+        
+        # Add header to results
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        self.results_text.insert(tk.END, f"\n", 'header')
+        self.results_text.insert(tk.END, f"=== {info['title']} Calibration Started at {timestamp} ===\n", 'header')
+        
+        self.acquisition.submit('calibration', lambda worker: self._collect_calibration_samples(worker, point))
+        
+    def _collect_calibration_samples(self, worker, point, samples=5):
+        """Worker thread: read O2 concentration and ADC 12 several times to ensure stability"""
+        o2_values = []
+        voltage_values = []
+        for i in range(samples):
+            try:
+                # Get O2 concentration
+                o2_response = worker.query("GET RUN O2CONC")
+                o2_conc = self._parse_float_response(o2_response, "O2 concentration")
+                
+                # Get ADC voltage
+                voltage_response = worker.query("GET ADC 12")
+                voltage = self._parse_float_response(voltage_response, "ADC voltage")
+                
+                o2_values.append(o2_conc)
+                voltage_values.append(voltage)
+                worker.post('calibration_sample', (point, i, samples, o2_conc, voltage))
+            except Exception as e:
+                log.error(f"Error collecting sample {i+1}: {e}")
+                worker.post('calibration_sample', (point, i, samples, None, None), str(e))
+            if not worker.sleep(0.5):
+                break
+        return point, o2_values, voltage_values
+        
+    def _on_calibration_sample(self, payload, error):
+        """Show one calibration sample (or its error) as it arrives"""
+        point, i, samples, o2_conc, voltage = payload
+        self.calibration_progress['value'] = (i + 1) * 100 / samples
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        self.results_text.insert(tk.END, f"[{timestamp}] ", 'timestamp')
+        if error:
+            self.results_text.insert(tk.END, f"Error in sample {i+1}: {error}\n", 'error')
+        else:
+            self.results_text.insert(tk.END, f"Sample {i+1}: ", 'info')
+            self.results_text.insert(tk.END, f"O2={o2_conc:.2f}%, Voltage={voltage:.3f}V\n")
+        self.results_text.see(tk.END)
+        
+    def _on_calibration_done(self, payload, error):
+        """Average the recorded samples and store them for the calibration point"""
         try:
-            # Update UI state
-            self.update_calibration_status("Recording 100% O2 values...", "blue")
-            self.update_calibration_ui_state(in_progress=True)
-            
-            # Collect multiple samples to ensure stability
-            o2_values = []
-            voltage_values = []
-            
-            # Add header to results
-            timestamp = datetime.now().strftime('%H:%M:%S')
-            self.results_text.insert(tk.END, f"\n", 'header')
-            self.results_text.insert(tk.END, f"=== 100% O2 Calibration Started at {timestamp} ===\n", 'header')
+            if error:
+                raise RuntimeError(error)
+            point, o2_values, voltage_values = payload
+            label = CALIBRATION_POINTS[point]['label']
             
-            for i in range(5):
-                # Update progress
-                self.calibration_progress['value'] = (i + 1) * 20
-                self.root.update_idletasks()
-                
-                try:
-                    # Get O2 concentration
-                    success, _ = self.serial_comm.send_command("GET RUN O2CONC")
-                    if not success:
-                        raise Exception("Failed to send O2CONC command")
-                    
-                    time.sleep(0.1)  # Wait for response
-                    o2_response = self.serial_comm.get_response()
-                    if not o2_response:
-                        raise Exception("No O2 concentration response")
-                    
-                    o2_conc = float(o2_response.strip())
-                    o2_values.append(o2_conc)
-                    
-                    # Get ADC voltage
-                    success, _ = self.serial_comm.send_command("GET ADC 12")
-                    if not success:
-                        raise Exception("Failed to send ADC command")
-                    
-                    time.sleep(0.1)  # Wait for response
-                    voltage_response = self.serial_comm.get_response()
-                    if not voltage_response:
-                        raise Exception("No ADC voltage response")
-                    
-                    voltage = float(voltage_response.strip())
-                    voltage_values.append(voltage)
-                    
-                    # Add sample data with timestamp
-                    timestamp = datetime.now().strftime('%H:%M:%S')
-                    self.results_text.insert(tk.END, f"[{timestamp}] ", 'timestamp')
-                    self.results_text.insert(tk.END, f"Sample {i+1}: ", 'info')
-                    self.results_text.insert(tk.END, f"O2={o2_conc:.2f}%, Voltage={voltage:.3f}V\n")
-                    self.results_text.see(tk.END)
-                    time.sleep(0.5)
-                except Exception as e:
-                    log.error(f"Error collecting sample {i+1}: {e}")
-                    timestamp = datetime.now().strftime('%H:%M:%S')
-                    self.results_text.insert(tk.END, f"[{timestamp}] ", 'timestamp')
-                    self.results_text.insert(tk.END, f"Error in sample {i+1}: {str(e)}\n", 'error')
-                    self.results_text.see(tk.END)
-                    
             # Calculate averages if we have data
             if o2_values and voltage_values:
                 avg_o2 = sum(o2_values) / len(o2_values)
                 avg_voltage = sum(voltage_values) / len(voltage_values)
                 
                 # Update display
-                self.pure_o2_o2_var.set(f"{avg_o2:.2f}")
-                self.pure_o2_voltage_var.set(f"{avg_voltage:.3f}")
+                if point == 'room_air':
+                    self.room_air_o2_var.set(f"{avg_o2:.2f}")
+                    self.room_air_voltage_var.set(f"{avg_voltage:.3f}")
+                else:
+                    self.pure_o2_o2_var.set(f"{avg_o2:.2f}")
+                    self.pure_o2_voltage_var.set(f"{avg_voltage:.3f}")
                 
                 # Store in shared data structure
-                self.calibration_data['pure_o2']['o2_values'] = o2_values
-                self.calibration_data['pure_o2']['voltage_values'] = voltage_values
+                self.calibration_data[point]['o2_values'] = o2_values
+                self.calibration_data[point]['voltage_values'] = voltage_values
                 
                 timestamp = datetime.now().strftime('%H:%M:%S')
                 self.results_text.insert(tk.END, f"\n[{timestamp}] ", 'timestamp')
-                self.results_text.insert(tk.END, "100% O2 calibration completed successfully\n", 'success')
+                self.results_text.insert(tk.END, f"{label} calibration completed successfully\n", 'success')
                 self.results_text.insert(tk.END, f"Average O2: {avg_o2:.2f}%\n")
                 self.results_text.insert(tk.END, f"Average Voltage: {avg_voltage:.3f}V\n")
                 self.results_text.see(tk.END)
                 
                 # Update status to success
-                self.update_calibration_status("100% O2 calibration complete ✓", "green", 100)
+                self.update_calibration_status(f"{label} calibration complete ✓", "green", 100)
             else:
-                self.update_calibration_status("100% O2 calibration failed", "red", 0)
+                self.update_calibration_status(f"{label} calibration failed", "red", 0)
                 timestamp = datetime.now().strftime('%H:%M:%S')
                 self.results_text.insert(tk.END, f"[{timestamp}] ", 'timestamp')
                 self.results_text.insert(tk.END, "Error: Failed to collect valid data\n", 'error')
                 self.results_text.see(tk.END)
                 
         except Exception as e:
-            log.error(f"Error in 100% O2 calibration: {e}", exc_info=True)
+            log.error(f"Error in calibration: {e}", exc_info=True)
             self.update_calibration_status(f"Error: {str(e)}", "red", 0)
             timestamp = datetime.now().strftime('%H:%M:%S')
             self.results_text.insert(tk.END, f"[{timestamp}] ", 'timestamp')
@@ -1588,6 +1610,7 @@ Do you want to proceed with recording calibration data?
             # Run calibration recording in a separate thread
             def run_calibration():
                 try:
+                    from calibration_data import CalibrationMonitor
                     monitor = CalibrationMonitor(self.serial_comm.serial_port)
                     monitor.device_id = device_id
                     
@@ -1655,6 +1678,8 @@ Do you want to proceed with recording calibration data?
 
     def create_performance_tab(self):
         """Create the performance tab"""
+        with STARTUP.measure('import', "performance_gui"):
+            from performance_gui import PerformanceTab
         performance_tab = PerformanceTab(self.notebook, self.serial_comm)
         self.notebook.add(performance_tab, text="Performance")
 
@@ -1935,6 +1960,10 @@ Do you want to proceed with recording calibration data?
         ttk.Label(scale_frame, text="Time window (seconds):").pack(side=tk.LEFT, padx=5)
         ttk.Entry(scale_frame, textvariable=self.time_scale_var, width=10).pack(side=tk.LEFT, padx=5)
         
+        self.smoothing_var = tk.StringVar(value="1")
+        ttk.Label(scale_frame, text="Smoothing (points):").pack(side=tk.LEFT, padx=5)
+        ttk.Spinbox(scale_frame, from_=1, to=20, textvariable=self.smoothing_var, width=5).pack(side=tk.LEFT, padx=5)
+        
         # Data collection control
         control_frame = ModernLabelFrame(dashboard_frame, text="Plot Controls (0.2Hz - every 5 seconds)", padding=10)
         control_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -1970,6 +1999,10 @@ Do you want to proceed with recording calibration data?
         plot_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
         # Create figure with subplots
+        with STARTUP.measure('import', "matplotlib"):
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+            from matplotlib.figure import Figure
+            from plot_renderer import BlitRenderer
         self.fig = Figure(figsize=(10, 8))
         self.altitude_ax = self.fig.add_subplot(311)
         self.o2_ax = self.fig.add_subplot(312)
@@ -1979,6 +2012,8 @@ Do you want to proceed with recording calibration data?
         self.plot_data = {
             'time': [], 'altitude': [], 'o2_conc': [], 'blp': [], 'spo2': [], 'pulse': []
         }
+        # (data version, smoothing, time scale) of the last frame drawn
+        self._plotted_key = None
         
         # Create plot lines
         self.altitude_line, = self.altitude_ax.plot([], [], 'b-', label='Altitude')
@@ -1997,8 +2032,12 @@ Do you want to proceed with recording calibration data?
             ax.grid(True)
             ax.legend()
             
-        # Create canvas
+        # Create canvas; the renderer caches the static background and blits the lines
         self.canvas = FigureCanvasTkAgg(self.fig, master=plot_frame)
+        self.plot_renderer = BlitRenderer(
+            self.canvas,
+            [self.altitude_line, self.o2_line, self.blp_line, self.spo2_line, self.pulse_line]
+        )
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
@@ -2020,62 +2059,47 @@ Do you want to proceed with recording calibration data?
         self.plotting_active = True
         
         # Start data collection for plots only (not saved to file)
-        self.collect_data_for_plots()
+        self.acquisition.schedule('dashboard', DASHBOARD_POLL_SECONDS, self._read_dashboard_sample)
         
     def stop_data_collection(self):
         """Stop collecting data for plots"""
         self.plotting_active = False
+        self.acquisition.cancel('dashboard')
 
-    def collect_data_for_plots(self):
-        """Collect data at 0.2Hz (every 5 seconds) for plotting"""
-        if not self.serial_comm.is_connected or not self.plotting_active:
-            # Schedule next data collection
-            self.root.after(5000, self.collect_data_for_plots)
+    def _read_dashboard_sample(self, worker):
+        """Worker thread: one GET RUN ALL poll for the dashboard (None if no valid reply)"""
+        if not self.serial_comm.is_connected:
+            return None
+        response = worker.query("GET RUN ALL")
+        if not response:
+            return None
+        data = response.strip().split(',')
+        # Format: timestamp, program, current_alt, final_alt, o2_conc, bl_pressure, elapsed_time, remaining_time, spo2, pulse
+        if len(data) < 10:
+            return None
+        return datetime.now(), data
+        
+    def _on_dashboard_sample(self, payload, error):
+        """Add a polled sample to the store (Tk thread)"""
+        if error:
+            log.warning(f"Dashboard poll failed: {error}")
             return
-            
-        try:
-            # Send command to get current data from the device
-            success, message = self.serial_comm.send_command("GET RUN ALL")
-            if not success:
-                log.warning(f"Failed to send command: {message}")
-                # Schedule next data collection
-                self.root.after(5000, self.collect_data_for_plots)
-                return
-            
-            # Wait a moment for response, then get it
-            self.root.after(200, self._process_data_response)
-            
-        except Exception as e:
-            log.error(f"Error collecting data: {e}")
-        
-        # Schedule next data collection (0.2Hz - every 5 seconds)
-        self.root.after(5000, self.collect_data_for_plots)
+        if not payload or not self.plotting_active:
+            return
+        timestamp, data = payload
+        # Skip additional O2 voltage request to reduce device load
+        self._process_parsed_data(timestamp, data, 0.0)
         
-    def _process_data_response(self):
-        """Process the response from the data collection command"""
+    def _drain_acquisition_events(self):
+        """UI tick: apply everything the acquisition worker posted since the last tick"""
         try:
-            # Get the response
-            response = self.serial_comm.get_response()
-            if not response:
-                return
-                
-            data = response.strip().split(',')
-            
-            # Parse the data if valid
-            if len(data) >= 10:
-                # Format: timestamp, program, current_alt, final_alt, o2_conc, bl_pressure, elapsed_time, remaining_time, spo2, pulse
-                timestamp = datetime.now()
-                
-                # Skip additional O2 voltage request to reduce device load
-                o2_voltage = 0.0
-                
-                # Process the data without additional requests
-                self._process_parsed_data(timestamp, data, o2_voltage)
-                
+            for event in self.acquisition.drain():
+                handler = self.acquisition_handlers.get(event.kind)
+                if handler:
+                    handler(event.payload, event.error)
         except Exception as e:
-            log.error(f"Error processing data response: {e}")
-            
-
+            log.error(f"Error applying acquisition results: {e}", exc_info=True)
+        self.acquisition_after_id = self.root.after(UI_TICK_MS, self._drain_acquisition_events)
         
     def _process_parsed_data(self, timestamp, data, o2_voltage):
         """Process the parsed data and update plots"""
@@ -2227,8 +2251,11 @@ Do you want to proceed with recording calibration data?
         self.notebook.add(programming_frame, text="Programming")
         
         # Create and pack the program manager
-        self.program_manager = ProgramManager(programming_frame, self.serial_comm)
+        from program_manager import ProgramManager
+        self.program_manager = ProgramManager(programming_frame, self.serial_comm, self.acquisition, self.device_state)
         self.program_manager.pack(fill=tk.BOTH, expand=True)
+        self.acquisition_handlers['program_name'] = self.program_manager.on_program_name
+        self.acquisition_handlers['program_list'] = self.program_manager.on_program_list_done
         
         return programming_frame
 
@@ -2253,7 +2280,7 @@ Do you want to proceed with recording calibration data?
             control_frame,
             text="Start Logging",
             command=self.start_logging,
-            state=tk.DISABLED,
+            state=tk.NORMAL if self.serial_comm.is_connected else tk.DISABLED,
             variant="primary",
         )
         self.start_logging_btn.pack(side=tk.LEFT, padx=5)
@@ -2273,6 +2300,7 @@ Do you want to proceed with recording calibration data?
         
         self.log_text = tk.Text(log_frame, height=10, wrap=tk.WORD)
         self.log_text.pack(fill=tk.BOTH, expand=True)
+        self.log_view = RingTextView(self.log_text, max_lines=LOG_PANE_LINES)
         
         return logging_frame
 
@@ -2280,15 +2308,21 @@ Do you want to proceed with recording calibration data?
         """Handle tab change events"""
         selected_tab = self.notebook.tab(self.notebook.select(), "text")
         
+        # Stop data collection if leaving dashboard tab
+        if selected_tab != "Dashboard" and self.plotting_active:
+            self.stop_data_collection()
+        
+        # First visit: let the placeholder paint, then build the tab; building
+        # re-selects the new frame, which brings us back here
+        if selected_tab in self._tab_builders:
+            self.root.after_idle(self.ensure_tab, selected_tab)
+            return
+        
         # Handle dashboard tab selection
         if selected_tab == "Dashboard":
             if self.serial_comm.is_connected and not self.plotting_active:
                 # Start data collection if connected and not already plotting
                 self.start_data_collection()
-        else:
-            # Stop data collection if leaving dashboard tab
-            if self.plotting_active:
-                self.stop_data_collection()
 
 def main():
     try:
@@ -2309,6 +2343,9 @@ def main():
                 # Cancel any pending after events
                 if hasattr(app, 'poll_after_id'):
                     root.after_cancel(app.poll_after_id)
+                root.after_cancel(app.acquisition_after_id)
+                app.ui_bus.stop()
+                app.acquisition.stop()
                 
                 # Clean up scrolling
                 app.cleanup_scrolling()
@@ -2322,10 +2359,9 @@ def main():
                     if thread != threading.current_thread() and thread.daemon:
                         thread.join(timeout=1.0)
                 
-                # Close debug log file properly
-                if 'debug_file_handler' in globals():
-                    debug_file_handler.close()
-                    log.info("ROBD2 GUI Application shutting down - debug log file closed")
+                # Flush queued log records and close the debug log file
+                log.info("ROBD2 GUI Application shutting down")
+                log_pipeline.stop()
                 
             except Exception as e:
                 log.error(f"Error during cleanup: {e}")
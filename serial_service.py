@@ -8,8 +8,8 @@ from datetime import datetime
 from random import gauss, random
 from typing import Callable, Dict, Optional
 
-from serial_comm import SerialCommunicator
-from data_store import DataStore
+from robd2_core.serial_comm import SerialCommunicator
+from robd2_core.data_store import DataStore
 
 
 @dataclass(frozen=True, slots=True)
@@ -33,11 +33,16 @@ class SerialService:
         self,
         poll_interval: float = 5.0,
         use_demo_if_disconnected: bool = True,
+        retention_seconds: Optional[float] = None,
     ) -> None:
         if poll_interval <= 0:
             raise ValueError("poll_interval must be > 0")
         self._serial = SerialCommunicator()
-        self._data_store = DataStore(max_points=2000)
+        # A time-based window keeps the visible span independent of the poll rate.
+        if retention_seconds is None:
+            self._data_store = DataStore(max_points=2000)
+        else:
+            self._data_store = DataStore(max_points=None, retention_seconds=retention_seconds)
         # Device documentation requires queries at least every ~2 seconds to stay responsive.
         self._poll_interval = min(poll_interval, 2.0)
         self._use_demo = use_demo_if_disconnected
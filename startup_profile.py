@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+
+
+class StartupProfile:
+    """
+    Wall-clock breakdown of application start-up.
+
+    ``checkpoint`` records the time since the previous checkpoint (for
+    straight-line phases such as the module imports), ``measure`` times a
+    block (a lazily imported package, a tab built on first selection) and
+    ``mark_interactive`` stamps the moment the main loop first goes idle.
+    Entries keep being added after start-up so the report also covers
+    tabs built later on.
+    """
+
+    def __init__(self, started: Optional[float] = None) -> None:
+        self.started = started if started is not None else time.perf_counter()
+        self._last = self.started
+        self.entries: List[Tuple[str, str, float]] = []
+        self.interactive_ms: Optional[float] = None
+
+    def checkpoint(self, kind: str, name: str) -> float:
+        now = time.perf_counter()
+        elapsed_ms = (now - self._last) * 1000
+        self._last = now
+        self.entries.append((kind, name, elapsed_ms))
+        return elapsed_ms
+
+    @contextmanager
+    def measure(self, kind: str, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            self._last = now
+            self.entries.append((kind, name, (now - started) * 1000))
+
+    def mark_interactive(self) -> float:
+        self.interactive_ms = (time.perf_counter() - self.started) * 1000
+        return self.interactive_ms
+
+    def total(self, kind: str) -> float:
+        return sum(ms for entry_kind, _, ms in self.entries if entry_kind == kind)
+
+    def report(self) -> str:
+        lines = ["Startup timing:"]
+        for kind, name, ms in self.entries:
+            lines.append(f"  {kind:<7}{name:<28}{ms:8.1f} ms")
+        if self.interactive_ms is not None:
+            lines.append(f"  time to interactive{'':<16}{self.interactive_ms:8.1f} ms")
+        return "\n".join(lines)
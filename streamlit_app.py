@@ -1,24 +1,27 @@
 from __future__ import annotations
 
 import io
-import statistics
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Tuple, Literal
+from typing import Callable, Dict, Tuple, Literal, TypeVar
 
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import streamlit as st
 
-from data_store import DataStore
-from gas_calculators import (
+from robd2_core.data_store import DataStore
+from robd2_core.gas_calculators import (
     cylinder_capacity,
     gas_consumption,
     physiological_params,
     single_session,
 )
 from serial_service import LiveSample, SerialService
+from robd2_core.signal_filters import moving_average, tail
 POLL_INTERVAL_SECONDS = 2.0
+DASHBOARD_SERIES = ("altitude", "o2_conc", "blp", "spo2", "pulse")
+
+T = TypeVar("T")
 
 DEFAULT_LANG: Literal["en", "es"] = "es"
 LANGUAGES: Dict[str, str] = {"es": "Español", "en": "English"}
@@ -261,19 +264,40 @@ def _init_debug_log() -> None:
     st.session_state.setdefault("debug_log", [])
 
 
+def _memoized(name: str, key: tuple, build: Callable[[], T]) -> T:
+    """Return the cached value for ``name`` while ``key`` (e.g. a data version) is unchanged."""
+    cache = st.session_state.setdefault("render_cache", {})
+    hit = cache.get(name)
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    value = build()
+    cache[name] = (key, value)
+    return value
+
+
 # --------------------------------------------------------------------------- #
 # Utility helpers
 # --------------------------------------------------------------------------- #
 
 
 def _export_csv(data_store: DataStore) -> Tuple[str, bytes]:
-    time_sec, altitude = data_store.get_data("altitude")
-    _, o2 = data_store.get_data("o2_conc")
-    _, blp = data_store.get_data("blp")
-    _, spo2 = data_store.get_data("spo2")
-    _, pulse = data_store.get_data("pulse")
-    _, o2_v = data_store.get_data("o2_voltage")
-    _, err = data_store.get_data("error_percent")
+    version, frame = data_store.figure_snapshot()
+    return "robd2_data.csv", _memoized(
+        "export_csv",
+        (version, _current_lang()),
+        lambda: _build_csv(frame),
+    )
+
+
+def _build_csv(frame: Dict[str, object]) -> bytes:
+    time_sec = frame["time"]
+    altitude = frame["altitude"]
+    o2 = frame["o2_conc"]
+    blp = frame["blp"]
+    spo2 = frame["spo2"]
+    pulse = frame["pulse"]
+    o2_v = frame["o2_voltage"]
+    err = frame["error_percent"]
 
     buffer = io.StringIO()
     headers = [
@@ -288,45 +312,42 @@ def _export_csv(data_store: DataStore) -> Tuple[str, bytes]:
         t("csv_error"),
     ]
     buffer.write(",".join(headers) + "\n")
-    for i, t in enumerate(time_sec):
+    for i, sec in enumerate(time_sec):
         buffer.write(
-            f"{t:.2f},{t/60:.2f},{altitude[i]:.1f},{o2[i]:.2f},"
+            f"{sec:.2f},{sec/60:.2f},{altitude[i]:.1f},{o2[i]:.2f},"
             f"{blp[i]:.2f},{spo2[i]:.2f},{pulse[i]:.2f},{o2_v[i]:.3f},{err[i]:.2f}\n"
         )
-    return "robd2_data.csv", buffer.getvalue().encode("utf-8")
+    return buffer.getvalue().encode("utf-8")
 
 
 def _latest_sample(service: SerialService) -> LiveSample | None:
-    times, alt = service.data_store.get_data("altitude")
-    if not times:
+    frame = service.data_store.figure_data(DASHBOARD_SERIES)
+    if not len(frame["time"]):
         return None
-    _, o2 = service.data_store.get_data("o2_conc")
-    _, blp = service.data_store.get_data("blp")
-    _, spo2 = service.data_store.get_data("spo2")
-    _, pulse = service.data_store.get_data("pulse")
     idx = -1
     now = datetime.now()
     return LiveSample(
         timestamp=now,
-        altitude=alt[idx],
-        o2_conc=o2[idx],
-        blp=blp[idx],
-        spo2=spo2[idx],
-        pulse=pulse[idx],
+        altitude=float(frame["altitude"][idx]),
+        o2_conc=float(frame["o2_conc"][idx]),
+        blp=float(frame["blp"][idx]),
+        spo2=float(frame["spo2"][idx]),
+        pulse=float(frame["pulse"][idx]),
     )
 
 
 def _performance_summary(service: SerialService) -> Dict[str, float]:
-    _, o2 = service.data_store.get_data("o2_conc")
-    if len(o2) < 2:
+    # Running summary maintained by the DataStore on ingest; no buffer rescan per rerun.
+    o2 = service.data_store.get_stats("o2_conc")
+    if o2 is None or o2.count < 2:
         return {}
-    mean = statistics.mean(o2)
-    stdev = statistics.stdev(o2)
+    mean = o2.mean
+    stdev = o2.stdev
     return {
         "mean_o2": mean,
         "std_o2": stdev,
         "cv_percent": (stdev / mean * 100) if mean else 0.0,
-        "samples": len(o2),
+        "samples": o2.count,
     }
 
 
@@ -695,75 +716,19 @@ def diagnostics_section(service: SerialService) -> None:
             st.code(resp or t("no_response"), language="text")
 
 
-def dashboard_section(service: SerialService) -> None:
-    st.markdown(
-        f'<div class="section-title">{t("dashboard")}</div>',
-        unsafe_allow_html=True,
-    )
-
-    with st.expander(t("chart_settings"), expanded=False):
-        smoothing = st.slider(
-            t("smoothing_window"),
-            1,
-            20,
-            3,
-            1,
-            help=t("smoothing_help"),
-        )
-        max_pts = st.slider(t("max_points"), 100, 2000, 800, 100)
-
-    ds = service.data_store
-    time_sec, altitude = ds.get_data("altitude")
-    _, o2 = ds.get_data("o2_conc")
-    _, blp = ds.get_data("blp")
-    _, spo2 = ds.get_data("spo2")
-    _, pulse = ds.get_data("pulse")
-
-    if not time_sec:
-        st.warning(t("no_samples"))
-        return
-
-    latest = _latest_sample(service)
-    card_cols = st.columns(4)
-    if latest:
-        with card_cols[0]:
-            metric_card(t("metric_altitude"), f"{latest.altitude:,.0f} ft")
-        with card_cols[1]:
-            metric_card(t("metric_o2"), f"{latest.o2_conc:.2f} %")
-        with card_cols[2]:
-            metric_card(t("metric_spo2"), f"{latest.spo2:.1f} %", color="var(--accent2)")
-        with card_cols[3]:
-            metric_card(t("metric_pulse"), f"{latest.pulse:.0f} bpm", color="#f59e0b")
-
-    if latest and latest.spo2 < 88:
-        st.markdown(
-            f"""
-            <div class="alert alert-danger">
-              <strong>{t("low_spo2")}</strong> — {latest.spo2:.1f}%.
-              <span class="subtext">{t("check_mask")}</span>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-
+def _build_dashboard_figure(frame: Dict[str, object], smoothing: int, max_pts: int) -> go.Figure:
     def _smooth(arr):
-        if smoothing <= 1 or len(arr) == 0:
-            return arr
-        out = []
-        for i in range(len(arr)):
-            window = arr[max(0, i - smoothing + 1) : i + 1]
-            out.append(sum(window) / len(window))
-        return out
+        return moving_average(arr, smoothing)
 
     def _tail(arr):
-        return arr[-max_pts:] if len(arr) > max_pts else arr
+        return tail(arr, max_pts)
 
-    times = _tail(time_sec)
-    altitude_p = _smooth(_tail(altitude))
-    o2_p = _smooth(_tail(o2))
-    blp_p = _smooth(_tail(blp))
-    spo2_p = _smooth(_tail(spo2))
-    pulse_p = _smooth(_tail(pulse))
+    times = _tail(frame["time"])
+    altitude_p = _smooth(_tail(frame["altitude"]))
+    o2_p = _smooth(_tail(frame["o2_conc"]))
+    blp_p = _smooth(_tail(frame["blp"]))
+    spo2_p = _smooth(_tail(frame["spo2"]))
+    pulse_p = _smooth(_tail(frame["pulse"]))
 
     fig = make_subplots(
         rows=3,
@@ -842,6 +807,62 @@ def dashboard_section(service: SerialService) -> None:
     fig.update_yaxes(title_text=t("axis_percent_mmhg"), row=2, col=1)
     fig.update_yaxes(title_text=t("axis_percent_bpm"), row=3, col=1)
     fig.update_xaxes(title_text=t("axis_time"), row=3, col=1)
+    return fig
+
+
+def dashboard_section(service: SerialService) -> None:
+    st.markdown(
+        f'<div class="section-title">{t("dashboard")}</div>',
+        unsafe_allow_html=True,
+    )
+
+    with st.expander(t("chart_settings"), expanded=False):
+        smoothing = st.slider(
+            t("smoothing_window"),
+            1,
+            20,
+            3,
+            1,
+            help=t("smoothing_help"),
+        )
+        max_pts = st.slider(t("max_points"), 100, 2000, 800, 100)
+
+    ds = service.data_store
+    version, frame = ds.figure_snapshot(DASHBOARD_SERIES)
+
+    if not len(frame["time"]):
+        st.warning(t("no_samples"))
+        return
+
+    latest = _latest_sample(service)
+    card_cols = st.columns(4)
+    if latest:
+        with card_cols[0]:
+            metric_card(t("metric_altitude"), f"{latest.altitude:,.0f} ft")
+        with card_cols[1]:
+            metric_card(t("metric_o2"), f"{latest.o2_conc:.2f} %")
+        with card_cols[2]:
+            metric_card(t("metric_spo2"), f"{latest.spo2:.1f} %", color="var(--accent2)")
+        with card_cols[3]:
+            metric_card(t("metric_pulse"), f"{latest.pulse:.0f} bpm", color="#f59e0b")
+
+    if latest and latest.spo2 < 88:
+        st.markdown(
+            f"""
+            <div class="alert alert-danger">
+              <strong>{t("low_spo2")}</strong> — {latest.spo2:.1f}%.
+              <span class="subtext">{t("check_mask")}</span>
+            </div>
+            """,
+            unsafe_allow_html=True,
+        )
+
+    # Rebuild the plotly figure only when the data or the view settings changed.
+    fig = _memoized(
+        "dashboard_figure",
+        (version, smoothing, max_pts, _current_lang()),
+        lambda: _build_dashboard_figure(frame, smoothing, max_pts),
+    )
 
     st.plotly_chart(fig, use_container_width=True, theme=None)
 
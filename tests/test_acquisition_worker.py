@@ -0,0 +1,78 @@
+from collections import deque
+
+import pytest
+
+from acquisition_worker import AcquisitionWorker
+
+
+class _FakeComm:
+    """
+    Stand-in for ``SerialCommunicator``: every command is answered in order.
+    With ``stall_at`` the reply to that command is late -- the first poll for
+    it comes back empty -- and everything behind it arrives afterwards.
+    """
+
+    def __init__(self, stall_at=None, fail_on=None):
+        self.sent = []
+        self.buffer = deque()
+        self.answered = 0
+        self.max_in_flight = 0
+        self.stall_at = stall_at
+        self.fail_on = fail_on
+
+    def send_command(self, command):
+        if command == self.fail_on:
+            return False, "port closed"
+        self.sent.append(command)
+        self.buffer.append(f"{command} OK")
+        self.max_in_flight = max(self.max_in_flight, len(self.buffer))
+        return True, "sent"
+
+    def get_response(self):
+        if self.answered == self.stall_at:
+            self.stall_at = None
+            return None
+        if not self.buffer:
+            return None
+        self.answered += 1
+        return self.buffer.popleft()
+
+
+COMMANDS = [f"GET ADC {channel}" for channel in range(10)]
+
+
+def test_replies_are_matched_to_commands_in_order():
+    comm = _FakeComm()
+    seen = []
+    replies = AcquisitionWorker(comm).query_pipelined(COMMANDS, on_reply=lambda i, reply: seen.append((i, reply)))
+    assert replies == [f"{command} OK" for command in COMMANDS]
+    assert seen == list(enumerate(replies))
+    assert comm.sent == COMMANDS
+
+
+@pytest.mark.parametrize("window", [1, 3, 4])
+def test_no_more_than_window_commands_await_a_reply(window):
+    comm = _FakeComm()
+    AcquisitionWorker(comm).query_pipelined(COMMANDS, window=window)
+    assert comm.max_in_flight == window
+
+
+def test_silence_abandons_the_rest_and_discards_late_replies():
+    comm = _FakeComm(stall_at=5)
+    replies = AcquisitionWorker(comm, response_poll=0.0).query_pipelined(COMMANDS, timeout=0.0, window=4)
+    assert replies[:5] == [f"{command} OK" for command in COMMANDS[:5]]
+    assert replies[5:] == [None] * 5
+    # Nothing past the window was sent, and the late answers were drained off the port
+    assert len(comm.sent) == 5 + 4
+    assert not comm.buffer
+
+
+def test_failed_send_raises():
+    comm = _FakeComm(fail_on=COMMANDS[2])
+    with pytest.raises(IOError):
+        AcquisitionWorker(comm).query_pipelined(COMMANDS)
+
+
+def test_rejects_empty_window():
+    with pytest.raises(ValueError):
+        AcquisitionWorker(_FakeComm()).query_pipelined(COMMANDS, window=0)
@@ -0,0 +1,87 @@
+import math
+from datetime import datetime, timedelta
+
+from robd2_core.data_store import DataStore
+
+T0 = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def _at(seconds):
+    return T0 + timedelta(seconds=seconds)
+
+
+def test_partial_samples_stay_aligned_with_timestamps():
+    store = DataStore(max_points=100)
+    store.add_data(_at(0), {'altitude': 0.0, 'o2_conc': 20.9})
+    store.add_data(_at(1), {'altitude': 1000.0})
+    store.add_data(_at(2), {'altitude': 2000.0, 'o2_conc': 20.1})
+
+    for series in store.data.values():
+        assert len(series) == len(store.timestamps) == 3
+    times, o2 = store.get_data('o2_conc')
+    assert times == [0.0, 1.0, 2.0]
+    assert o2[0] == 20.9 and math.isnan(o2[1]) and o2[2] == 20.1
+    assert store.get_stats('o2_conc').count == 2
+    assert store.get_stats('o2_conc').mean == (20.9 + 20.1) / 2
+    assert store.get_stats('spo2').count == 0
+
+
+def test_retention_evicts_partial_samples_by_timestamp():
+    store = DataStore(max_points=100, retention_seconds=10)
+    store.add_data(_at(0), {'altitude': 0.0, 'o2_conc': 20.9})
+    for second in range(1, 15):
+        store.add_data(_at(second), {'altitude': float(second)})
+    store.add_data(_at(15), {'altitude': 15.0, 'o2_conc': 19.5})
+
+    # The only early O2 reading is older than the window and must be gone with its timestamp
+    assert store.timestamps[0] == _at(5)
+    times, o2 = store.get_data('o2_conc')
+    assert len(times) == len(o2) == 11
+    assert all(math.isnan(value) for value in o2[:-1]) and o2[-1] == 19.5
+    assert store.get_stats('o2_conc').count == 1
+    assert store.get_stats('o2_conc').mean == 19.5
+    assert list(store.data['altitude']) == [float(s) for s in range(5, 16)]
+
+
+def test_point_limit_evicts_partial_samples_from_stats():
+    store = DataStore(max_points=3)
+    store.add_data(_at(0), {'spo2': 97.0})
+    store.add_data(_at(1), {'altitude': 100.0})
+    store.add_data(_at(2), {'altitude': 200.0})
+    store.add_data(_at(3), {'altitude': 300.0})
+
+    assert len(store.data['spo2']) == 3
+    assert all(math.isnan(value) for value in store.data['spo2'])
+    assert store.get_stats('spo2').count == 0
+    assert store.get_stats('altitude').count == 3
+
+
+def test_add_many_pads_missing_columns():
+    store = DataStore(max_points=4)
+    store.add_data(_at(0), {'altitude': 0.0, 'pulse': 70.0})
+    store.add_many([_at(1), _at(2), _at(3), _at(4)], {'altitude': [1.0, 2.0, 3.0, 4.0]})
+
+    assert list(store.data['altitude']) == [1.0, 2.0, 3.0, 4.0]
+    assert len(store.data['pulse']) == 4
+    assert all(math.isnan(value) for value in store.data['pulse'])
+    assert store.get_stats('pulse').count == 0
+    frame = store.figure_data(('altitude', 'pulse'))
+    assert len(frame['time']) == len(frame['altitude']) == len(frame['pulse']) == 4
+
+
+def test_figure_snapshot_caches_each_metric_set_with_its_version():
+    store = DataStore(max_points=10)
+    store.add_data(_at(0), {'altitude': 0.0, 'o2_conc': 20.9})
+    dashboard = ('altitude', 'o2_conc')
+
+    version, frame = store.figure_snapshot(dashboard)
+    assert version == store.version
+    full = store.figure_data()
+    # Alternating views must not evict each other
+    assert store.figure_snapshot(dashboard)[1] is frame
+    assert store.figure_data() is full
+
+    store.add_data(_at(1), {'altitude': 500.0, 'o2_conc': 20.5})
+    new_version, new_frame = store.figure_snapshot(dashboard)
+    assert new_version == version + 1
+    assert list(new_frame['altitude']) == [0.0, 500.0]
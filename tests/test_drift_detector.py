@@ -0,0 +1,78 @@
+import math
+import random
+
+from robd2_core.drift_detector import ChannelDriftDetector
+from robd2_core.o2_specs import O2_SPECS
+from robd2_core.performance_core import PerformanceEngine, SimulatedSource, Sink
+
+SWEEP = [spec.altitude for spec in O2_SPECS] + [0]
+
+
+class _DriftEvents(Sink):
+    def __init__(self):
+        self.events = []
+
+    def on_drift(self, event, altitude):
+        self.events.append((altitude, event))
+
+
+class _StepSource(SimulatedSource):
+    """Simulated sweep with an O2 sensor offset from ``at`` seconds on."""
+
+    def __init__(self, at, offset, **kwargs):
+        super().__init__(**kwargs)
+        self.at = at
+        self.offset = offset
+
+    def read(self):
+        sample = super().read()
+        if sample is not None and sample['t'] >= self.at:
+            sample['o2_conc'] += self.offset
+        return sample
+
+
+def _sweep(source):
+    events = _DriftEvents()
+    PerformanceEngine(source, sinks=[events]).run()
+    return events.events
+
+
+def test_clean_simulated_sweep_raises_no_drift_events():
+    for seed in (0, 1, 2):
+        assert _sweep(SimulatedSource(altitudes=SWEEP, dwell=60.0, seed=seed)) == []
+
+
+def test_injected_o2_step_is_detected_at_its_altitude():
+    # 5000 ft is held from 60 s to 120 s; its baseline is ready by 110 s
+    events = _sweep(_StepSource(at=110.0, offset=0.15, altitudes=SWEEP, dwell=60.0, seed=0))
+    assert len(events) == 1
+    altitude, event = events[0]
+    assert altitude == 5000
+    assert event.channel == 'o2_conc'
+    assert event.direction == 'up'
+
+
+def test_converging_signal_does_not_become_the_baseline():
+    detector = ChannelDriftDetector('o2_conc', min_sigma=0.02)
+    rng = random.Random(0)
+    # Tail of a tau = 3 s response sampled every 0.3 s, starting 5 sigma off the setpoint
+    for i in range(40):
+        detector.update(0.1 * math.exp(-i * 0.1) + rng.gauss(0.0, 0.02))
+    assert not detector.ready
+    for _ in range(60):
+        detector.update(rng.gauss(0.0, 0.02))
+    assert detector.ready
+    assert abs(detector.baseline) < 0.01
+
+
+def test_step_after_baseline_is_reported_once():
+    detector = ChannelDriftDetector('voltage1', min_sigma=0.002, warmup=8, sigma_margin=2.0)
+    rng = random.Random(1)
+    for _ in range(8):
+        assert detector.update(1.0 + rng.gauss(0.0, 0.002)) is None
+    assert detector.ready
+    events = [detector.update(1.02 + rng.gauss(0.0, 0.002)) for _ in range(10)]
+    detected = [event for event in events if event]
+    assert len(detected) == 1
+    assert detected[0].kind == 'step' and detected[0].direction == 'up'
+    assert detected[0].baseline < 1.01
@@ -0,0 +1,90 @@
+import io
+import logging
+import threading
+
+from log_pipeline import LoggingPipeline, RepeatFilter
+
+
+def _record(msg="reply %s", args=("OK",), lineno=10, level=logging.INFO):
+    return logging.LogRecord("robd2_core.test", level, "module.py", lineno, msg, args, None)
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_repeat_filter_suppresses_after_burst(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr("log_pipeline.time.monotonic", clock)
+    repeat = RepeatFilter(burst=3, window=10.0)
+    assert [repeat.filter(_record()) for _ in range(5)] == [True, True, True, False, False]
+    assert repeat.suppressed == 2
+    # Other call sites, levels and arguments are counted separately
+    assert repeat.filter(_record(lineno=11))
+    assert repeat.filter(_record(level=logging.WARNING))
+    assert repeat.filter(_record(args=("ERR1",)))
+
+
+def test_repeat_filter_reports_dropped_records_when_the_window_reopens(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr("log_pipeline.time.monotonic", clock)
+    repeat = RepeatFilter(burst=1, window=10.0)
+    for _ in range(4):
+        repeat.filter(_record())
+    clock.now = 11.0
+    record = _record()
+    assert repeat.filter(record)
+    assert record.getMessage() == "reply OK (repeated 3 more times)"
+    # Nothing was dropped in the window that just opened
+    clock.now = 22.0
+    record = _record()
+    assert repeat.filter(record)
+    assert record.getMessage() == "reply OK"
+
+
+def test_repeat_filter_does_not_format_the_message():
+    class Exploding:
+        def __str__(self):
+            raise AssertionError("formatted")
+
+    repeat = RepeatFilter()
+    assert repeat.filter(_record(args=(Exploding(),)))
+
+
+def test_repeat_filter_passes_unhashable_arguments():
+    repeat = RepeatFilter(burst=1)
+    assert all(repeat.filter(_record(args=([1, 2],))) for _ in range(3))
+
+
+def test_pipeline_formats_and_filters_on_the_listener_thread():
+    seen = []
+
+    class Recording(logging.Handler):
+        def emit(self, record):
+            seen.append((threading.current_thread().name, self.format(record)))
+
+    stream = io.StringIO()
+    pipeline = LoggingPipeline([Recording(), logging.StreamHandler(stream)], repeat_filter=RepeatFilter(burst=2))
+    logger = logging.getLogger("robd2_core.test_pipeline")
+    # The pipeline is tested directly, without replacing the process-wide one
+    logger.addHandler(pipeline.queue_handler)
+    logger.propagate = False
+    pipeline.listener.start()
+    pipeline._running = True
+    try:
+        for _ in range(4):
+            logger.warning("late reply %s", "ERR3")
+    finally:
+        logger.removeHandler(pipeline.queue_handler)
+        logger.propagate = True
+        pipeline.stop()
+
+    assert [message for _, message in seen] == ["late reply ERR3", "late reply ERR3"]
+    assert all(thread != threading.current_thread().name for thread, _ in seen)
+    # Both handlers see the same filtered stream
+    assert stream.getvalue().splitlines() == ["late reply ERR3", "late reply ERR3"]
+    assert pipeline.repeat_filter.suppressed == 2
@@ -0,0 +1,72 @@
+import math
+import random
+
+import pytest
+
+from robd2_core.o2_estimator import O2Estimator
+
+TARGET = 14.05
+INTERVAL = 0.3
+
+
+def _feed(estimator, level, noise, count, seed=0, start=0, learn_noise=True, target=TARGET):
+    rng = random.Random(seed)
+    result = None
+    for i in range(start, start + count):
+        result = estimator.update(level + rng.gauss(0.0, noise), target, i * INTERVAL, learn_noise)
+    return result
+
+
+def test_estimate_converges_to_an_offset_unit():
+    estimator = O2Estimator()
+    estimate, variance = _feed(estimator, TARGET + 0.2, 0.05, 200)
+    assert estimate == pytest.approx(TARGET + 0.2, abs=0.03)
+    assert estimator.offset == pytest.approx(0.2, abs=0.03)
+    # Far tighter than a single reading's variance
+    assert variance < 0.05 ** 2 / 4
+
+
+def test_estimate_follows_a_first_order_step():
+    estimator = O2Estimator(tau=3.0)
+    _feed(estimator, 17.27, 0.02, 100, target=17.27)
+    estimator.start_step()
+    rng = random.Random(1)
+    for i in range(100, 300):
+        t = i * INTERVAL
+        level = TARGET + (17.27 - TARGET) * math.exp(-(t - 100 * INTERVAL) / 3.0)
+        # Like the engine, only learn the noise once the response has settled
+        estimate, _ = estimator.update(level + rng.gauss(0.0, 0.02), TARGET, t, learn_noise=i >= 150)
+    assert estimate == pytest.approx(TARGET, abs=0.02)
+    assert math.sqrt(estimator.r) == pytest.approx(0.02, rel=0.25)
+
+
+@pytest.mark.parametrize("noise", [0.01, 0.05, 0.15])
+def test_measurement_noise_is_learned_from_the_innovations(noise):
+    estimator = O2Estimator()
+    _feed(estimator, TARGET, noise, 400)
+    assert math.sqrt(estimator.r) == pytest.approx(noise, rel=0.25)
+
+
+def test_noisy_unit_gets_a_wider_interval_than_the_prior_assumes():
+    learned = O2Estimator()
+    fixed = O2Estimator()
+    _, learned_variance = _feed(learned, TARGET, 0.2, 200)
+    _, fixed_variance = _feed(fixed, TARGET, 0.2, 200, learn_noise=False)
+    assert fixed.r == pytest.approx(0.05 ** 2)
+    assert learned_variance > 2 * fixed_variance
+
+
+def test_noise_calibration_needs_learned_readings():
+    estimator = O2Estimator(min_noise_readings=10)
+    _feed(estimator, TARGET, 0.05, 20, learn_noise=False)
+    assert not estimator.noise_calibrated
+    _feed(estimator, TARGET, 0.05, 10, start=20)
+    assert estimator.noise_calibrated
+    estimator.reset()
+    assert not estimator.noise_calibrated and estimator.r == estimator.r_prior
+
+
+def test_learned_noise_respects_the_floor():
+    estimator = O2Estimator(r_floor=0.01 ** 2)
+    _feed(estimator, TARGET, 0.0, 100)
+    assert estimator.r == pytest.approx(0.01 ** 2)
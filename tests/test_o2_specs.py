@@ -0,0 +1,64 @@
+import pytest
+
+from robd2_core.o2_specs import O2_SPECS, AltitudeSpec, SpecTable
+
+TABLE = SpecTable()
+
+
+def test_lookup_snaps_to_the_spec_at_or_below():
+    assert TABLE.lookup(0) is O2_SPECS[0]
+    assert TABLE.lookup(4999) is O2_SPECS[0]
+    assert TABLE.lookup(5000) is O2_SPECS[1]
+    assert TABLE.lookup(33999.5) is O2_SPECS[-2]
+
+
+def test_lookup_edges():
+    assert TABLE.lookup(-1) is None
+    assert TABLE.lookup(34000) is O2_SPECS[-1]
+    assert TABLE.lookup(60000) is O2_SPECS[-1]
+
+
+def test_interpolated_edges():
+    assert TABLE.interpolated(-0.5) is None
+    assert TABLE.interpolated(0) is O2_SPECS[0]
+    assert TABLE.interpolated(34000) is O2_SPECS[-1]
+    assert TABLE.interpolated(60000) is O2_SPECS[-1]
+
+
+def test_interpolated_returns_table_rows_exactly():
+    for spec in O2_SPECS:
+        assert TABLE.interpolated(spec.altitude) is spec
+
+
+def test_interpolated_is_linear_between_rows():
+    low, high = O2_SPECS[1], O2_SPECS[2]
+    spec = TABLE.interpolated(7500)
+    assert spec.desired_o2 == pytest.approx((low.desired_o2 + high.desired_o2) / 2)
+    assert spec.range_min == pytest.approx((low.range_min + high.range_min) / 2)
+    assert spec.range_max == pytest.approx((low.range_max + high.range_max) / 2)
+
+
+def test_interpolated_rounds_to_the_grid_step():
+    assert TABLE.interpolated(7520).altitude == 7500
+    assert TABLE.interpolated(7530).altitude == 7550
+    # Just below the top row the grid never runs past the table
+    assert TABLE.interpolated(33990).altitude == 34000
+
+
+def test_get_selects_the_mode():
+    assert TABLE.get(7500) is O2_SPECS[1]
+    assert TABLE.get(7500, interpolate=True).altitude == 7500
+
+
+def test_single_row_table():
+    table = SpecTable([AltitudeSpec(1000, 20.0, 19.9, 20.1)])
+    assert table.lookup(999) is None
+    assert table.interpolated(999) is None
+    assert table.interpolated(5000).altitude == 1000
+
+
+def test_rejects_bad_tables():
+    with pytest.raises(ValueError):
+        SpecTable([])
+    with pytest.raises(ValueError):
+        SpecTable(grid_step=0)
@@ -0,0 +1,49 @@
+from robd2_core.performance_core import PerformanceEngine, SerialSource, SimulatedSource, Sink
+
+
+class _Samples(Sink):
+    def __init__(self):
+        self.samples = []
+
+    def on_sample(self, sample):
+        self.samples.append(sample)
+
+
+class _FakePort:
+    def __init__(self, raw):
+        self.raw = raw
+        self.timeout = 1.0
+
+    def readline(self):
+        return self.raw
+
+
+def test_read_line_replaces_undecodable_bytes():
+    source = SerialSource(_FakePort(b"12.5\xff,OK\r\n"))
+    assert source.read_line(timeout=0.1) == "12.5�,OK"
+
+
+def test_read_line_drops_truncated_line():
+    port = _FakePort(b"12.5,O")
+    assert SerialSource(port).read_line(timeout=0.1) is None
+    assert port.timeout == 1.0
+
+
+def test_noise_free_readings_are_kept_in_altitude_stats():
+    # A perfectly steady reading has zero spread and still belongs in the summary
+    engine = PerformanceEngine(SimulatedSource(altitudes=[0, 5000], dwell=60.0, tau=1e-6, noise=0.0))
+    engine.run()
+    results = engine.altitude_results[5000]
+    assert results['total_readings'] > 0
+    summary = results['stats'].mean()
+    assert summary['std_dev'] == 0.0
+    assert abs(summary['median'] - engine.get_spec(5000).desired_o2) < 1e-9
+
+
+def test_samples_carry_the_acquisition_time():
+    source = SimulatedSource(altitudes=[0], dwell=3.0)
+    collected = _Samples()
+    PerformanceEngine(source, sinks=[collected]).run()
+    samples = collected.samples
+    assert [s['t'] for s in samples] == sorted(s['t'] for s in samples)
+    assert samples[0]['t'] == source.step
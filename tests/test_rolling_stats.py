@@ -0,0 +1,64 @@
+import random
+import statistics
+
+import pytest
+
+from robd2_core.o2_specs import AltitudeSpec
+from robd2_core.rolling_stats import RollingStats, StatsAccumulator
+
+
+def _readings(n, seed=0):
+    rng = random.Random(seed)
+    return [20.9 + rng.gauss(0.0, 0.05) for _ in range(n)]
+
+
+def test_window_matches_statistics_module_as_samples_slide_out():
+    values = _readings(200)
+    stats = RollingStats(window=12)
+    for i, value in enumerate(values):
+        stats.push(value)
+        window = values[max(0, i - 11):i + 1]
+        assert stats.count == len(window)
+        assert stats.mean == pytest.approx(statistics.mean(window), abs=1e-12)
+        assert stats.median == pytest.approx(statistics.median(window), abs=1e-12)
+        if len(window) > 1:
+            assert stats.stdev == pytest.approx(statistics.stdev(window), abs=1e-9)
+
+
+def test_explicit_evict_matches_statistics_module():
+    values = _readings(50, seed=1)
+    stats = RollingStats.from_values(values)
+    for removed in range(len(values) - 2):
+        assert stats.evict() == values[removed]
+        remaining = values[removed + 1:]
+        assert stats.mean == pytest.approx(statistics.mean(remaining), abs=1e-12)
+        assert stats.stdev == pytest.approx(statistics.stdev(remaining), abs=1e-9)
+        assert stats.median == pytest.approx(statistics.median(remaining), abs=1e-12)
+
+
+def test_emptied_window_starts_over():
+    stats = RollingStats.from_values([1e6, 1e6 + 1.0])
+    while stats.evict() is not None:
+        pass
+    assert (stats.count, stats.mean, stats.variance) == (0, 0.0, 0.0)
+    stats.extend([1.0, 2.0, 3.0])
+    assert stats.mean == 2.0
+    assert stats.stdev == pytest.approx(1.0)
+
+
+def test_drift_and_stability_match_a_rescan():
+    values = _readings(13, seed=2)
+    spec = AltitudeSpec(0, 20.9, 20.85, 20.95)
+    stats = RollingStats.from_values(values, window=12).statistics(spec)
+    window = values[-12:]
+    assert stats['drift'] == pytest.approx(statistics.mean(window[-4:]) - statistics.mean(window[:4]))
+    in_range = sum(spec.range_min <= v <= spec.range_max for v in window)
+    assert stats['stability'] == pytest.approx(in_range / 12 * 100)
+
+
+def test_accumulator_averages_every_key():
+    accumulator = StatsAccumulator()
+    assert accumulator.mean() == {}
+    accumulator.add({'mean': 1.0, 'sem': 0.0})
+    accumulator.add({'mean': 3.0, 'sem': 0.5})
+    assert accumulator.mean() == {'mean': 2.0, 'sem': 0.25}
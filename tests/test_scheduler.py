@@ -0,0 +1,71 @@
+import pytest
+
+from robd2_core import scheduler as scheduler_module
+from robd2_core.scheduler import FixedRateScheduler
+
+
+class _Clock:
+    """Virtual monotonic clock; waiting on the stop event advances it."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.stopped = False
+
+    def monotonic(self):
+        return self.now
+
+    def wait(self, delay):
+        self.now += delay
+        return self.stopped
+
+    def is_set(self):
+        return self.stopped
+
+    def set(self):
+        self.stopped = True
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(scheduler_module.time, "monotonic", clock.monotonic)
+    return clock
+
+
+def test_ticks_run_on_fixed_deadlines(clock):
+    scheduler = FixedRateScheduler(1.0, stop_event=clock)
+    ticks = []
+    for _ in range(4):
+        assert scheduler.wait()
+        ticks.append(clock.now)
+        clock.now += 0.3  # work inside the period does not shift later ticks
+    assert ticks == [100.0, 101.0, 102.0, 103.0]
+    assert scheduler.missed == 0
+
+
+def test_overrun_skips_whole_missed_slots(clock):
+    scheduler = FixedRateScheduler(1.0, stop_event=clock)
+    assert scheduler.wait()
+    clock.now += 3.5  # the loop body ran past the slots at 101 and 102
+    assert scheduler.wait()
+    assert scheduler.missed == 2
+    assert clock.now == 103.5  # the 103 slot fires late instead of three ticks back to back
+    assert scheduler.wait()
+    assert clock.now == 104.0
+    assert scheduler.ticks == 3
+
+
+def test_overrun_shorter_than_a_period_fires_late_without_skipping(clock):
+    scheduler = FixedRateScheduler(1.0, stop_event=clock)
+    assert scheduler.wait()
+    clock.now += 1.4
+    assert scheduler.wait()
+    assert scheduler.missed == 0
+    assert scheduler.stats()['jitter_max_ms'] == pytest.approx(400.0)
+
+
+def test_wait_returns_false_once_stopped(clock):
+    scheduler = FixedRateScheduler(1.0, stop_event=clock)
+    assert scheduler.wait()
+    scheduler.stop()
+    assert not scheduler.wait()
@@ -0,0 +1,84 @@
+import math
+
+import pytest
+
+from robd2_core.sequential_test import SequentialTest
+
+
+def _feed(test, outcomes, altitude=5000, confident=False):
+    """Feed outcomes until a verdict; returns (verdict, readings fed)."""
+    for i, status in enumerate(outcomes, start=1):
+        verdict = test.update(altitude, status, confident)
+        if verdict:
+            return verdict, i
+    return None, len(outcomes)
+
+
+def test_pass_on_the_reading_that_crosses_the_upper_boundary():
+    test = SequentialTest(stride=1)
+    needed = math.ceil(test.upper / math.log(0.95 / 0.6))
+    verdict, fed = _feed(test, ["PASS"] * 20)
+    assert fed == needed
+    assert verdict.status == "PASS"
+    assert verdict.llr >= test.upper
+    assert verdict.reason == "evidence threshold reached"
+
+
+def test_one_review_costs_more_passes_than_it_replaces():
+    test = SequentialTest(stride=1)
+    verdict, fed = _feed(test, ["REVIEW"] + ["PASS"] * 30)
+    # ln(0.05 / 0.4) has to be paid back at ln(0.95 / 0.6) per pass
+    needed = math.ceil((test.upper - math.log(0.05 / 0.4)) / math.log(0.95 / 0.6))
+    assert needed > math.ceil(test.upper / math.log(0.95 / 0.6)) + 1
+    assert (verdict.status, fed) == ("PASS", 1 + needed)
+
+
+def test_review_once_the_lower_boundary_is_crossed():
+    test = SequentialTest(stride=1)
+    assert test.update(5000, "REVIEW") is None  # one failure is not yet below ln(beta / (1 - alpha))
+    verdict = test.update(5000, "REVIEW")
+    assert verdict.status == "REVIEW"
+    assert verdict.llr <= test.lower
+    assert (verdict.readings, verdict.passes) == (2, 0)
+
+
+def test_stride_counts_every_other_reading():
+    test = SequentialTest(stride=2)
+    verdict, fed = _feed(test, ["PASS", "REVIEW"] * 20)
+    # The REVIEW readings all fall between the counted ones
+    assert verdict.status == "PASS"
+    assert fed == 2 * 7 - 1
+    assert verdict.passes == verdict.readings == 7
+
+
+def test_reading_limit_falls_back_to_the_pass_count():
+    test = SequentialTest(stride=1, max_readings=6, p_good=0.9, p_bad=0.8)
+    verdict, fed = _feed(test, ["PASS", "PASS", "PASS", "REVIEW", "PASS", "REVIEW"])
+    assert fed == 6
+    assert (verdict.status, verdict.reason) == ("PASS", "reading limit reached")
+
+
+def test_confident_streak_decides_early_but_needs_min_passes():
+    test = SequentialTest()
+    verdict, fed = _feed(test, ["PASS"] * 10, confident=True)
+    assert (verdict.status, fed) == ("PASS", 3)
+    assert verdict.reason == "filtered estimate confident"
+
+    test = SequentialTest()
+    verdict, fed = _feed(test, ["REVIEW"] * 10, confident=True)
+    assert verdict.status == "REVIEW"
+    assert fed <= 3
+
+
+def test_altitude_is_decided_only_once_until_reset():
+    test = SequentialTest(stride=1)
+    _feed(test, ["REVIEW", "REVIEW"])
+    assert test.update(5000, "PASS") is None
+    assert test.verdict(5000).status == "REVIEW"
+    test.reset(5000)
+    assert test.verdict(5000) is None
+
+
+def test_rejects_inverted_rates():
+    with pytest.raises(ValueError):
+        SequentialTest(p_good=0.6, p_bad=0.95)
@@ -0,0 +1,67 @@
+import math
+import random
+
+import pytest
+
+from robd2_core.o2_specs import SPEC_TABLE
+from robd2_core.settling import SettlingDetector
+
+SPEC = SPEC_TABLE.lookup(10000)
+START_O2 = SPEC_TABLE.lookup(5000).desired_o2
+TAU = 3.0
+INTERVAL = 0.3
+
+
+def _first_order(t):
+    return SPEC.desired_o2 + (START_O2 - SPEC.desired_o2) * math.exp(-t / TAU)
+
+
+def _settle(detector, signal, seed=None, seconds=30.0):
+    """Feed ``signal(t)`` (plus optional noise) until settled; return the settling time."""
+    rng = random.Random(seed)
+    detector.start_step(0.0)
+    for i in range(1, int(seconds / INTERVAL) + 1):
+        t = i * INTERVAL
+        noise = rng.gauss(0.0, 0.02) if seed is not None else 0.0
+        if detector.update(signal(t) + noise, SPEC, t):
+            return t
+    return None
+
+
+@pytest.mark.parametrize("seed", [None, 0, 1, 2])
+def test_first_order_step_settles_close_to_the_setpoint(seed):
+    detector = SettlingDetector(max_seconds=25)
+    settled_at = _settle(detector, _first_order, seed)
+    assert settled_at is not None and not detector.settled_by_cap
+    half_width = (SPEC.range_max - SPEC.range_min) / 2
+    # Inside the band is not enough: the response must have mostly closed in
+    assert abs(_first_order(settled_at) - SPEC.desired_o2) <= 0.25 * half_width
+    assert detector.saved_seconds() == pytest.approx(25 - settled_at)
+
+
+def test_single_window_settles_while_still_converging():
+    early = _settle(SettlingDetector(max_seconds=25, confirm_windows=1), _first_order)
+    confirmed = _settle(SettlingDetector(max_seconds=25), _first_order)
+    assert early < confirmed
+    half_width = (SPEC.range_max - SPEC.range_min) / 2
+    assert abs(_first_order(early) - SPEC.desired_o2) > 0.25 * half_width
+
+
+def test_steady_signal_settles_after_the_confirming_window():
+    detector = SettlingDetector(window=8, min_seconds=2.0, max_seconds=25)
+    settled_at = _settle(detector, lambda t: SPEC.desired_o2)
+    # 8 samples fill the first window, 8 more confirm it
+    assert settled_at == pytest.approx(16 * INTERVAL)
+
+
+def test_out_of_band_signal_settles_only_at_the_cap():
+    detector = SettlingDetector(max_seconds=25)
+    settled_at = _settle(detector, lambda t: SPEC.range_max + 0.1)
+    assert detector.settled_by_cap
+    assert settled_at == pytest.approx(25.0, abs=INTERVAL)
+    assert detector.saved_seconds() == pytest.approx(0.0, abs=INTERVAL)
+
+
+def test_rejects_invalid_confirm_windows():
+    with pytest.raises(ValueError):
+        SettlingDetector(confirm_windows=0)
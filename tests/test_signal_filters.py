@@ -0,0 +1,57 @@
+import math
+
+import numpy as np
+import pytest
+
+from robd2_core.signal_filters import median_filter, moving_average
+
+
+def _reference_average(values, window):
+    out = []
+    for i in range(len(values)):
+        valid = [v for v in values[max(0, i - window + 1) : i + 1] if not math.isnan(v)]
+        out.append(sum(valid) / len(valid) if valid else math.nan)
+    return out
+
+
+def _reference_median(values, window):
+    return [float(np.median(values[max(0, i - window + 1) : i + 1])) for i in range(len(values))]
+
+
+def test_moving_average_matches_shrinking_window_loop():
+    values = list(np.random.default_rng(0).normal(20.0, 1.0, 50))
+    assert np.allclose(moving_average(values, 7), _reference_average(values, 7))
+
+
+def test_moving_average_skips_gaps_instead_of_propagating_them():
+    values = [1.0, 2.0, math.nan, 4.0, 5.0, 6.0]
+    smoothed = moving_average(values, 3)
+    assert smoothed == pytest.approx([1.0, 1.5, 1.5, 3.0, 4.5, 5.0])
+    assert np.allclose(smoothed, _reference_average(values, 3))
+
+
+def test_moving_average_is_nan_only_where_the_whole_window_is_missing():
+    values = [1.0, math.nan, math.nan, math.nan, 5.0]
+    smoothed = moving_average(values, 2)
+    assert smoothed[0] == 1.0 and smoothed[1] == 1.0
+    assert math.isnan(smoothed[2]) and math.isnan(smoothed[3])
+    assert smoothed[4] == 5.0
+
+
+def test_median_filter_head_matches_growing_window_median():
+    values = list(np.random.default_rng(1).normal(20.0, 1.0, 40))
+    for window in (2, 5, 20):
+        assert np.allclose(median_filter(values, window), _reference_median(values, window))
+
+
+def test_median_filter_window_longer_than_series():
+    values = [3.0, 1.0, 2.0]
+    assert np.allclose(median_filter(values, 10), [3.0, 2.0, 2.0])
+
+
+def test_median_filter_propagates_nan_like_np_median():
+    values = [1.0, 2.0, math.nan, 4.0, 5.0, 6.0, 7.0]
+    filtered = median_filter(values, 3)
+    assert filtered[:2] == pytest.approx([1.0, 1.5])
+    assert all(math.isnan(v) for v in filtered[2:5])
+    assert filtered[5:] == pytest.approx([5.0, 6.0])
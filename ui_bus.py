@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import logging
+import threading
+import tkinter as tk
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, List
+
+log = logging.getLogger("robd2_gui")
+
+
+class UIUpdateBus:
+    """
+    Frame-rate-limited hand-off from producer threads to Tk widgets.
+
+    Producers call ``post`` (latest value wins, for state such as a title or
+    progress value) or ``append`` (every item kept, for log lines or samples)
+    at any rate and from any thread. The Tk thread flushes the bus ``fps``
+    times per second and calls each subscribed handler once per frame:
+    ``post`` handlers get the newest value, ``append`` handlers the list of
+    items queued since the previous frame. Producers never touch widgets
+    and never schedule one ``after`` callback per message.
+    """
+
+    def __init__(self, widget: tk.Misc, fps: float = 15.0, max_pending: int = 5000):
+        if fps <= 0:
+            raise ValueError("fps must be > 0")
+        self.widget = widget
+        self.interval_ms = max(1, int(1000 / fps))
+        self._lock = threading.Lock()
+        self._latest: Dict[str, Any] = {}
+        self._streams: Dict[str, deque] = {}
+        self._max_pending = max_pending
+        self._handlers: Dict[str, Callable] = {}
+        self._after_id = None
+
+    def subscribe(self, key: str, handler: Callable) -> None:
+        self._handlers[key] = handler
+
+    # ---------- producers (any thread) ----------
+    def post(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._latest[key] = value
+
+    def append(self, key: str, item: Any) -> None:
+        with self._lock:
+            stream = self._streams.get(key)
+            if stream is None:
+                # A stalled UI drops the oldest items rather than growing without bound
+                stream = self._streams[key] = deque(maxlen=self._max_pending)
+            stream.append(item)
+
+    def feed(self, key: str) -> "BusFeed":
+        """List-like ``append`` target that forwards into the ``key`` stream."""
+        return BusFeed(self, key)
+
+    # ---------- Tk thread ----------
+    def start(self) -> None:
+        if self._after_id is None:
+            self._after_id = self.widget.after(self.interval_ms, self._tick)
+
+    def stop(self) -> None:
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def flush(self) -> None:
+        with self._lock:
+            latest, self._latest = self._latest, {}
+            streams = {key: list(items) for key, items in self._streams.items() if items}
+            for key in streams:
+                self._streams[key].clear()
+        for key, items in streams.items():
+            self._dispatch(key, items)
+        for key, value in latest.items():
+            self._dispatch(key, value)
+
+    def _dispatch(self, key: str, value: Any) -> None:
+        handler = self._handlers.get(key)
+        if handler is None:
+            return
+        try:
+            handler(value)
+        except Exception as e:
+            log.error(f"UI update '{key}' failed: {e}", exc_info=True)
+
+    def _tick(self) -> None:
+        self.flush()
+        self._after_id = self.widget.after(self.interval_ms, self._tick)
+
+
+class BusFeed:
+    """Drop-in for a ``communications`` list: ``append`` posts to a bus stream."""
+
+    def __init__(self, bus: UIUpdateBus, key: str):
+        self.bus = bus
+        self.key = key
+
+    def append(self, item: Any) -> None:
+        self.bus.append(self.key, item)
+
+
+class RingTextView:
+    """
+    Append-only view over a ``tk.Text`` that keeps at most ``max_lines`` lines.
+
+    Lines are counted as they are inserted, so trimming deletes the excess
+    from the top in one call instead of reading the whole widget back.
+    """
+
+    def __init__(self, text: tk.Text, max_lines: int = 50, autoscroll: bool = True):
+        if max_lines <= 0:
+            raise ValueError("max_lines must be > 0")
+        self.text = text
+        self.max_lines = max_lines
+        self.autoscroll = autoscroll
+        self._lines = 0
+
+    def append(self, line: str, *tags: str) -> None:
+        self.extend([line], *tags)
+
+    def extend(self, lines: Iterable[str], *tags: str) -> None:
+        lines: List[str] = [line if line.endswith("\n") else f"{line}\n" for line in lines]
+        if not lines:
+            return
+        self.text.insert(tk.END, "".join(lines), tags)
+        self._lines += sum(line.count("\n") for line in lines)
+        excess = self._lines - self.max_lines
+        if excess > 0:
+            self.text.delete("1.0", f"{excess + 1}.0")
+            self._lines -= excess
+        if self.autoscroll:
+            self.text.see(tk.END)
+
+    def clear(self) -> None:
+        self.text.delete("1.0", tk.END)
+        self._lines = 0